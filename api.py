@@ -0,0 +1,223 @@
+import argparse
+import json
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import metrics
+from keyword_data import CSV_PATH, KeywordTable
+from keyword_service import KeywordDataService
+from skill_details import DETAIL_MAP
+
+# === 0. 기본 설정 ===
+DEFAULT_K = 10
+MAX_K = 1000
+RESPONSE_CACHE_SIZE = 4096
+
+
+class HTTPError(Exception):
+    def __init__(self, status: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# === 1. WSGI 앱 ===
+class KeywordAPI:
+    """
+    app.py / backend.py와 같은 데이터 서비스(KeywordDataService)를 쓰는 JSON 조회 API.
+
+    GET /categories                          직무 목록
+    GET /categories/<직무>/keywords?k=&offset=  직무별 상위 키워드
+    GET /skills/<요구 역량>                    세부 역량(DETAIL_MAP)
+    GET /metrics                             구간별 시간 히스토그램 (Prometheus 텍스트)
+
+    응답 본문은 (데이터 버전, 경로, 쿼리) 기준으로 캐시하고, ETag는 데이터 버전을 쓴다.
+    CSV가 바뀌면 서비스가 백그라운드에서 테이블을 교체하고, 데이터 버전이 달라지면 캐시를 통째로 비운다.
+    교체 전 테이블로 만들던 응답이 교체 뒤에 끝나도 현재 버전 캐시에는 들어가지 않는다.
+    """
+
+    def __init__(self, csv_path: str = CSV_PATH, detail_map: dict = DETAIL_MAP):
+        self.csv_path = csv_path
+        self.detail_map = detail_map
+        self._lock = threading.Lock()
+        self._service = None
+        self._cache_lock = threading.Lock()  # 응답 캐시(OrderedDict)를 읽고 쓸 때는 항상 이 잠금 안에서
+        self._cache_version = None
+        self._cache = OrderedDict()
+
+    # --- 데이터 ---
+    def table(self) -> KeywordTable:
+        if self._service is None:
+            with self._lock:
+                if self._service is None:
+                    self._service = KeywordDataService(self.csv_path)
+        table = self._service.table()
+        if table.version != self._cache_version:
+            with self._cache_lock:
+                if table.version != self._cache_version:
+                    self._cache.clear()
+                    self._cache_version = table.version
+        return table
+
+    def _cached_response(self, key: tuple):
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+
+    def _store_response(self, key: tuple, response: tuple):
+        with self._cache_lock:
+            # key[0] = 응답을 만든 테이블의 버전. 그사이 교체되었으면 넣지 않는다
+            if key[0] != self._cache_version:
+                return
+            self._cache[key] = response
+            if len(self._cache) > RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    # --- 엔드포인트 ---
+    def get_categories(self, table: KeywordTable, query: dict) -> dict:
+        return {
+            "version": table.version,
+            "categories": [
+                {"name": c, "total_posts": table.total_posts(c)}
+                for c in table.categories
+            ],
+        }
+
+    def get_keywords(self, table: KeywordTable, category: str, query: dict) -> dict:
+        if category not in table.versions:
+            raise HTTPError("404 Not Found", f"없는 직무입니다: {category}")
+        k = _int_param(query, "k", DEFAULT_K, 1, MAX_K)
+        offset = _int_param(query, "offset", 0, 0, None)
+
+        page = table.top_k(category, k, offset)
+        keywords = [
+            {"rank": int(r), "word": w, "count": int(c), "ratio": float(p)}
+            for r, w, c, p in zip(
+                page["rank"].tolist(),
+                page["word"].tolist(),
+                page["count"].tolist(),
+                page["ratio"].tolist(),
+            )
+        ]
+        return {
+            "version": table.version,
+            "category": category,
+            "total_posts": table.total_posts(category),
+            "total_keywords": table.n_keywords(category),
+            "offset": offset,
+            "keywords": keywords,
+        }
+
+    def get_skill(self, table: KeywordTable, skill: str, query: dict) -> dict:
+        details = self.detail_map.get(skill)
+        if details is None:
+            raise HTTPError("404 Not Found", f"세부 역량 정보가 없습니다: {skill}")
+        return {"skill": skill, "details": list(details)}
+
+    def route(self, table: KeywordTable, path: str, query: dict) -> dict:
+        parts = [p for p in path.split("/") if p]
+        if parts == ["categories"]:
+            return self.get_categories(table, query)
+        if len(parts) == 3 and parts[0] == "categories" and parts[2] == "keywords":
+            return self.get_keywords(table, parts[1], query)
+        if len(parts) == 2 and parts[0] == "skills":
+            return self.get_skill(table, parts[1], query)
+        raise HTTPError("404 Not Found", f"없는 경로입니다: {path}")
+
+    # --- WSGI ---
+    def __call__(self, environ, start_response):
+        if environ.get("REQUEST_METHOD", "GET") not in ("GET", "HEAD"):
+            return self._respond(start_response, "405 Method Not Allowed",
+                                 _json_bytes({"error": "GET만 지원합니다."}), None)
+        try:
+            table = self.table()
+        except (FileNotFoundError, KeyError) as e:
+            return self._respond(start_response, "503 Service Unavailable",
+                                 _json_bytes({"error": str(e)}), None)
+
+        # PEP 3333: PATH_INFO는 latin-1로 풀린 바이트 → UTF-8로 다시 해석
+        path = environ.get("PATH_INFO", "").encode("latin-1").decode("utf-8", "replace")
+        if path == "/metrics":
+            body = metrics.render_prometheus().encode("utf-8")
+            start_response("200 OK", [
+                ("Content-Type", "text/plain; version=0.0.4; charset=utf-8"),
+                ("Content-Length", str(len(body))),
+            ])
+            return [body]
+        query_string = environ.get("QUERY_STRING", "")
+        etag = f'"{table.version}"'
+
+        key = (table.version, path, query_string)
+        cached = self._cached_response(key)
+        if cached is None:
+            metrics.count("api_response_cache_miss")
+            try:
+                with metrics.timer("api_route"):
+                    cached = ("200 OK", _json_bytes(self.route(table, path, parse_qs(query_string))))
+            except HTTPError as e:
+                cached = (e.status, _json_bytes({"error": e.message}))
+            self._store_response(key, cached)
+
+        status, body = cached
+        # 경로가 맞는(200) 응답에만 304 — 없는 경로나 잘못된 요청은 ETag가 같아도 오류를 그대로 돌려준다
+        if status == "200 OK" and environ.get("HTTP_IF_NONE_MATCH") == etag:
+            return self._respond(start_response, "304 Not Modified", b"", etag)
+        return self._respond(start_response, status, body, etag if status == "200 OK" else None,
+                             head=environ.get("REQUEST_METHOD") == "HEAD")
+
+    @staticmethod
+    def _respond(start_response, status, body, etag, head=False):
+        headers = [
+            ("Content-Type", "application/json; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+            ("Cache-Control", "no-cache"),
+        ]
+        if etag:
+            headers.append(("ETag", etag))
+        start_response(status, headers)
+        return [] if head else [body]
+
+
+def _json_bytes(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _int_param(query: dict, name: str, default: int, lo: int, hi):
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise HTTPError("400 Bad Request", f"{name} 값은 정수여야 합니다.")
+    if value < lo or (hi is not None and value > hi):
+        raise HTTPError("400 Bad Request", f"{name} 값의 범위를 벗어났습니다.")
+    return value
+
+
+# === 2. 실행 ===
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="직무별 AI 역량 키워드 JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--csv", default=CSV_PATH)
+    args = parser.parse_args(argv)
+
+    app = KeywordAPI(csv_path=args.csv)
+    app.table()  # 첫 요청 전에 미리 로드
+    with make_server(args.host, args.port, app, handler_class=_QuietHandler) as server:
+        print(f"✅ http://{args.host}:{args.port}/categories")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
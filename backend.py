@@ -1,57 +1,145 @@
-import os
 import pandas as pd
 import streamlit as st
 
-# === 0. 경로/파일 설정 ===
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CSV_NAME = "직무별_단순빈도_TOP10(final).csv"
-CSV_PATH = os.path.join(BASE_DIR, CSV_NAME)
+import metrics
+from data_service import get_data_service, get_keyword_ranking, get_raw_view, get_search_index, get_trend_table
+from keyword_data import CSV_PATH, KeywordTable, source_stamp
+from ranking import DEFAULT_RANKING, RANKINGS
+from raw_view import DEFAULT_PAGE_SIZE, PAGE_SIZES
+from trends import TREND_METRICS, TRENDS_PATH
+
+# 슬라이더로 고를 수 있는 k 상한
+MAX_TOP_K = 1000
+# 직무 검색 결과 상한
+MAX_SEARCH_RESULTS = 200
 
 
 # === 1. 데이터 로드 함수 ===
-@st.cache_data
-def load_keyword_data():
+def load_keyword_data() -> KeywordTable:
     """
-    직무별_단순빈도_TOP10(final).csv 파일을 읽어서 DataFrame으로 반환.
-    인코딩 문제 대비: utf-8-sig → cp949 순으로 시도.
+    직무별_단순빈도_TOP10(final).csv 파일(또는 옆의 Feather 캐시)로 만든 category 인덱스를
+    app.py와 같은 프로세스 공유 서비스에서 받아 온다 (복사 없음).
+    CSV가 바뀌면 서비스가 백그라운드에서 다시 읽어 교체하므로 여기서는 기다리지 않는다.
     필수 컬럼: category, word, count, total_posts
     """
-    if not os.path.exists(CSV_PATH):
-        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {CSV_PATH}")
+    return get_data_service(CSV_PATH).table()
+
+
+def get_categories(table: KeywordTable):
+    """
+    category 컬럼에서 선택 가능한 직무 목록 가져오기.
+    """
+    return table.categories
 
-    try:
-        df = pd.read_csv(CSV_PATH, encoding="utf-8-sig")
-    except UnicodeDecodeError:
-        df = pd.read_csv(CSV_PATH, encoding="cp949")
 
-    # 필요한 컬럼이 있는지 확인
-    required_cols = {"category", "word", "count", "total_posts"}
-    missing = required_cols - set(df.columns)
-    if missing:
-        raise KeyError(f"다음 컬럼이 CSV에 없습니다: {missing}")
+def search_categories(table: KeywordTable, query: str) -> list:
+    """
+    직무 이름 검색 (접두어/부분 문자열/초성). 자모 n-gram 색인을 쓰므로 직무가 수천 개여도 빠르다.
+    """
+    index = get_search_index(table, table.version)
+    with metrics.timer("search"):
+        hits = index.search(query, MAX_SEARCH_RESULTS, kinds=("category",))
+    return [hit.text for hit in hits]
 
-    return df
 
+def filter_by_category(table: KeywordTable, category_value: str,
+                       k: int = None, offset: int = 0,
+                       ranking: str = DEFAULT_RANKING) -> pd.DataFrame:
+    """
+    선택한 category(직무)의 행을 인덱스에서 바로 꺼내기.
+    count 기준 내림차순 정렬과 ratio 컬럼(count/total_posts)은 인덱스 생성 시 계산됨.
+    k를 주면 [offset, offset + k) 순위 구간만 반환.
+    ranking이 특징 단어순(tfidf / log_odds)이면 미리 계산해 둔 점수 순서로 꺼내고 score 컬럼이 붙는다.
+    """
+    if ranking != DEFAULT_RANKING:
+        ranked = get_keyword_ranking(table, table.version, ranking)
+        return ranked.top_k(category_value, ranked.n_keywords(category_value) if k is None else k, offset)
+    if k is None:
+        return table.rows(category_value)
+    return table.top_k(category_value, k, offset)
 
-def get_categories(df: pd.DataFrame):
+
+def select_page(n_keywords: int, default_k: int = 10):
     """
-    category 컬럼에서 선택 가능한 직무 목록 가져오기.
+    k 슬라이더와 페이지 번호 입력으로 (k, offset)을 정한다.
     """
-    return sorted(df["category"].dropna().unique().tolist())
+    if n_keywords <= 1:
+        return n_keywords, 0
+
+    k = st.slider(
+        "한 번에 볼 키워드 수 (k)",
+        min_value=1,
+        max_value=min(MAX_TOP_K, n_keywords),
+        value=min(default_k, n_keywords),
+    )
+    n_pages = -(-n_keywords // k)
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(
+            f"페이지 (총 {n_pages}쪽)",
+            min_value=1,
+            max_value=n_pages,
+            value=1,
+            step=1,
+            key="keyword_page",
+        )
+    return k, (int(page) - 1) * k
 
 
-def filter_by_category(df: pd.DataFrame, category_value: str):
+# 원본 보기 위젯만 다시 실행되도록 fragment 로 둔다 (페이지를 넘겨도 위쪽 차트는 다시 그리지 않음)
+@st.fragment
+def raw_data_viewer(table: KeywordTable):
     """
-    선택한 category(직무) 기준으로 데이터 필터링.
-    count 기준 내림차순 정렬하고, ratio 컬럼(count/total_posts) 추가.
+    원본 데이터를 서버에서 검색/정렬한 뒤 한 페이지만 보여 준다.
+    전체 표를 브라우저로 보내지 않으므로 행이 아무리 많아도 페이지마다 보내는 양이 같다.
     """
-    filtered = df[df["category"] == category_value].copy()
-    filtered = filtered.sort_values("count", ascending=False).reset_index(drop=True)
+    view = get_raw_view(table, table.version)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        category_value = st.selectbox(
+            "직무",
+            options=[None] + list(table.categories),
+            format_func=lambda c: "전체" if c is None else c,
+            key="raw_view_category",
+        )
+    with col2:
+        text = st.text_input("요구 역량 검색", key="raw_view_text")
+
+    col3, col4, col5 = st.columns(3)
+    with col3:
+        sort_by = st.selectbox(
+            "정렬 컬럼",
+            options=[None] + view.columns,
+            format_func=lambda c: "원래 순서" if c is None else c,
+            key="raw_view_sort_by",
+        )
+    with col4:
+        descending = st.checkbox("내림차순", value=True, key="raw_view_descending")
+    with col5:
+        page_size = st.selectbox(
+            "한 페이지 행 수",
+            options=PAGE_SIZES,
+            index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE),
+            key="raw_view_page_size",
+        )
 
-    if "total_posts" in filtered.columns:
-        filtered["ratio"] = filtered["count"] / filtered["total_posts"]
+    with metrics.timer("raw_view_page"):
+        n_rows = view.count(category_value, text)
+        n_pages = max(1, -(-n_rows // page_size))
+        page = 1
+        if n_pages > 1:
+            page = st.number_input(
+                f"페이지 (총 {n_pages}쪽)", min_value=1, max_value=n_pages, value=1, step=1, key="raw_view_page"
+            )
+        offset = (int(page) - 1) * page_size
+        page_df, _ = view.page(category_value, text, sort_by, descending, offset, page_size)
 
-    return filtered
+    if n_rows == 0:
+        st.caption("조건에 맞는 행이 없습니다.")
+        return
+    st.caption(f"총 {n_rows:,}행 중 {offset + 1:,}~{offset + len(page_df):,}행")
+    st.dataframe(page_df, use_container_width=True, hide_index=True)
 
 
 # === 2. Streamlit 메인 앱 ===
@@ -65,7 +153,8 @@ def main():
 
     # 데이터 로드
     try:
-        df = load_keyword_data()
+        with metrics.timer("load_keyword_data"):
+            table = load_keyword_data()
     except FileNotFoundError as e:
         st.error(f"❌ 데이터 파일을 찾을 수 없습니다.\n\n{e}")
         st.stop()
@@ -76,16 +165,24 @@ def main():
         st.error(f"❌ 데이터를 불러오는 중 오류가 발생했습니다.\n\n{e}")
         st.stop()
 
-    st.caption("현재 CSV 컬럼: " + ", ".join(df.columns.astype(str)))
+    st.caption("현재 CSV 컬럼: " + ", ".join(map(str, table.columns)))
 
     # 직무 선택
     st.subheader("1️⃣ 관심 있는 직무 선택")
 
-    categories = get_categories(df)
+    categories = get_categories(table)
     if not categories:
         st.error("category 컬럼에 값이 없습니다. CSV 데이터를 확인해 주세요.")
         st.stop()
 
+    query = st.text_input("직무 검색 (초성 검색 가능: ㄷㅇㅌ)")
+    if query.strip():
+        matched = search_categories(table, query)
+        if matched:
+            categories = matched
+        else:
+            st.caption("검색어와 일치하는 직무가 없어 전체 직무를 보여 줍니다.")
+
     selected_category = st.selectbox(
         "관심 있는 직무(분야)를 선택하세요:",
         options=categories,
@@ -94,34 +191,71 @@ def main():
 
     st.write(f"### 선택한 분야: **{selected_category}**")
 
-    # 필터링
-    filtered_df = filter_by_category(df, selected_category)
-
     st.subheader("2️⃣ 선택한 분야 상위 키워드")
 
-    if filtered_df.empty:
+    n_keywords = table.n_keywords(selected_category)
+    if n_keywords == 0:
         st.warning("해당 분야에 대한 데이터가 없습니다. CSV 내용을 다시 확인해 주세요.")
     else:
-        view_cols = ["word", "count", "total_posts"]
-        if "ratio" in filtered_df.columns:
-            view_cols.append("ratio")
-
-        st.dataframe(
-            filtered_df[view_cols],
-            use_container_width=True,
+        st.caption(f"전체 키워드 수: {n_keywords}")
+        ranking = st.radio(
+            "정렬 기준",
+            options=list(RANKINGS),
+            format_func=RANKINGS.get,
+            horizontal=True,
         )
+        k, offset = select_page(n_keywords)
+
+        # 필터링 (정렬된 인덱스에서 필요한 순위 구간만)
+        with metrics.timer("filter_by_category"):
+            filtered_df = filter_by_category(table, selected_category, k, offset, ranking)
+
+        view_cols = ["word", "count", "total_posts", "ratio"]
+        if ranking != DEFAULT_RANKING:
+            view_cols.append("score")
+        with metrics.timer("render_table"):
+            st.dataframe(
+                filtered_df.set_index("rank")[view_cols],
+                use_container_width=True,
+            )
+
+        # 현재 페이지 막대그래프
+        first, last = offset + 1, offset + len(filtered_df)
+        st.subheader(f"3️⃣ 키워드 빈도 시각화 ({first}~{last}위)")
+
+        chart_df = filtered_df[["word", "count"]].set_index("word")
 
-        # 상위 10개 막대그래프
-        st.subheader("3️⃣ 키워드 빈도 시각화 (상위 10개)")
+        with metrics.timer("render_chart"):
+            st.bar_chart(chart_df)
 
-        top_n = min(10, len(filtered_df))
-        chart_df = filtered_df.head(top_n)[["word", "count"]].set_index("word")
+        # 월별 추세 (수집할 때 미리 계산해 둔 값을 잘라 오기만 한다)
+        trends = get_trend_table(TRENDS_PATH, source_stamp(TRENDS_PATH))
+        if trends is not None:
+            st.subheader(f"4️⃣ 키워드 추세 ({first}~{last}위)")
+            metric = st.radio(
+                "추세 지표",
+                options=list(TREND_METRICS),
+                format_func=TREND_METRICS.get,
+                horizontal=True,
+            )
+            words = filtered_df["word"].astype(str).tolist()
+            with metrics.timer("render_trend"):
+                series = trends.series(selected_category, words, metric)
+                if series.empty:
+                    st.caption("이 분야 키워드의 추세 데이터가 없습니다.")
+                else:
+                    st.line_chart(series)
 
-        st.bar_chart(chart_df)
+            rising = trends.latest_growth(selected_category, words).head(3)
+            if len(rising):
+                st.caption(
+                    f"최근 {trends.window}개월 증가율 상위: "
+                    + ", ".join(f"{w} {g:+.0%}" for w, g in rising.items())
+                )
 
     # 원본 전체 보기
     with st.expander("📂 원본 데이터 전체 보기"):
-        st.dataframe(df, use_container_width=True)
+        raw_data_viewer(table)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,276 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+import keyword_data
+from keyword_data import (
+    build_category_index,
+    compact_keyword_frame,
+    load_keyword_frame,
+    read_keyword_csv,
+)
+from keyword_shards import SHARD_CACHE_SIZE, ShardedKeywordTable, read_manifest, write_shards
+from ranking import RANKINGS
+
+# === 0. 기본 설정 ===
+# (행 수, 직무 수) 프리셋. 10M 행은 --sizes 로 직접 지정해서 돌린다.
+DEFAULT_SIZES = [(200, 10), (100_000, 1_000), (1_000_000, 1_000)]
+DEFAULT_REPEAT = 5
+DEFAULT_LOOKUPS = 200
+APPTEST_RERUNS = 10
+APPTEST_MAX_ROWS = 1_000_000  # 이보다 큰 데이터는 Streamlit 페이지 측정을 건너뛴다
+
+
+# === 1. 합성 데이터 ===
+def make_synthetic_table(n_rows: int, n_categories: int, seed: int = 0) -> pd.DataFrame:
+    """
+    CSV와 같은 스키마(category, word, count, total_posts)의 합성 테이블.
+    직무마다 n_rows / n_categories 개의 서로 다른 단어를 갖고, count는 멱법칙 분포.
+    """
+    rng = np.random.default_rng(seed)
+    per = max(1, n_rows // n_categories)
+    vocab = max(1_000, per * 2 + 1)
+
+    start = rng.integers(0, vocab, n_categories)[:, None]
+    word_ids = (start + np.arange(per)[None, :]) % vocab  # 직무 안에서 중복 없음
+    counts = np.maximum(1, (1_000 / (1 + rng.pareto(1.2, (n_categories, per))))).astype(np.int64)
+    total_posts = rng.integers(500, 50_000, n_categories)
+
+    categories = np.array([f"직무{i:05d}" for i in range(n_categories)], dtype=object)
+    words = np.array([f"역량{i:06d}" for i in range(vocab)], dtype=object)
+    return pd.DataFrame(
+        {
+            "category": np.repeat(categories, per),
+            "word": words[word_ids.ravel()],
+            "count": counts.ravel(),
+            "total_posts": np.repeat(total_posts, per),
+        }
+    )
+
+
+# === 2. 측정 도구 ===
+def measure(fn, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    fn을 repeat번 실행한 시간(초) 중앙값/최소값과, 한 번 실행할 때의 최대 메모리(tracemalloc)를 잰다.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds_median": statistics.median(times),
+        "seconds_min": min(times),
+        "peak_bytes": peak,
+        "repeat": repeat,
+    }
+
+
+def run_apptest(script: str, csv_path: str, reruns: int = APPTEST_RERUNS, seed: int = 0) -> dict:
+    """
+    Streamlit AppTest로 페이지를 headless 실행하고, 직무를 무작위로 바꿔 가며 rerun 시간을 잰다.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    # app.py / backend.py는 실행될 때마다 keyword_data.CSV_PATH를 다시 import 한다
+    keyword_data.CSV_PATH = csv_path
+    rng = random.Random(seed)
+
+    at = AppTest.from_file(os.path.join(keyword_data.BASE_DIR, script), default_timeout=600)
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{script} 실행 중 오류: {at.exception[0].value}")
+
+    times = []
+    for _ in range(reruns):
+        box = at.selectbox[0]
+        box.select(rng.choice(box.options))
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+
+    times.sort()
+    return {
+        "first_run_seconds": first,
+        "rerun_seconds_median": statistics.median(times),
+        "rerun_seconds_p95": times[min(len(times) - 1, int(len(times) * 0.95))],
+        "reruns": reruns,
+    }
+
+
+# === 3. 벤치마크 본체 ===
+def bench_size(n_rows: int, n_categories: int, workdir: str, repeat: int,
+               lookups: int, apptest: bool) -> list:
+    results = []
+
+    def record(stage, **values):
+        results.append({"rows": n_rows, "categories": n_categories, "stage": stage, **values})
+
+    df = make_synthetic_table(n_rows, n_categories)
+    csv_path = os.path.join(workdir, f"bench_{n_rows}_{n_categories}.csv")
+    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    cache_path = keyword_data.cache_path_for(csv_path)
+
+    record("csv_parse", **measure(lambda: read_keyword_csv(csv_path), repeat))
+
+    def cold_load():
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        return load_keyword_frame(csv_path)
+
+    record("load_cache_miss", **measure(cold_load, repeat))
+    record("load_cache_hit", **measure(lambda: load_keyword_frame(csv_path), repeat))
+
+    raw = read_keyword_csv(csv_path)
+    record("compact", **measure(lambda: compact_keyword_frame(raw), repeat))
+
+    compact = compact_keyword_frame(raw)
+    record("index_build", **measure(lambda: build_category_index(compact), repeat))
+
+    table = build_category_index(compact)
+    record("category_list", **measure(lambda: list(table.categories), repeat))
+
+    rng = random.Random(0)
+    picks = [rng.choice(table.categories) for _ in range(lookups)]
+
+    def filter_all():
+        for c in picks:
+            table.rows(c)
+
+    stats = measure(filter_all, repeat)
+    stats["seconds_per_lookup"] = stats["seconds_median"] / lookups
+    record("filter_by_category", **stats)
+
+    for k in (10, 1000):
+        def top_k_all(k=k):
+            for c in picks:
+                table.top_k(c, k, 0)
+
+        stats = measure(top_k_all, repeat)
+        stats["seconds_per_lookup"] = stats["seconds_median"] / lookups
+        record(f"top_k_{k}", **stats)
+
+    bench_shards(table, workdir, repeat, lookups, record)
+
+    if apptest and n_rows <= APPTEST_MAX_ROWS:
+        default_csv = keyword_data.CSV_PATH
+        try:
+            for script in ("app.py", "backend.py"):
+                record(f"streamlit_{script}", **run_apptest(script, csv_path))
+        finally:
+            keyword_data.CSV_PATH = default_csv
+
+    return results
+
+
+def bench_shards(table, workdir: str, repeat: int, lookups: int, record):
+    """
+    같은 데이터를 샤드로 한 번 쓰고, 앱이 쓰는 ShardedKeywordTable 경로를 잰다.
+    - cold: 매번 manifest 로 새 테이블을 열어 행 캐시가 빈 상태 (OS 페이지 캐시는 이미 데워져 있을 수 있음)
+    - warm: 같은 직무를 한 번 읽어 둔 테이블 (행 캐시 SHARD_CACHE_SIZE 안에 다 들어가는 직무 수만 조회)
+    """
+    shard_dir = os.path.join(workdir, f"bench_{len(table.df)}_{len(table.categories)}.shards")
+    start = time.perf_counter()
+    write_shards(table, shard_dir, {})
+    record("shard_write", seconds=time.perf_counter() - start)
+
+    manifest = read_manifest(shard_dir)
+    record("shard_open", **measure(lambda: ShardedKeywordTable(shard_dir, manifest), repeat))
+
+    rng = random.Random(0)
+    picks = rng.sample(table.categories, min(lookups, SHARD_CACHE_SIZE, len(table.categories)))
+
+    def per_lookup(stats):
+        stats["seconds_per_lookup"] = stats["seconds_median"] / len(picks)
+        stats["lookups"] = len(picks)
+        return stats
+
+    def rows_all(sharded):
+        for c in picks:
+            sharded.rows(c)
+
+    def top_k_all(sharded, k=10):
+        for c in picks:
+            sharded.top_k(c, k, 0)
+
+    warm = ShardedKeywordTable(shard_dir, manifest)
+    rows_all(warm)
+    record("shard_rows_cold", **per_lookup(measure(lambda: rows_all(ShardedKeywordTable(shard_dir, manifest)), repeat)))
+    record("shard_rows_warm", **per_lookup(measure(lambda: rows_all(warm), repeat)))
+    record("shard_top_k_10_cold",
+           **per_lookup(measure(lambda: top_k_all(ShardedKeywordTable(shard_dir, manifest)), repeat)))
+    record("shard_top_k_10_warm", **per_lookup(measure(lambda: top_k_all(warm), repeat)))
+
+    for method in RANKINGS:
+        def ranking_cold(method=method):
+            ranking = ShardedKeywordTable(shard_dir, manifest).ranking(method)
+            top_k_all(ranking)
+
+        ranking = warm.ranking(method)
+        top_k_all(ranking)
+        record(f"shard_ranking_{method}_cold", **per_lookup(measure(ranking_cold, repeat)))
+        record(f"shard_ranking_{method}_warm", **per_lookup(measure(lambda ranking=ranking: top_k_all(ranking), repeat)))
+
+
+def parse_size(text: str):
+    rows, _, cats = text.partition(":")
+    return int(rows), int(cats or 10)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로드/필터/렌더 경로 벤치마크 (결과는 JSON)")
+    parser.add_argument("--sizes", nargs="+", type=parse_size,
+                        help="행수:직무수 목록 (예: 200:10 100000:1000 10000000:10000)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--lookups", type=int, default=DEFAULT_LOOKUPS)
+    parser.add_argument("--no-apptest", action="store_true", help="Streamlit 페이지 rerun 측정 생략")
+    parser.add_argument("--out", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or DEFAULT_SIZES
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for n_rows, n_categories in sizes:
+            print(f"▶ {n_rows:,}행 / {n_categories:,}개 직무")
+            results.extend(
+                bench_size(n_rows, n_categories, workdir, args.repeat, args.lookups,
+                           apptest=not args.no_apptest)
+            )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+        },
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✅ {len(results)}개 측정 → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+import argparse
+import json
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from scipy import sparse
+
+from ingest import DEFAULT_CHUNK_SIZE, iter_posting_chunks, normalize_token, tokenize
+from keyword_data import BASE_DIR
+
+# === 0. 기본 설정 ===
+# 직무별 "함께 요구되는 역량" 행렬을 저장해 두는 파일 (cooccur.py build 로 만든다)
+COOCCUR_PATH = os.path.join(BASE_DIR, "keyword_cooccurrence.feather")
+COOCCUR_META_KEY = b"keyword_cooccurrence"
+COOCCUR_VERSION = 1
+COOCCUR_COLS = ["category", "word_a", "word_b", "count"]
+
+# 한 공고의 단어 쌍 수는 n(n+1)/2 → 태그가 이보다 많은 공고는 쌍은 세지 않고 단어별 공고 수(대각선)만 센다
+MAX_TOKENS_PER_POSTING = 64
+# 바로 더하지 않고 모아 두는 (행, 열) 원소 수 상한. 넘으면 직무별 희소 행렬에 한 번에 합친다
+COMPACT_NNZ = 2_000_000
+
+
+# === 1. 합칠 수 있는 동시 출현 카운터 ===
+@dataclass
+class CooccurrenceCounts:
+    """
+    category별 단어 × 단어 동시 출현 공고 수. 직무마다 희소 상삼각 행렬(i <= j) 하나이고,
+    대각선 (i, i)는 그 단어가 나온 공고 수다.
+    단어 번호(vocab)는 객체마다 따로 매기고, merge 할 때 상대 번호를 내 번호로 바꿔서 더한다.
+    PartialCounts 처럼 순서와 상관없이 합칠 수 있어서 프로세스 풀 결과와 저장된 파일을 그대로 누적한다.
+    """
+
+    words: list = field(default_factory=list)
+    vocab: dict = field(default_factory=dict)
+    matrices: dict = field(default_factory=dict)
+    posts: Counter = field(default_factory=Counter)
+    _pending: dict = field(default_factory=dict, repr=False)
+    _pending_nnz: int = field(default=0, repr=False)
+    _symmetric: dict = field(default_factory=dict, repr=False)
+
+    def word_ids(self, tokens) -> np.ndarray:
+        ids = np.empty(len(tokens), dtype=np.int32)
+        for n, token in enumerate(tokens):
+            i = self.vocab.get(token)
+            if i is None:
+                i = self.vocab[token] = len(self.words)
+                self.words.append(token)
+            ids[n] = i
+        return ids
+
+    def add_pairs(self, category: str, rows: np.ndarray, cols: np.ndarray, counts: np.ndarray):
+        self._pending.setdefault(category, []).append((rows, cols, counts))
+        self._pending_nnz += len(rows)
+        if self._pending_nnz >= COMPACT_NNZ:
+            self.compact()
+
+    def add(self, category: str, tokens: set, max_tokens: int = MAX_TOKENS_PER_POSTING):
+        self.posts[category] += 1
+        ids = np.sort(self.word_ids(list(tokens)))
+        rows, cols, ones = _pair_index(len(ids), len(ids) <= max_tokens)
+        self.add_pairs(category, ids[rows], ids[cols], ones)
+
+    def compact(self) -> "CooccurrenceCounts":
+        """
+        모아 둔 (행, 열, 수)를 직무별 CSR 행렬에 더한다. 같은 (행, 열)은 CSR로 바꿀 때 합쳐진다.
+        """
+        n = len(self.words)
+        for category, parts in self._pending.items():
+            added = sparse.csr_matrix(
+                (
+                    np.concatenate([p[2] for p in parts]),
+                    (np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])),
+                ),
+                shape=(n, n),
+            )
+            mine = self.matrices.get(category)
+            if mine is not None:
+                mine.resize((n, n))
+                added = added + mine
+            self.matrices[category] = added
+        if self._pending:
+            self._pending.clear()
+            self._pending_nnz = 0
+            self._symmetric.clear()
+        return self
+
+    def merge(self, other: "CooccurrenceCounts") -> "CooccurrenceCounts":
+        other.compact()
+        self.posts.update(other.posts)
+        mapping = self.word_ids(other.words)
+        for category, matrix in other.matrices.items():
+            coo = matrix.tocoo()
+            a, b = mapping[coo.row], mapping[coo.col]
+            self.add_pairs(category, np.minimum(a, b), np.maximum(a, b), coo.data)
+        return self
+
+    # --- 조회 ---
+    def _symmetric_matrix(self, category):
+        cached = self._symmetric.get(category)
+        if cached is None:
+            self.compact()
+            if category is None:
+                uppers = list(self.matrices.values())
+            else:
+                uppers = [self.matrices[category]] if category in self.matrices else []
+            if not uppers:
+                return None
+            n = len(self.words)
+            upper = sparse.csr_matrix((n, n), dtype=np.int32)
+            for matrix in uppers:
+                matrix.resize((n, n))
+                upper = upper + matrix
+            cached = (upper + upper.T - sparse.diags(upper.diagonal(), dtype=upper.dtype)).tocsr()
+            self._symmetric[category] = cached
+        return cached
+
+    def together(self, word, category: str = None, n: int = 5) -> list:
+        """
+        word와 같은 공고에 함께 나온 단어 상위 n개: [(단어, 함께 나온 공고 수, 비율), ...]
+        비율 = 함께 나온 공고 수 / word가 나온 공고 수. category=None 이면 모든 직무 합계.
+        """
+        i = self.vocab.get(normalize_token(str(word)))
+        matrix = self._symmetric_matrix(category)
+        if i is None or matrix is None:
+            return []
+        start, end = matrix.indptr[i], matrix.indptr[i + 1]
+        cols = matrix.indices[start:end]
+        counts = matrix.data[start:end]
+        own = counts[cols == i]
+        if not len(own) or own[0] <= 0:
+            return []
+        keep = (cols != i) & (counts > 0)
+        cols, counts = cols[keep], counts[keep]
+        top = np.lexsort((cols, -counts))[:n]
+        return [(self.words[cols[j]], int(counts[j]), float(counts[j] / own[0])) for j in top]
+
+    def n_pairs(self) -> int:
+        self.compact()
+        return sum(int(m.nnz) for m in self.matrices.values())
+
+
+@lru_cache(maxsize=256)
+def _pair_index(n: int, pairs: bool):
+    # 태그 수별 (i <= j) 위치는 매번 같으므로 한 번만 만든다 (공고마다 만들면 이 부분이 대부분의 시간)
+    if pairs:
+        rows, cols = np.triu_indices(n)
+    else:
+        rows = cols = np.arange(n)
+    return rows, cols, np.ones(len(rows), dtype=np.int32)
+
+
+def count_cooccurrence_chunk(records: list, max_tokens: int = MAX_TOKENS_PER_POSTING) -> CooccurrenceCounts:
+    """
+    프로세스 풀 워커: (category, 키워드 필드) 목록을 받아 부분 동시 출현 행렬을 만든다.
+    """
+    partial = CooccurrenceCounts()
+    for category, value in records:
+        if not isinstance(category, str) or not category.strip():
+            continue
+        partial.add(category, tokenize(value), max_tokens)
+    return partial.compact()
+
+
+def count_cooccurrence(paths, category_field: str = "category", text_field: str = "keywords",
+                       chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = None,
+                       max_tokens: int = MAX_TOKENS_PER_POSTING) -> CooccurrenceCounts:
+    """
+    ingest.count_postings 와 같은 방식: 청크를 프로세스 풀에 보내고 부분 행렬을 도착하는 대로 합친다.
+    동시에 떠 있는 청크 수를 workers * 2 로 제한하고, 합친 결과도 희소 행렬로만 들고 있어서
+    메모리 사용량은 입력 크기가 아니라 서로 다른 (직무, 단어 쌍) 수에 비례한다.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = CooccurrenceCounts()
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for path in paths:
+            for chunk in iter_posting_chunks(path, category_field, text_field, chunk_size):
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        total.merge(future.result())
+                pending.add(pool.submit(count_cooccurrence_chunk, chunk, max_tokens))
+        for future in pending:
+            total.merge(future.result())
+
+    return total.compact()
+
+
+# === 2. 저장 / 읽기 ===
+def to_frame(counts: CooccurrenceCounts) -> pd.DataFrame:
+    """
+    한 행 = (직무, 단어 a, 단어 b, 함께 나온 공고 수), a <= b (a == b 는 단어가 나온 공고 수).
+    문자열 컬럼은 categorical(사전 + 정수 코드)이라 Feather에 작게 저장된다.
+    """
+    counts.compact()
+    categories = sorted(counts.matrices)
+    cat_codes, rows, cols, values = [], [], [], []
+    for code, category in enumerate(categories):
+        coo = counts.matrices[category].tocoo()
+        cat_codes.append(np.full(coo.nnz, code, dtype=np.int32))
+        rows.append(coo.row.astype(np.int32))
+        cols.append(coo.col.astype(np.int32))
+        values.append(coo.data.astype(np.int32))
+
+    def concat(parts):
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+
+    return pd.DataFrame(
+        {
+            "category": pd.Categorical.from_codes(concat(cat_codes), categories=categories),
+            "word_a": pd.Categorical.from_codes(concat(rows), categories=counts.words),
+            "word_b": pd.Categorical.from_codes(concat(cols), categories=counts.words),
+            "count": concat(values),
+        }
+    )
+
+
+def save_cooccurrence(counts: CooccurrenceCounts, path: str = COOCCUR_PATH):
+    """
+    Feather(Arrow) 한 파일. 직무별 공고 수는 스키마 메타데이터에 넣는다.
+    임시 파일에 쓴 뒤 교체 → 앱이 반쯤 쓰인 파일을 읽는 일이 없도록.
+    """
+    table = pa.Table.from_pandas(to_frame(counts), preserve_index=False)
+    metadata = {COOCCUR_META_KEY: json.dumps({"version": COOCCUR_VERSION, "posts": dict(counts.posts)})}
+    table = table.replace_schema_metadata(metadata)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_cooccurrence(path: str = COOCCUR_PATH) -> CooccurrenceCounts:
+    table = feather.read_table(path)
+    raw = (table.schema.metadata or {}).get(COOCCUR_META_KEY)
+    meta = json.loads(raw) if raw else {}
+    if meta.get("version") != COOCCUR_VERSION:
+        raise ValueError(f"동시 출현 파일 형식이 다릅니다(version={meta.get('version')}): {path}")
+
+    frame = table.select(COOCCUR_COLS).to_pandas()
+    words = frame["word_a"].cat.categories.tolist()
+    rows = frame["word_a"].cat.codes.to_numpy(dtype=np.int32)
+    cols = pd.Categorical(frame["word_b"], categories=words).codes.astype(np.int32)
+    values = frame["count"].to_numpy(dtype=np.int32)
+    cat_codes = frame["category"].cat.codes.to_numpy()
+
+    counts = CooccurrenceCounts(
+        words=words,
+        vocab={w: i for i, w in enumerate(words)},
+        posts=Counter(meta.get("posts", {})),
+    )
+    n = len(words)
+    order = np.argsort(cat_codes, kind="stable")
+    bounds = np.searchsorted(cat_codes[order], np.arange(len(frame["category"].cat.categories) + 1))
+    for code, category in enumerate(frame["category"].cat.categories):
+        part = order[bounds[code]:bounds[code + 1]]
+        counts.matrices[category] = sparse.csr_matrix((values[part], (rows[part], cols[part])), shape=(n, n))
+    return counts
+
+
+# === 3. 명령행 ===
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="원본 채용공고에서 직무별 역량 동시 출현 행렬 생성")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="원본 공고 전체로 동시 출현 파일을 새로 만든다")
+    update = sub.add_parser("update", help="새 공고만 기존 동시 출현 파일에 더한다")
+    for command in (build, update):
+        command.add_argument("inputs", nargs="+", help="원본 공고 파일(.jsonl / .csv)")
+        command.add_argument("--out", default=COOCCUR_PATH, help="출력 Feather 경로")
+        command.add_argument("--category-field", default="category")
+        command.add_argument("--text-field", default="keywords")
+        command.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        command.add_argument("--workers", type=int, default=None)
+        command.add_argument("--max-tokens", type=int, default=MAX_TOKENS_PER_POSTING,
+                             help="공고 하나에서 단어 쌍을 만들 최대 태그 수")
+
+    merge = sub.add_parser("merge", help="따로 만든 동시 출현 파일(샤드)들을 하나로 합친다")
+    merge.add_argument("shards", nargs="+", help="cooccur.py 로 만든 Feather 파일")
+    merge.add_argument("--out", default=COOCCUR_PATH, help="출력 Feather 경로")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "merge":
+        counts = CooccurrenceCounts()
+        for path in args.shards:
+            counts.merge(load_cooccurrence(path))
+    else:
+        counts = count_cooccurrence(
+            args.inputs,
+            category_field=args.category_field,
+            text_field=args.text_field,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            max_tokens=args.max_tokens,
+        )
+        if args.command == "update" and os.path.exists(args.out):
+            counts = load_cooccurrence(args.out).merge(counts)
+
+    save_cooccurrence(counts, args.out)
+    print(
+        f"✅ 공고 {sum(counts.posts.values())}건, 직무 {len(counts.matrices)}개, "
+        f"단어 {len(counts.words)}개, 단어 쌍 {counts.n_pairs()}개 → {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import streamlit as st
+
+import metrics
+from cooccur import CooccurrenceCounts, load_cooccurrence
+from keyword_data import CSV_PATH, KeywordTable
+from keyword_service import KeywordDataService
+from keyword_shards import ShardedKeywordTable
+from ranking import RANKINGS, KeywordRanking, build_ranking
+from raw_view import RawDataView
+from search_index import SearchIndex, build_search_index
+from skill_details import DETAIL_MAP
+from trends import TrendTable
+
+# === 1. Streamlit 공유 리소스 ===
+@st.cache_resource
+def get_data_service(csv_path: str = CSV_PATH) -> KeywordDataService:
+    """
+    app.py / backend.py 가 같은 프로세스에서 함께 쓰는 서비스 하나.
+    st.cache_data 와 달리 값을 복사(pickle)하지 않고 같은 객체를 그대로 돌려준다.
+    """
+    metrics.count("load_keyword_data_miss")
+    return KeywordDataService(csv_path)
+
+
+@st.cache_resource(max_entries=1)
+def get_search_index(_table: KeywordTable, version: str) -> SearchIndex:
+    """
+    직무 / 요구 역량 / 세부 역량 검색 색인. 데이터 버전(version)마다 한 번만 만들고 페이지끼리 공유한다.
+    """
+    with metrics.timer("search_index_build"):
+        return build_search_index(_table, DETAIL_MAP)
+
+
+@st.cache_resource(max_entries=len(RANKINGS))
+def get_keyword_ranking(_table: KeywordTable, version: str, method: str) -> KeywordRanking:
+    """
+    정렬 기준(method)별 점수와 직무별 순서. 데이터 버전마다 기준별로 한 번만 계산한다.
+    샤드 테이블이면 샤드를 쓸 때 계산해 둔 배열을 열기만 한다.
+    """
+    with metrics.timer("ranking_build"):
+        if isinstance(_table, ShardedKeywordTable):
+            return _table.ranking(method)
+        return build_ranking(_table, method)
+
+
+@st.cache_resource(max_entries=1)
+def get_raw_view(_table: KeywordTable, version: str) -> RawDataView:
+    """
+    원본 데이터 보기의 페이지 조회. 데이터 버전마다 하나만 두고 세션끼리 검색/정렬 결과를 함께 쓴다.
+    """
+    return RawDataView(_table)
+
+
+@st.cache_resource(max_entries=1)
+def get_cooccurrence(path: str, stamp: tuple) -> CooccurrenceCounts:
+    """
+    함께 요구되는 역량 (cooccur.py 로 만든 파일). 파일의 (크기, mtime) stamp가 바뀌면 다시 읽는다.
+    파일이 아직 없으면 None.
+    """
+    if stamp == (None, None):
+        return None
+    with metrics.timer("cooccurrence_load"):
+        return load_cooccurrence(path)
+
+
+@st.cache_resource(max_entries=1)
+def get_trend_table(path: str, stamp: tuple) -> TrendTable:
+    """
+    월별 추세 (ingest.py --period-field 로 만든 파일). memory-map으로 열어 두고 세션끼리 공유한다.
+    파일이 아직 없으면 None.
+    """
+    if stamp == (None, None):
+        return None
+    with metrics.timer("trend_table_load"):
+        return TrendTable(path)
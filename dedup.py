@@ -0,0 +1,302 @@
+import os
+import re
+import unicodedata
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from ingest import DEFAULT_CHUNK_SIZE, iter_posting_chunks, tokenize
+
+# === 0. 기본 설정 ===
+# 밴드 16개 × 행 8개 = 해시 128개. 자카드 유사도가 약 (1/16)^(1/8) ≈ 0.71 을 넘는 공고부터 후보로 잡힌다
+DEFAULT_BANDS = 16
+DEFAULT_ROWS = 8
+SHINGLE_SIZE = 5  # 글자 5-gram (한글은 띄어쓰기가 제각각이라 단어보다 글자 단위가 안정적)
+SIGNATURE_BATCH = 512  # 워커 안에서 한 번에 해시하는 공고 수 (임시 배열 크기 제한)
+# 후보 쌍을 실제로 중복으로 볼 추정 자카드 유사도 하한 (서명 칸이 같은 비율)
+DEFAULT_THRESHOLD = 0.8
+# 이보다 짧은 글은 shingle 이 몇 개 안 되어 서로 다른 공고도 쉽게 겹치므로 비교하지 않는다 (키워드 태그 등)
+MIN_TEXT_LENGTH = 50
+VERIFY_BATCH = 65536  # 후보 쌍을 이만큼씩 서명 비교 (임시 배열 크기 제한)
+EMPTY = np.iinfo(np.uint32).max  # 서명에서 아직 값이 없는 칸
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+_LOW32 = np.uint64(0xFFFFFFFF)
+_DENSIFY_STEP = np.uint64(0x9E3779B1)
+_BASE = np.uint64(0x100000001B3)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+# === 1. MinHash 서명 ===
+def clean_text(value) -> str:
+    """
+    NFKC + 소문자 + 공백 하나로. 태그 목록(list)은 정렬해서 이어 붙인다(순서만 다른 공고는 같은 글).
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        value = ",".join(sorted(str(v) for v in value))
+    text = unicodedata.normalize("NFKC", str(value)).lower()
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    # splitmix64 마무리 단계: 비슷한 입력도 고르게 퍼지게
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+def _shingle_hashes(texts: list, k: int = SHINGLE_SIZE):
+    """
+    공고 여러 건의 글자 k-gram 해시를 한 번에 계산. 반환: (해시, 해시별 공고 번호)
+    k 글자보다 짧은 글은 뒤를 채워서 shingle 하나로 만든다. 빈 글은 shingle 이 없다.
+    """
+    padded = [t.ljust(k, "\0") if t else "" for t in texts]
+    lengths = np.array([len(t) for t in padded], dtype=np.int64)
+    total = int(lengths.sum())
+    if total < k:
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+
+    codes = np.frombuffer("".join(padded).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    width = total - k + 1
+    hashes = np.zeros(width, dtype=np.uint64)
+    for j in range(k):
+        hashes = hashes * _BASE + codes[j:j + width]
+
+    ends = np.cumsum(lengths)
+    owner = np.repeat(np.arange(len(texts)), lengths)[:width]
+    inside = np.arange(width) + k <= ends[owner]  # 두 공고에 걸친 k-gram 은 버린다
+    return _mix64(hashes[inside]), owner[inside]
+
+
+def minhash_signatures(texts: list, n_hashes: int) -> tuple:
+    """
+    공고별 MinHash 서명 (공고 수 × n_hashes, uint32). 반환: (서명, 글이 있는지 여부)
+    해시 함수 n_hashes 개를 따로 돌리지 않고, shingle 해시 하나를 n_hashes 개 칸으로 나눠
+    칸마다 최솟값을 쓴다 (one permutation hashing). 빈 칸은 오른쪽 첫 칸 값을 빌려 채운다
+    (rotation densification). 같은 칸 값이 같을 확률은 그대로 자카드 유사도.
+    """
+    signatures = np.full((len(texts), n_hashes), EMPTY, dtype=np.uint32)
+    has_text = np.zeros(len(texts), dtype=bool)
+
+    for lo in range(0, len(texts), SIGNATURE_BATCH):
+        hashes, owner = _shingle_hashes(texts[lo:lo + SIGNATURE_BATCH])
+        if not len(hashes):
+            continue
+        block = signatures[lo:lo + SIGNATURE_BATCH]
+        bins = ((hashes >> np.uint64(32)) % np.uint64(n_hashes)).astype(np.int64)
+        np.minimum.at(block.reshape(-1), owner * n_hashes + bins, (hashes & _LOW32).astype(np.uint32))
+        has_text[lo + np.unique(owner)] = True
+
+    _densify(signatures, has_text)
+    return signatures, has_text
+
+
+def _densify(signatures: np.ndarray, has_text: np.ndarray):
+    empty = signatures[has_text] == EMPTY
+    if not empty.any():
+        return
+    rows, n = empty.shape
+    # 두 바퀴 이어 붙여서 "오른쪽(순환)으로 가장 가까운 채워진 칸"을 한 번에 찾는다
+    position = np.where(np.tile(~empty, 2), np.arange(2 * n), 2 * n)
+    nearest = np.minimum.accumulate(position[:, ::-1], axis=1)[:, ::-1][:, :n]
+    filled = signatures[has_text]
+    borrowed = np.take_along_axis(filled, nearest % n, axis=1).astype(np.uint64)
+    distance = (nearest - np.arange(n)).astype(np.uint64)
+    filled[empty] = ((borrowed + distance * _DENSIFY_STEP) & _LOW32).astype(np.uint32)[empty]
+    signatures[has_text] = filled
+
+
+def band_keys(signatures: np.ndarray, bands: int, rows: int) -> np.ndarray:
+    """
+    서명을 밴드로 나눠 밴드마다 64비트 키 하나로 접는다 (공고 수 × bands, uint64).
+    어느 한 밴드라도 키가 같으면 중복 후보.
+    """
+    grouped = signatures.reshape(len(signatures), bands, rows).astype(np.uint64)
+    keys = np.zeros((len(signatures), bands), dtype=np.uint64)
+    for r in range(rows):
+        keys = _mix64(keys * _BASE + grouped[:, :, r])
+    return keys
+
+
+# === 2. 청크 단위 워커 ===
+@dataclass
+class SignatureChunk:
+    """
+    워커 결과: 청크 안 공고별 category(청크 안 번호), 밴드 키, 후보 검증용 서명, 비교 대상 여부, 키워드 수.
+    category 가 비어 있는 공고는 category_codes 가 -1 (빈도 집계에서도 건너뛰는 행).
+    서명은 칸마다 하위 16비트만 남긴다 (공고당 256바이트, 우연히 같을 확률 1/65536 이라 추정치가 거의 그대로).
+    """
+
+    categories: list
+    category_codes: np.ndarray
+    keys: np.ndarray
+    signatures: np.ndarray
+    has_text: np.ndarray
+    n_tokens: np.ndarray
+
+
+def signature_chunk(records: list, bands: int = DEFAULT_BANDS, rows: int = DEFAULT_ROWS) -> SignatureChunk:
+    """
+    프로세스 풀 워커: (category, 키워드 필드[, 비교할 본문]) 목록 → 밴드 키와 서명.
+    마지막 필드를 비교하며, MIN_TEXT_LENGTH 보다 짧은 글은 비교 대상에서 뺀다.
+    """
+    categories = [c if isinstance(c, str) and c.strip() else None for c, *_ in records]
+    codes, uniques = pd.factorize(pd.Series(categories, dtype=object), use_na_sentinel=True)
+    texts = [clean_text(record[-1]) for record in records]
+    signatures, has_text = minhash_signatures(texts, bands * rows)
+    has_text &= np.array([len(t) >= MIN_TEXT_LENGTH for t in texts], dtype=bool)
+    return SignatureChunk(
+        categories=list(uniques),
+        category_codes=codes.astype(np.int32),
+        keys=band_keys(signatures, bands, rows),
+        signatures=(signatures & np.uint32(0xFFFF)).astype(np.uint16),
+        has_text=has_text,
+        n_tokens=np.array([len(tokenize(record[1])) for record in records], dtype=np.int32),
+    )
+
+
+# === 3. 중복 묶기 ===
+@dataclass
+class DedupResult:
+    """
+    keep[i] = 입력 순서 i 번째 공고를 빈도 집계에 넣을지 (중복 묶음마다 먼저 나온 한 건만 True).
+    report = category별 공고 수 / 키워드 수가 중복 제거로 얼마나 줄었는지.
+    too_short = 본문이 없거나 MIN_TEXT_LENGTH 보다 짧아서 비교하지 않은(그대로 센) 공고 수.
+    """
+
+    keep: np.ndarray
+    report: pd.DataFrame
+    too_short: int = 0
+
+    @property
+    def removed(self) -> int:
+        return int(len(self.keep) - self.keep.sum())
+
+
+def find_duplicates(paths, dedup_field: str, category_field: str = "category", text_field: str = "keywords",
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = None,
+                    bands: int = DEFAULT_BANDS, rows: int = DEFAULT_ROWS,
+                    threshold: float = DEFAULT_THRESHOLD) -> DedupResult:
+    """
+    1) 청크를 프로세스 풀에 보내 공고별 밴드 키와 서명을 받는다 (공고당 bands * 8 + 256 바이트)
+    2) 밴드마다 (category, 키)로 정렬해서 같은 키를 가진 공고를 후보 쌍으로 잡는다
+       → 모든 쌍을 비교하지 않고 정렬 bands 번으로 끝난다
+    3) 후보 쌍마다 서명이 같은 칸의 비율(추정 자카드 유사도)이 threshold 이상인 것만 잇고,
+       연결 요소 하나를 중복 묶음 하나로 본다
+    dedup_field 는 공고 본문처럼 충분히 긴 글이어야 한다 (짧은 글은 비교하지 않고 그대로 센다).
+    같은 글이라도 다른 직무에 올라온 공고는 각 직무에서 한 번씩 센다.
+    입력 파일들 안에서만 비교하므로, 이전 실행에서 이미 센 공고의 재등록은 찾지 못한다.
+    """
+    if not dedup_field:
+        raise ValueError("dedup_field(공고 본문 필드)가 필요합니다.")
+    workers = workers or os.cpu_count() or 1
+    extra = (dedup_field,) if dedup_field != text_field else ()
+    max_pending = workers * 2
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        seq = 0
+        for path in paths:
+            for chunk in iter_posting_chunks(path, category_field, text_field, chunk_size, extra_fields=extra):
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[pending.pop(future)] = future.result()
+                pending[pool.submit(signature_chunk, chunk, bands, rows)] = seq
+                seq += 1
+        for future, n in pending.items():
+            results[n] = future.result()
+
+    # 청크별 category 번호 → 전체 번호
+    lookup = {}
+    codes, keys, signatures, has_text, n_tokens = [], [], [], [], []
+    for n in range(len(results)):
+        part = results.pop(n)
+        # 끝에 -1 을 붙여 두면 category 가 빈 행(-1)은 그대로 -1
+        mapping = np.array([lookup.setdefault(c, len(lookup)) for c in part.categories] + [-1], dtype=np.int32)
+        codes.append(mapping[part.category_codes])
+        keys.append(part.keys)
+        signatures.append(part.signatures)
+        has_text.append(part.has_text)
+        n_tokens.append(part.n_tokens)
+    names = list(lookup)
+    codes = np.concatenate(codes) if codes else np.empty(0, dtype=np.int32)
+    keys = np.concatenate(keys) if keys else np.empty((0, bands), dtype=np.uint64)
+    signatures = np.concatenate(signatures) if signatures else np.empty((0, bands * rows), dtype=np.uint16)
+    has_text = np.concatenate(has_text) if has_text else np.empty(0, dtype=bool)
+    n_tokens = np.concatenate(n_tokens) if n_tokens else np.empty(0, dtype=np.int32)
+
+    candidate = has_text & (codes >= 0)
+    keep = _cluster_keep(codes, keys, signatures, candidate, threshold)
+    return DedupResult(
+        keep=keep,
+        report=_shrink_report(names, codes, n_tokens, keep),
+        too_short=int(((codes >= 0) & ~has_text).sum()),
+    )
+
+
+def _candidate_pairs(codes: np.ndarray, keys: np.ndarray, ids: np.ndarray) -> tuple:
+    """
+    밴드마다 (category, 키)가 같은 공고 묶음 안에서 (바로 앞 공고, 묶음 첫 공고)와 잇는 후보 쌍.
+    반환: (뒤 공고, 앞 공고) 번호 배열, 중복 쌍 없음
+    """
+    src, dst = [], []
+    for band in range(keys.shape[1]):
+        order = ids[np.lexsort((keys[ids, band], codes[ids]))]
+        same = (codes[order[1:]] == codes[order[:-1]]) & (keys[order[1:], band] == keys[order[:-1], band])
+        # 묶음 시작 위치를 앞으로 전파해서 각 공고가 속한 묶음의 첫 공고를 찾는다
+        start = np.where(np.r_[True, ~same], np.arange(len(order)), 0)
+        head = order[np.maximum.accumulate(start)] if len(order) else order
+        src.extend([order[1:][same], order[1:][same]])
+        dst.extend([order[:-1][same], head[1:][same]])
+    if not src:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = np.unique(np.stack([np.concatenate(src), np.concatenate(dst)], axis=1).astype(np.int64), axis=0)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _cluster_keep(codes: np.ndarray, keys: np.ndarray, signatures: np.ndarray, candidate: np.ndarray,
+                  threshold: float = DEFAULT_THRESHOLD) -> np.ndarray:
+    n = len(codes)
+    src, dst = _candidate_pairs(codes, keys, np.flatnonzero(candidate))
+
+    # 밴드 하나만 같아도 후보가 되므로, 서명 전체로 추정한 자카드 유사도가 threshold 이상인 쌍만 잇는다
+    similar = np.zeros(len(src), dtype=bool)
+    for lo in range(0, len(src), VERIFY_BATCH):
+        a, b = src[lo:lo + VERIFY_BATCH], dst[lo:lo + VERIFY_BATCH]
+        similar[lo:lo + VERIFY_BATCH] = (signatures[a] == signatures[b]).mean(axis=1) >= threshold
+    src, dst = src[similar], dst[similar]
+
+    graph = sparse.csr_matrix((np.ones(len(src), dtype=np.int8), (src, dst)), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    keep = np.zeros(n, dtype=bool)
+    keep[np.unique(labels, return_index=True)[1]] = True  # 묶음마다 입력 순서가 가장 빠른 공고
+    return keep
+
+
+def _shrink_report(names: list, codes: np.ndarray, n_tokens: np.ndarray, keep: np.ndarray) -> pd.DataFrame:
+    valid = codes >= 0
+    codes, n_tokens, keep = codes[valid], n_tokens[valid], keep[valid]
+    size = len(names)
+    report = pd.DataFrame(
+        {
+            "category": names,
+            "posts": np.bincount(codes, minlength=size),
+            "unique_posts": np.bincount(codes[keep], minlength=size),
+            "keywords": np.bincount(codes, weights=n_tokens, minlength=size).astype(np.int64),
+            "unique_keywords": np.bincount(codes[keep], weights=n_tokens[keep], minlength=size).astype(np.int64),
+        }
+    )
+    report["removed_posts"] = report["posts"] - report["unique_posts"]
+    report["shrink_ratio"] = (report["removed_posts"] / report["posts"].where(report["posts"] > 0)).fillna(0.0)
+    return report.sort_values(["shrink_ratio", "category"], ascending=[False, True], ignore_index=True)
@@ -0,0 +1,272 @@
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from keyword_data import BASE_DIR, CSV_PATH, source_stamp
+from keyword_shards import load_keyword_table
+from skill_details import DETAIL_MAP, SOURCE_PATH
+
+# === 0. 기본 설정 ===
+# 정적 보고서 출력 위치: index.html / index.json + categories/<직무>.html, .json
+REPORT_DIR = os.path.join(BASE_DIR, "reports")
+MANIFEST_NAME = "index.json"
+REPORT_FORMAT_VERSION = 1
+DEFAULT_TOP_K = 10
+
+# 파일 이름에 쓸 수 없는 문자 → "_"
+UNSAFE_NAME_RE = re.compile(r"[\\/:*?\"<>|\s&%#]+")
+
+BAR_WIDTH = 420
+BAR_HEIGHT = 22
+
+STYLE = """
+body { font-family: -apple-system, "Apple SD Gothic Neo", "Malgun Gothic", sans-serif;
+       max-width: 760px; margin: 2rem auto; padding: 0 1rem; color: #222; }
+h1 { font-size: 1.6rem; } h2 { font-size: 1.2rem; margin-top: 2rem; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border-bottom: 1px solid #ddd; padding: .4rem; text-align: left; }
+td.num { text-align: right; font-variant-numeric: tabular-nums; }
+.caption { color: #666; font-size: .9rem; }
+svg text { font-size: 12px; }
+"""
+
+
+# === 1. 보고서 내용 ===
+def report_name(category_value) -> str:
+    """
+    직무 이름 → 파일 이름. 한글은 그대로 두고 경로 문자만 바꾸며, 바꾼 이름이 겹치지 않게 해시를 붙인다.
+    """
+    text = str(category_value)
+    return f"{UNSAFE_NAME_RE.sub('_', text).strip('_')}-{zlib.crc32(text.encode('utf-8')):08x}"
+
+
+def report_key(category_version: str, top_k: int, details_stamp: tuple) -> str:
+    """
+    이 값이 지난번과 같으면 보고서를 다시 만들지 않는다 (직무 데이터 버전 + 설정 + 세부 역량 원본).
+    """
+    raw = json.dumps([REPORT_FORMAT_VERSION, category_version, top_k, list(details_stamp)])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def build_report(table, category_value, top_k: int = DEFAULT_TOP_K) -> dict:
+    """
+    app.py / backend.py 가 보여 주는 것과 같은 내용: 빈도순 상위 키워드, 비율, 세부 역량.
+    """
+    page = table.top_k(category_value, top_k)
+    keywords = [
+        {
+            "rank": int(rank),
+            "word": str(word),
+            "count": int(count),
+            "ratio": round(float(ratio), 6),
+            "details": list(DETAIL_MAP.get(str(word)) or []),
+        }
+        for rank, word, count, ratio in zip(
+            page["rank"].tolist(), page["word"].tolist(), page["count"].tolist(), page["ratio"].tolist()
+        )
+    ]
+    return {
+        "category": str(category_value),
+        "version": table.versions[category_value],
+        "total_posts": table.total_posts(category_value),
+        "total_keywords": table.n_keywords(category_value),
+        "keywords": keywords,
+    }
+
+
+# === 2. HTML (외부 파일/스크립트 없이 열리는 한 장짜리 페이지) ===
+def _bar_chart_svg(keywords: list) -> str:
+    if not keywords:
+        return ""
+    top = max(k["count"] for k in keywords) or 1
+    label_width = 140
+    height = BAR_HEIGHT * len(keywords)
+    bars = []
+    for i, k in enumerate(keywords):
+        y = i * BAR_HEIGHT
+        width = max(1, round(BAR_WIDTH * k["count"] / top))
+        bars.append(
+            f'<text x="{label_width - 6}" y="{y + 15}" text-anchor="end">{html.escape(k["word"])}</text>'
+            f'<rect x="{label_width}" y="{y + 3}" width="{width}" height="{BAR_HEIGHT - 6}" fill="#4c78a8"/>'
+            f'<text x="{label_width + width + 4}" y="{y + 15}">{k["count"]}</text>'
+        )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{label_width + BAR_WIDTH + 60}" height="{height}" '
+        f'role="img" aria-label="키워드 빈도 막대그래프">{"".join(bars)}</svg>'
+    )
+
+
+def render_report_html(report: dict) -> str:
+    title = html.escape(report["category"])
+    rows = "".join(
+        f'<tr><td class="num">{k["rank"]}</td><td>{html.escape(k["word"])}</td>'
+        f'<td class="num">{k["count"]}</td><td class="num">{k["ratio"]:.1%}</td></tr>'
+        for k in report["keywords"]
+    )
+    details = []
+    for k in report["keywords"]:
+        if k["details"]:
+            items = "".join(f"<li>{html.escape(d)}</li>" for d in k["details"])
+            details.append(f"<h3>🔍 {html.escape(k['word'])}</h3><ul>{items}</ul>")
+    total_posts = report["total_posts"] if report["total_posts"] is not None else "-"
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} · AI 역량 키워드</title>
+<style>{STYLE}</style>
+</head>
+<body>
+<p><a href="../index.html">← 전체 직무</a></p>
+<h1>📊 {title}</h1>
+<p class="caption">전체 공고 수: {total_posts} · 전체 키워드 수: {report["total_keywords"]}</p>
+<h2>상위 키워드</h2>
+<table>
+<thead><tr><th>순위</th><th>요구 역량</th><th>공고 수</th><th>비율</th></tr></thead>
+<tbody>{rows}</tbody>
+</table>
+<h2>키워드 빈도</h2>
+{_bar_chart_svg(report["keywords"])}
+<h2>세부 역량</h2>
+{"".join(details) or '<p class="caption">아직 세부 역량 정보가 준비 중입니다.</p>'}
+</body>
+</html>
+"""
+
+
+def render_index_html(entries: list) -> str:
+    items = "".join(
+        f'<li><a href="categories/{html.escape(e["name"])}.html">{html.escape(e["category"])}</a> '
+        f'<span class="caption">({e["total_posts"]}건)</span></li>'
+        for e in entries
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>분야별 AI 역량 키워드</title>
+<style>{STYLE}</style>
+</head>
+<body>
+<h1>📊 분야별 AI 역량 키워드</h1>
+<ul>{items}</ul>
+</body>
+</html>
+"""
+
+
+def _write_text(path: str, text: str):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+# === 3. 프로세스 풀 워커 ===
+_worker_table = None
+
+
+def _init_worker(csv_path: str):
+    # 워커마다 샤드 manifest 만 열어 두고, 맡은 직무의 행만 읽는다
+    global _worker_table
+    _worker_table = load_keyword_table(csv_path)
+
+
+def export_category(task: tuple) -> tuple:
+    """
+    (직무, 파일 이름, 출력 디렉터리, top_k) → 보고서 JSON / HTML 을 쓰고 (직무, 파일 이름)을 반환.
+    """
+    category_value, name, out_dir, top_k = task
+    report = build_report(_worker_table, category_value, top_k)
+    base = os.path.join(out_dir, "categories", name)
+    _write_text(base + ".json", json.dumps(report, ensure_ascii=False, indent=1))
+    _write_text(base + ".html", render_report_html(report))
+    return category_value, name
+
+
+# === 4. 전체 내보내기 ===
+def export_reports(csv_path: str = CSV_PATH, out_dir: str = REPORT_DIR, top_k: int = DEFAULT_TOP_K,
+                   workers: int = None, force: bool = False) -> dict:
+    """
+    모든 직무 보고서를 프로세스 풀로 만들고 index.html / index.json 을 다시 쓴다.
+    index.json 에 직무별 report_key 를 남겨 두고, 지난번과 같은 직무(데이터 버전이 그대로인 직무)는 건너뛴다.
+    없어진 직무의 보고서 파일은 지운다. 반환: {"rendered": [...], "skipped": [...], "removed": [...]}
+    """
+    table = load_keyword_table(csv_path)
+    os.makedirs(os.path.join(out_dir, "categories"), exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = {e["category"]: e for e in json.load(f).get("categories", [])}
+    except (OSError, ValueError):
+        previous = {}
+
+    details_stamp = source_stamp(SOURCE_PATH)
+    entries, tasks, skipped = [], [], []
+    for c in table.categories:
+        name = report_name(c)
+        key = report_key(table.versions[c], top_k, details_stamp)
+        entries.append({"category": str(c), "name": name, "key": key, "total_posts": table.total_posts(c)})
+        old = previous.get(str(c))
+        files_exist = all(
+            os.path.exists(os.path.join(out_dir, "categories", name + ext)) for ext in (".html", ".json")
+        )
+        if not force and old and old.get("key") == key and files_exist:
+            skipped.append(c)
+        else:
+            tasks.append((c, name, out_dir, top_k))
+
+    rendered = []
+    if tasks:
+        workers = min(workers or os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(csv_path,)) as pool:
+            chunksize = max(1, len(tasks) // (workers * 4))
+            rendered = [c for c, _ in pool.map(export_category, tasks, chunksize=chunksize)]
+
+    current = {e["name"] for e in entries}
+    removed = []
+    for category_value, old in previous.items():
+        if old.get("name") not in current:
+            for ext in (".html", ".json"):
+                path = os.path.join(out_dir, "categories", old["name"] + ext)
+                if os.path.exists(path):
+                    os.remove(path)
+            removed.append(category_value)
+
+    _write_text(os.path.join(out_dir, "index.html"), render_index_html(entries))
+    _write_text(
+        manifest_path,
+        json.dumps(
+            {"format": REPORT_FORMAT_VERSION, "version": table.version, "top_k": top_k, "categories": entries},
+            ensure_ascii=False,
+            indent=1,
+        ),
+    )
+    return {"rendered": rendered, "skipped": skipped, "removed": removed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="직무별 정적 보고서(HTML/JSON) 일괄 생성")
+    parser.add_argument("--csv", default=CSV_PATH)
+    parser.add_argument("--out", default=REPORT_DIR, help="출력 디렉터리 (그대로 정적 웹 서버로 배포)")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="바뀌지 않은 직무도 다시 만든다")
+    args = parser.parse_args(argv)
+
+    result = export_reports(args.csv, args.out, args.top_k, args.workers, args.force)
+    print(
+        f"✅ 보고서 {len(result['rendered'])}개 생성, 변경 없음 {len(result['skipped'])}개 건너뜀, "
+        f"삭제 {len(result['removed'])}개 → {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
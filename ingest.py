@@ -0,0 +1,455 @@
+import argparse
+import csv
+import json
+import os
+import re
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from keyword_data import BASE_DIR, CSV_PATH, read_keyword_csv
+
+# === 0. 기본 설정 ===
+# top-N CSV와 별도로, category별 전체 단어 빈도를 저장해 두는 상태 파일
+STATE_PATH = os.path.join(BASE_DIR, "keyword_counts.feather")
+
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_TOP_N = 10
+OUTPUT_COLS = ["category", "word", "count", "total_posts"]
+
+# 키워드 태그 구분자: 쉼표, 슬래시, 파이프, 가운뎃점, 줄바꿈
+TOKEN_SPLIT_RE = re.compile(r"[,/|·\n\r\t]+")
+WHITESPACE_RE = re.compile(r"\s+")
+# 게시일 → 월: "2025-03-14", "2025.03", "2025/3", "202503" 등 앞의 연/월만 읽는다
+PERIOD_RE = re.compile(r"^\s*(\d{4})[-./]?(\d{1,2})(?!\d)")
+
+
+# === 1. 토큰화 ===
+def normalize_token(token: str) -> str:
+    """
+    CSV의 word 값과 같은 형태로 정규화: 공백 제거 + 영문 소문자.
+    (예: "IT 컨설팅" → "it컨설팅", "UX 디자인" → "ux디자인")
+    """
+    return WHITESPACE_RE.sub("", token).lower()
+
+
+def tokenize(value) -> set:
+    """
+    공고 한 건의 키워드 필드를 정규화된 단어 집합으로 변환.
+    리스트/집합이면 원소별로, 문자열이면 구분자 기준으로 나눈다.
+    한 공고 안의 중복 단어는 한 번만 센다(= 공고 수 기준 빈도).
+    """
+    if value is None:
+        return set()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        parts = [str(v) for v in value]
+    else:
+        if isinstance(value, float) and value != value:  # NaN
+            return set()
+        parts = TOKEN_SPLIT_RE.split(str(value))
+    return {tok for tok in (normalize_token(p) for p in parts) if tok}
+
+
+def normalize_period(value):
+    """
+    게시일 필드를 "YYYY-MM" 월 문자열로. 읽을 수 없으면 None.
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    match = PERIOD_RE.match(str(value))
+    if not match or not 1 <= int(match.group(2)) <= 12:
+        return None
+    return f"{match.group(1)}-{int(match.group(2)):02d}"
+
+
+# === 2. 합칠 수 있는 부분 카운터 ===
+@dataclass
+class PartialCounts:
+    """
+    청크 하나(또는 여러 청크를 합친 결과)의 category별 단어 빈도와 공고 수.
+    merge로 순서와 상관없이 합칠 수 있어서 프로세스 풀 결과를 그대로 누적한다.
+    """
+
+    words: dict = field(default_factory=dict)
+    posts: Counter = field(default_factory=Counter)
+
+    def add(self, category: str, tokens: set):
+        self.posts[category] += 1
+        counter = self.words.get(category)
+        if counter is None:
+            counter = self.words[category] = Counter()
+        counter.update(tokens)
+
+    def merge(self, other: "PartialCounts") -> "PartialCounts":
+        self.posts.update(other.posts)
+        for category, counter in other.words.items():
+            mine = self.words.get(category)
+            if mine is None:
+                self.words[category] = counter
+            else:
+                mine.update(counter)
+        return self
+
+    def to_frame(self, top_n: int = DEFAULT_TOP_N) -> pd.DataFrame:
+        """
+        load_keyword_data가 검증하는 스키마(category, word, count, total_posts)로 변환.
+        category별 count 내림차순 상위 top_n개 (top_n이 None 또는 0이면 전체).
+        """
+        rows = []
+        for category in sorted(self.words):
+            counter = self.words[category]
+            ranked = sorted(counter.items(), key=lambda kv: (-kv[1], kv[0]))
+            if top_n:
+                ranked = ranked[:top_n]
+            total = self.posts[category]
+            rows.extend((category, word, count, total) for word, count in ranked)
+        return pd.DataFrame(rows, columns=OUTPUT_COLS)
+
+
+def count_chunk(records: list) -> PartialCounts:
+    """
+    프로세스 풀 워커: (category, 키워드 필드) 목록을 받아 부분 카운터를 만든다.
+    세 번째 값(게시일)이 있으면 (category, 월)을 키로 센다 → trends.split_periods 로 나눈다.
+    """
+    partial = PartialCounts()
+    for category, value, *period in records:
+        if not isinstance(category, str) or not category.strip():
+            continue
+        partial.add((category, normalize_period(period[0])) if period else category, tokenize(value))
+    return partial
+
+
+# === 3. 원본 공고 스트리밍 ===
+def _detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    raise ValueError(f"지원하지 않는 입력 형식입니다(.jsonl / .csv): {path}")
+
+
+def iter_posting_chunks(path: str, category_field: str, text_field: str,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE, fmt: str = None, extra_fields: tuple = ()):
+    """
+    원본 공고 파일을 chunk_size 건씩 읽어서 [(category, 키워드 필드), ...] 리스트로 내보낸다.
+    extra_fields 를 주면 그 필드 값이 튜플 뒤에 붙는다 (예: 중복 검사용 본문).
+    파일 전체를 메모리에 올리지 않는다.
+    """
+    fmt = fmt or _detect_format(path)
+    fields = (category_field, text_field, *extra_fields)
+    if fmt == "jsonl":
+        with open(path, encoding="utf-8-sig") as f:
+            lines = (line for line in f if line.strip())
+            while True:
+                batch = list(islice(lines, chunk_size))
+                if not batch:
+                    break
+                chunk = []
+                for line in batch:
+                    record = json.loads(line)
+                    chunk.append(tuple(record.get(name) for name in fields))
+                yield chunk
+    else:
+        reader = pd.read_csv(
+            path,
+            usecols=list(dict.fromkeys(fields)),
+            dtype=str,
+            chunksize=chunk_size,
+            encoding="utf-8-sig",
+        )
+        for frame in reader:
+            yield list(zip(*(frame[name] for name in fields)))
+
+
+def count_postings(paths, category_field: str = "category", text_field: str = "keywords",
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = None, keep=None,
+                   period_field: str = None) -> PartialCounts:
+    """
+    여러 원본 파일을 청크 단위로 프로세스 풀에 보내고 부분 카운터를 합친다.
+    동시에 떠 있는 청크 수를 workers * 2 로 제한해서 메모리 사용량이 입력 크기와 무관하게 유지된다.
+    keep: 입력 순서대로의 bool 배열 (dedup.find_duplicates 결과). False 인 공고는 세지 않는다.
+    period_field 를 주면 키가 (category, 월)인 카운터를 반환한다.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = PartialCounts()
+    max_pending = workers * 2
+    offset = 0
+    extra = (period_field,) if period_field else ()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for path in paths:
+            for chunk in iter_posting_chunks(path, category_field, text_field, chunk_size, extra_fields=extra):
+                if keep is not None:
+                    mask = keep[offset:offset + len(chunk)]
+                    offset += len(chunk)
+                    chunk = [record for record, kept in zip(chunk, mask) if kept]
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        total.merge(future.result())
+                pending.add(pool.submit(count_chunk, chunk))
+        for future in pending:
+            total.merge(future.result())
+
+    return total
+
+
+# === 4. 결과 저장 ===
+def write_keyword_csv(df: pd.DataFrame, path: str):
+    """
+    임시 파일에 쓴 뒤 교체 → 앱이 반쯤 쓰인 CSV를 읽는 일이 없도록.
+    저장 후 read_keyword_csv로 다시 읽어 스키마를 검증한다.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    df[OUTPUT_COLS].to_csv(tmp_path, index=False, encoding="utf-8-sig", quoting=csv.QUOTE_MINIMAL)
+    read_keyword_csv(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def top_n_frame(full: pd.DataFrame, top_n: int = DEFAULT_TOP_N) -> pd.DataFrame:
+    """
+    전체 빈도 테이블에서 category별 count 내림차순 상위 top_n개만 남긴다.
+    top_n이 None 또는 0이면 전체 분포를 그대로 정렬해서 반환.
+    """
+    ordered = full.sort_values(
+        ["category", "count", "word"], ascending=[True, False, True], kind="stable"
+    )
+    if top_n:
+        ordered = ordered.groupby("category", sort=False).head(top_n)
+    return ordered.reset_index(drop=True)[OUTPUT_COLS]
+
+
+# === 4-1. 전체 빈도 상태 (증분 갱신용) ===
+def load_state(path: str = STATE_PATH) -> pd.DataFrame:
+    """
+    저장해 둔 전체 빈도 테이블을 읽는다. 없으면 빈 테이블.
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(
+            {
+                "category": pd.Series(dtype=str),
+                "word": pd.Series(dtype=str),
+                "count": pd.Series(dtype="int64"),
+                "total_posts": pd.Series(dtype="int64"),
+            }
+        )
+    return feather.read_table(path).to_pandas()[OUTPUT_COLS]
+
+
+def state_from_csv(path: str = CSV_PATH) -> pd.DataFrame:
+    """
+    상태 파일 없이 update 를 처음 돌릴 때, 지금 CSV를 전체 빈도의 시작점으로 쓴다.
+    CSV가 상위 N개만 담고 있으면 그 밖의 단어 빈도는 알 수 없으므로 0에서 다시 센다.
+    """
+    df = read_keyword_csv(path)[OUTPUT_COLS]
+    return df.astype({"category": str, "word": str, "count": "int64", "total_posts": "int64"})
+
+
+def save_state(full: pd.DataFrame, path: str = STATE_PATH):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    table = pa.Table.from_pandas(full[OUTPUT_COLS].reset_index(drop=True), preserve_index=False)
+    feather.write_feather(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def apply_delta(state: pd.DataFrame, delta: PartialCounts):
+    """
+    새로 들어온 공고의 부분 카운터를 전체 빈도 테이블에 더한다.
+    바뀐 category의 행만 다시 집계하고 나머지 행은 그대로 둔다.
+    세는 비용만 새 공고 수에 비례한다. 상태 파일 / CSV / 샤드는 여전히 전체를 다시 쓴다.
+    반환값: (새 전체 테이블, 바뀐 category 목록)
+    """
+    changed = sorted(delta.posts)
+    if not changed:
+        return state, []
+
+    touched_mask = state["category"].isin(changed)
+    untouched = state[~touched_mask]
+    touched = state[touched_mask]
+
+    delta_df = delta.to_frame(top_n=None)
+    merged = (
+        pd.concat([touched[["category", "word", "count"]], delta_df[["category", "word", "count"]]])
+        .groupby(["category", "word"], sort=False, as_index=False)["count"]
+        .sum()
+    )
+
+    old_totals = touched.groupby("category")["total_posts"].first()
+    new_totals = old_totals.reindex(changed, fill_value=0) + pd.Series(delta.posts).reindex(changed)
+    merged["total_posts"] = merged["category"].map(new_totals).astype("int64")
+
+    full = pd.concat([untouched, merged[OUTPUT_COLS]], ignore_index=True)
+    return full, changed
+
+
+# === 5. 명령행 ===
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="원본 채용공고에서 직무별 키워드 빈도 CSV 생성")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="원본 공고 전체로 빈도 CSV를 새로 만든다")
+    build.add_argument("inputs", nargs="+", help="원본 공고 파일(.jsonl / .csv)")
+    build.add_argument("--out", default=CSV_PATH, help="출력 CSV 경로")
+    build.add_argument("--top-n", type=int, default=DEFAULT_TOP_N, help="category별 상위 단어 수 (0이면 전체 분포)")
+    build.add_argument("--category-field", default="category")
+    build.add_argument("--text-field", default="keywords")
+    build.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    build.add_argument("--workers", type=int, default=None)
+    build.add_argument("--state", default=STATE_PATH, help="전체 빈도 상태 파일 경로")
+    _add_dedup_arguments(build)
+    _add_trend_arguments(build)
+
+    update = sub.add_parser("update", help="새 공고만 기존 전체 빈도에 더해서 CSV를 갱신한다")
+    update.add_argument("inputs", nargs="+", help="새로 들어온 공고 파일(.jsonl / .csv)")
+    update.add_argument("--out", default=CSV_PATH, help="출력 CSV 경로")
+    update.add_argument("--top-n", type=int, default=DEFAULT_TOP_N, help="category별 상위 단어 수 (0이면 전체 분포)")
+    update.add_argument("--category-field", default="category")
+    update.add_argument("--text-field", default="keywords")
+    update.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    update.add_argument("--workers", type=int, default=None)
+    update.add_argument("--state", default=STATE_PATH, help="전체 빈도 상태 파일 경로")
+    update.add_argument("--init-from-csv", action="store_true",
+                        help="상태 파일이 없을 때 지금 --out CSV를 전체 빈도의 시작점으로 쓴다")
+    _add_dedup_arguments(update)
+    _add_trend_arguments(update)
+    return parser
+
+
+def _add_dedup_arguments(command: argparse.ArgumentParser):
+    command.add_argument("--dedup", action="store_true",
+                         help="빈도를 세기 전에 재등록/중복 게시된 공고를 MinHash LSH로 걸러낸다")
+    command.add_argument("--dedup-field", default=None,
+                         help="중복 비교에 쓸 공고 본문 필드 (--dedup 이면 필수). update 는 새 입력 안에서만 비교하므로 "
+                              "이전 update 에서 이미 센 공고의 재등록은 걸러지지 않는다")
+    command.add_argument("--dedup-threshold", type=float, default=None,
+                         help="중복으로 볼 추정 자카드 유사도 하한 (기본: dedup.DEFAULT_THRESHOLD)")
+    command.add_argument("--dedup-report", default=None, help="category별 감소량 CSV 저장 경로")
+
+
+def _add_trend_arguments(command: argparse.ArgumentParser):
+    from trends import DEFAULT_TREND_TOP_N, DEFAULT_WINDOW, TREND_STATE_PATH, TRENDS_PATH
+
+    command.add_argument("--period-field", default=None,
+                         help="게시일 필드. 주면 월별 빈도와 추세(이동 평균, 증가율)를 함께 만든다")
+    command.add_argument("--trend-window", type=_positive_int, default=DEFAULT_WINDOW, help="이동 구간(개월, 1 이상)")
+    command.add_argument("--trend-top-n", type=int, default=DEFAULT_TREND_TOP_N,
+                         help="category별 추세를 남길 단어 수 (0이면 전체)")
+    command.add_argument("--trend-state", default=TREND_STATE_PATH, help="월별 빈도 상태 파일 경로")
+    command.add_argument("--trends-out", default=TRENDS_PATH, help="추세 테이블 Feather 경로")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상의 정수여야 합니다: {value}")
+    return number
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # 상태 파일 없이 update 하면 지금까지의 빈도가 빈 표로 취급되어 CSV가 새 공고분만 남는다 → 먼저 막는다
+    # 키워드 태그처럼 짧은 필드로 비교하면 다른 공고도 중복으로 묶이므로 본문 필드를 꼭 받는다
+    if args.dedup and not args.dedup_field:
+        parser.error("--dedup 에는 공고 본문 필드(--dedup-field)가 필요합니다.")
+    if args.dedup_threshold is not None and not 0 < args.dedup_threshold <= 1:
+        parser.error(f"--dedup-threshold 는 0보다 크고 1 이하여야 합니다: {args.dedup_threshold}")
+
+    state = None
+    if args.command == "update":
+        if os.path.exists(args.state):
+            state = load_state(args.state)
+        elif args.init_from_csv:
+            try:
+                state = state_from_csv(args.out)
+            except (FileNotFoundError, KeyError) as e:
+                parser.error(f"--init-from-csv: {e}")
+        else:
+            parser.error(
+                f"상태 파일이 없습니다: {args.state}\n"
+                "처음이면 build 로 전체를 만들고, 지금 CSV에 이어서 더하려면 --init-from-csv 를 주세요."
+            )
+
+    keep = None
+    if args.dedup:
+        from dedup import DEFAULT_THRESHOLD, MIN_TEXT_LENGTH, find_duplicates  # dedup 이 이 모듈을 import 하므로 쓸 때만
+
+        result = find_duplicates(
+            args.inputs,
+            dedup_field=args.dedup_field,
+            category_field=args.category_field,
+            text_field=args.text_field,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            threshold=args.dedup_threshold or DEFAULT_THRESHOLD,
+        )
+        keep = result.keep
+        print(f"🧹 중복 공고 {result.removed}건 제외 (전체 {len(keep)}건)")
+        if result.too_short:
+            print(f"   ⚠️ 본문이 없거나 {MIN_TEXT_LENGTH}자보다 짧은 공고 {result.too_short}건은 비교하지 않고 그대로 셉니다")
+        for row in result.report[result.report["removed_posts"] > 0].itertuples(index=False):
+            print(
+                f"   - {row.category}: 공고 {row.posts} → {row.unique_posts} (-{row.shrink_ratio:.1%}), "
+                f"키워드 {row.keywords} → {row.unique_keywords}"
+            )
+        if args.dedup_report:
+            result.report.to_csv(args.dedup_report, index=False, encoding="utf-8-sig")
+
+    counts = count_postings(
+        args.inputs,
+        category_field=args.category_field,
+        text_field=args.text_field,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        keep=keep,
+        period_field=args.period_field,
+    )
+
+    trend_delta = None
+    if args.period_field:
+        from trends import split_periods  # trends 가 이 모듈을 import 하므로 쓸 때만
+
+        counts, trend_delta = split_periods(counts)
+
+    if args.command == "build":
+        full = counts.to_frame(top_n=None)
+        changed = sorted(counts.posts)
+    else:
+        full, changed = apply_delta(state, counts)
+
+    # 추세까지 모두 계산한 뒤에 저장한다 (중간에 실패해도 CSV / 상태 파일 / 추세 파일이 서로 어긋나지 않게)
+    trends = None
+    if trend_delta is not None:
+        from trends import build_trends, load_trend_state, merge_trend_counts
+
+        if args.command == "build":
+            trend_state = trend_delta
+        else:
+            trend_state = merge_trend_counts(load_trend_state(args.trend_state), trend_delta)
+        trends = build_trends(trend_state, args.trend_window, args.trend_top_n)
+    output = top_n_frame(full, args.top_n)
+
+    save_state(full, args.state)
+    write_keyword_csv(output, args.out)
+    print(f"✅ 공고 {sum(counts.posts.values())}건 반영, 바뀐 직무 {len(changed)}개 → {args.out}")
+    for category in changed:
+        print(f"   - {category}")
+
+    if trends is not None:
+        from trends import save_trend_state, save_trends
+
+        save_trend_state(trend_state, args.trend_state)
+        save_trends(trends, args.trends_out, args.trend_window)
+        print(f"📈 {trend_state['period'].nunique()}개월 추세 (이동 구간 {args.trend_window}개월) → {args.trends_out}")
+
+
+if __name__ == "__main__":
+    main()
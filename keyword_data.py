@@ -0,0 +1,350 @@
+import codecs
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import metrics
+
+# === 0. 경로/파일 설정 ===
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CSV_NAME = "직무별_단순빈도_TOP10(final).csv"
+CSV_PATH = os.path.join(BASE_DIR, CSV_NAME)
+
+REQUIRED_COLS = {"category", "word", "count", "total_posts"}
+
+# CSV 옆에 저장하는 바이너리(Feather) 캐시
+CACHE_SUFFIX = ".cache.feather"
+CACHE_META_KEY = b"keyword_cache"
+CACHE_VERSION = 3
+
+# 사전 인코딩(categorical)으로 저장할 문자열 컬럼 / 가장 좁은 정수형으로 줄일 컬럼
+CATEGORICAL_COLS = ("category", "word")
+INTEGER_COLS = ("count", "total_posts")
+
+
+# === 1. CSV 읽기 ===
+def read_keyword_csv(path: str = CSV_PATH, encoding: str = None) -> pd.DataFrame:
+    """
+    키워드 빈도 CSV 파일을 읽어서 DataFrame으로 반환.
+    encoding을 모르면 utf-8-sig → cp949 순으로 시도.
+    필수 컬럼: category, word, count, total_posts
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {path}")
+
+    if encoding is not None:
+        df = pd.read_csv(path, encoding=encoding)
+    else:
+        try:
+            df = pd.read_csv(path, encoding="utf-8-sig")
+        except UnicodeDecodeError:
+            df = pd.read_csv(path, encoding="cp949")
+
+    # 필요한 컬럼이 있는지 확인
+    missing = REQUIRED_COLS - set(df.columns)
+    if missing:
+        raise KeyError(f"다음 컬럼이 CSV에 없습니다: {missing}")
+
+    return df
+
+
+# === 1-1. 메모리 압축 ===
+def compact_keyword_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    category, word 는 categorical(사전 인코딩)로,
+    count, total_posts 는 값이 들어가는 가장 좁은 정수형으로 바꾼 DataFrame을 반환.
+    """
+    compact = df.copy()
+    for col in CATEGORICAL_COLS:
+        if col in compact.columns and not isinstance(compact[col].dtype, pd.CategoricalDtype):
+            compact[col] = compact[col].astype("category")
+    for col in INTEGER_COLS:
+        if col in compact.columns and pd.api.types.is_integer_dtype(compact[col]):
+            compact[col] = pd.to_numeric(compact[col], downcast="integer")
+    return compact
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> dict:
+    """
+    컬럼별 메모리 사용량(바이트, deep=True)을 압축 전/후로 비교한 dict.
+    """
+    before_usage = before.memory_usage(index=False, deep=True)
+    after_usage = after.memory_usage(index=False, deep=True)
+    columns = {
+        col: {
+            "dtype_before": str(before[col].dtype),
+            "dtype_after": str(after[col].dtype),
+            "bytes_before": int(before_usage[col]),
+            "bytes_after": int(after_usage[col]),
+        }
+        for col in before.columns
+    }
+    total_before = int(before_usage.sum())
+    total_after = int(after_usage.sum())
+    return {
+        "rows": len(before),
+        "columns": columns,
+        "bytes_before": total_before,
+        "bytes_after": total_after,
+        "ratio": total_after / total_before if total_before else 1.0,
+    }
+
+
+def sort_keyword_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    (category 오름차순, count 내림차순)으로 안정 정렬.
+    캐시를 이 순서로 저장해 두면 build_category_index가 다시 정렬(=전체 복사)하지 않는다.
+    """
+    ordered = df.sort_values(["category", "count"], ascending=[True, False], kind="stable")
+    return ordered.reset_index(drop=True)
+
+
+# === 1-2. 바이너리 캐시 ===
+def cache_path_for(path: str) -> str:
+    return path + CACHE_SUFFIX
+
+
+def _source_stat(path: str) -> dict:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def source_stamp(path: str = CSV_PATH) -> tuple:
+    """
+    st.cache_data 키로 쓰는 (크기, mtime) 값. CSV가 바뀌면 값이 달라져서 앱 재시작 없이 다시 읽는다.
+    """
+    try:
+        stat = _source_stat(path)
+    except FileNotFoundError:
+        return (None, None)
+    return (stat["size"], stat["mtime_ns"])
+
+
+def _hash_and_detect_encoding(path: str):
+    """
+    파일을 한 번만 훑으면서 sha256과 인코딩(utf-8-sig / cp949)을 같이 구한다.
+    """
+    digest = hashlib.sha256()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    encoding = "utf-8-sig"
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+            if encoding == "utf-8-sig":
+                try:
+                    decoder.decode(chunk)
+                except UnicodeDecodeError:
+                    encoding = "cp949"
+    if encoding == "utf-8-sig":
+        try:
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            encoding = "cp949"
+    return digest.hexdigest(), encoding
+
+
+def _read_cache_meta(cache_path: str):
+    try:
+        with pa.memory_map(cache_path) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    raw = metadata.get(CACHE_META_KEY)
+    if raw is None:
+        return None
+    meta = json.loads(raw)
+    if meta.get("version") != CACHE_VERSION:
+        return None
+    return meta
+
+
+def _read_cache(cache_path: str) -> pd.DataFrame:
+    return feather.read_table(cache_path, memory_map=True).to_pandas()
+
+
+def _write_cache(cache_path: str, df: pd.DataFrame, meta: dict):
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체. 쓰기 권한이 없으면 캐시 없이 진행.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[CACHE_META_KEY] = json.dumps({**meta, "version": CACHE_VERSION})
+    table = table.replace_schema_metadata(metadata)
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_keyword_frame(path: str = CSV_PATH, use_cache: bool = True) -> pd.DataFrame:
+    """
+    CSV 옆의 Feather 캐시가 유효하면 캐시를, 아니면 CSV를 읽어서 반환.
+    반환되는 DataFrame은 compact_keyword_frame으로 압축되고 sort_keyword_frame 순서로 정렬된 형태.
+    - 크기/mtime이 같으면 해시 계산 없이 캐시 사용
+    - 크기/mtime이 달라도 내용 해시가 같으면 캐시 사용 (메타만 갱신)
+    - CSV를 다시 읽을 때는 감지해 둔 인코딩으로 한 번만 파싱
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {path}")
+    if not use_cache:
+        with metrics.timer("csv_parse"):
+            return sort_keyword_frame(compact_keyword_frame(read_keyword_csv(path)))
+
+    cache_path = cache_path_for(path)
+    stat = _source_stat(path)
+    meta = _read_cache_meta(cache_path)
+    if meta and meta["size"] == stat["size"] and meta["mtime_ns"] == stat["mtime_ns"]:
+        metrics.count("feather_cache_hit")
+        with metrics.timer("cache_read"):
+            return _read_cache(cache_path)
+
+    sha256, encoding = _hash_and_detect_encoding(path)
+    if meta and meta["sha256"] == sha256:
+        metrics.count("feather_cache_hit")
+        with metrics.timer("cache_read"):
+            df = _read_cache(cache_path)
+    else:
+        metrics.count("feather_cache_miss")
+        with metrics.timer("csv_parse"):
+            df = sort_keyword_frame(compact_keyword_frame(read_keyword_csv(path, encoding=encoding)))
+
+    _write_cache(cache_path, df, {**stat, "sha256": sha256, "encoding": encoding})
+    return df
+
+
+# === 2. category 인덱스 ===
+@dataclass(frozen=True)
+class KeywordTable:
+    """
+    원본 DataFrame과 category별로 미리 정렬해 둔 행 묶음.
+    by_category[직무] 는 count 내림차순 정렬 + rank, ratio 컬럼이 붙은 DataFrame.
+    versions[직무] 는 그 직무 행 내용의 해시 → 바뀐 직무만 다시 계산할 때 캐시 키로 사용.
+    version 은 전체 테이블의 데이터 버전(직무별 버전을 합친 해시).
+    """
+
+    df: pd.DataFrame
+    empty: pd.DataFrame
+    by_category: dict = field(default_factory=dict)
+    categories: list = field(default_factory=list)
+    versions: dict = field(default_factory=dict)
+    version: str = ""
+
+    def rows(self, category_value) -> pd.DataFrame:
+        """
+        선택한 category의 정렬된 행을 O(1)로 반환. 없는 category면 빈 DataFrame.
+        """
+        return self.by_category.get(category_value, self.empty)
+
+    def top_k(self, category_value, k: int = 10, offset: int = 0) -> pd.DataFrame:
+        """
+        count 기준 [offset, offset + k) 순위 구간.
+        인덱스를 만들 때 직무별로 한 번 정렬해 두었으므로 조회 때는 정렬 없이 O(k) 슬라이스만 한다.
+        """
+        return self.rows(category_value).iloc[offset:offset + k]
+
+    def n_keywords(self, category_value) -> int:
+        return len(self.rows(category_value))
+
+    def total_posts(self, category_value):
+        rows = self.rows(category_value)
+        return int(rows["total_posts"].iloc[0]) if len(rows) else None
+
+    @property
+    def columns(self) -> list:
+        return list(self.df.columns)
+
+
+def _is_index_ordered(df: pd.DataFrame) -> bool:
+    """
+    category 값이 모두 있고, 이미 sort_keyword_frame 순서인지 (categorical 코드 기준으로) 확인.
+    """
+    category = df["category"]
+    if not isinstance(category.dtype, pd.CategoricalDtype):
+        return False
+    codes = category.cat.codes.to_numpy()
+    if len(codes) and codes.min() < 0:
+        return False
+    count = df["count"].to_numpy()
+    step = codes[1:] > codes[:-1]
+    same = (codes[1:] == codes[:-1]) & (count[1:] <= count[:-1])
+    return bool(np.all(step | same))
+
+
+def build_category_index(df: pd.DataFrame) -> KeywordTable:
+    """
+    전체 테이블을 (category, count 내림차순)으로 한 번만 정렬하고,
+    rank / ratio 컬럼을 벡터 연산 한 번으로 계산한 뒤 category 경계로 잘라 둔다.
+    load_keyword_frame 결과처럼 이미 정렬된 테이블이면 정렬을 건너뛰고,
+    KeywordTable.df 도 정렬된 테이블의 컬럼을 그대로 공유해서 데이터 사본을 하나만 갖는다.
+    """
+    if _is_index_ordered(df):
+        ordered = df.reset_index(drop=True)  # copy-on-write: 실제 복사 없음
+    else:
+        ordered = sort_keyword_frame(df[df["category"].notna()])
+    columns = list(df.columns)
+
+    # 정렬된 category 값이 바뀌는 위치 = 각 그룹의 시작점
+    # categorical이면 문자열 배열을 만들지 않고 코드(정수)로 비교
+    category = ordered["category"]
+    if isinstance(category.dtype, pd.CategoricalDtype):
+        keys = category.cat.codes.to_numpy()
+        labels = category.cat.categories
+    else:
+        keys = category.to_numpy()
+        labels = None
+    if len(keys):
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    else:
+        starts = np.array([], dtype=np.int64)
+    ends = np.r_[starts[1:], len(keys)]
+    cats = [labels[keys[s]] if labels is not None else keys[s] for s in starts]
+
+    ordered["rank"] = np.arange(len(keys), dtype=np.int64) - np.repeat(starts, ends - starts) + 1
+    ordered["ratio"] = ordered["count"] / ordered["total_posts"]
+
+    by_category = {
+        c: ordered.iloc[s:e].reset_index(drop=True)
+        for c, s, e in zip(cats, starts, ends)
+    }
+
+    # 행 해시를 category 구간별로 합산 → 직무별 데이터 버전
+    row_hash = pd.util.hash_pandas_object(
+        ordered[["word", "count", "total_posts"]], index=False
+    ).to_numpy()
+    group_hash = np.add.reduceat(row_hash, starts) if len(starts) else row_hash[:0]
+    versions = {
+        c: f"{e - s:x}-{h:016x}"
+        for c, s, e, h in zip(cats, starts, ends, group_hash)
+    }
+
+    version = hashlib.sha1(
+        "\n".join(f"{c}\t{v}" for c, v in versions.items()).encode("utf-8")
+    ).hexdigest()[:16]
+
+    return KeywordTable(
+        df=ordered[columns],
+        empty=ordered.iloc[0:0],
+        by_category=by_category,
+        categories=list(by_category),
+        versions=versions,
+        version=version,
+    )
+
+
+if __name__ == "__main__":
+    # python keyword_data.py [CSV 경로] → 압축 전/후 메모리 사용량 출력
+    import sys
+
+    source = sys.argv[1] if len(sys.argv) > 1 else CSV_PATH
+    raw = read_keyword_csv(source)
+    print(json.dumps(memory_report(raw, compact_keyword_frame(raw)), ensure_ascii=False, indent=2))
@@ -0,0 +1,109 @@
+import logging
+import threading
+import weakref
+
+import metrics
+from keyword_data import CSV_PATH, KeywordTable, source_stamp
+from keyword_shards import load_keyword_table
+
+# === 0. 기본 설정 ===
+POLL_INTERVAL = 2.0  # 초. CSV 변경 여부(크기, mtime)를 이 간격으로 확인
+
+logger = logging.getLogger("keyword_data_service")
+
+
+# === 1. 공유 데이터 서비스 ===
+class KeywordDataService:
+    """
+    프로세스 전체가 함께 쓰는 KeywordTable 하나 (CSV 옆 직무별 샤드를 여는 ShardedKeywordTable).
+    - 첫 로드만 생성자 안에서 끝낸다 (데이터 없이는 화면을 그릴 수 없음)
+    - 이후 CSV 변경은 백그라운드 감시 스레드가 확인해서 새 테이블을 다 만든 뒤
+      참조 하나만 바꿔 끼운다. 세션은 다시 만드는 동안에도 기존 테이블을 그대로 읽는다.
+    - 다시 만들다 실패하면 기존 테이블을 유지하고 last_error 에 남긴다.
+    table() 이 돌려주는 객체는 모든 세션이 공유하므로 읽기 전용으로만 쓴다.
+    """
+
+    def __init__(self, csv_path: str = CSV_PATH, poll_interval: float = POLL_INTERVAL,
+                 watch: bool = True):
+        self.csv_path = csv_path
+        self.poll_interval = poll_interval
+        self.last_error = None
+        self.reloads = 0
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._stamp = None
+        self._pending = None
+        self._table = None
+
+        self.reload()
+        if watch:
+            threading.Thread(
+                target=_watch,
+                args=(weakref.ref(self), self._stop, poll_interval),
+                name="keyword-data-watcher",
+                daemon=True,
+            ).start()
+
+    def table(self) -> KeywordTable:
+        # 참조 읽기 한 번 → 교체 중이어도 잠금 없이 완성된 테이블 중 하나를 받는다
+        return self._table
+
+    @property
+    def version(self) -> str:
+        return self._table.version
+
+    def reload(self) -> bool:
+        """
+        CSV의 (크기, mtime)이 바뀌었으면 새 테이블을 만들어 교체. 교체했으면 True.
+        내용(데이터 버전)이 그대로면 기존 객체를 유지해서 버전별 캐시도 그대로 쓴다.
+        """
+        with self._reload_lock:
+            stamp = source_stamp(self.csv_path)
+            if self._table is not None and stamp == self._stamp:
+                return False
+            # 실패해도 같은 파일로 계속 다시 시도하지 않도록 먼저 기록
+            self._stamp = stamp
+            with metrics.timer("data_service_reload"):
+                table = load_keyword_table(self.csv_path)
+            self.last_error = None
+            if self._table is not None and table.version == self._table.version:
+                return False
+            self._table = table
+            self.reloads += 1
+            metrics.count("data_service_swap")
+            return True
+
+    def poll(self) -> bool:
+        """
+        감시 스레드가 부르는 확인 단계. 파일을 쓰는 도중에 반쯤 읽지 않도록,
+        (크기, mtime)이 두 번 연속 같은 값으로 보일 때까지 기다렸다가 reload 한다.
+        """
+        stamp = source_stamp(self.csv_path)
+        if stamp == self._stamp:
+            self._pending = None
+            return False
+        if stamp != self._pending:
+            self._pending = stamp
+            return False
+        self._pending = None
+        return self.reload()
+
+    def close(self):
+        self._stop.set()
+
+
+def _watch(service_ref, stop: threading.Event, interval: float):
+    """
+    서비스 객체를 약한 참조로만 들고 있어서, 서비스가 버려지면 스레드도 끝난다.
+    """
+    while not stop.wait(interval):
+        service = service_ref()
+        if service is None:
+            return
+        try:
+            service.poll()
+        except Exception as e:  # 기존 테이블로 계속 서비스
+            service.last_error = e
+            metrics.count("data_service_reload_error")
+            logger.warning("키워드 데이터를 다시 읽지 못했습니다 (기존 데이터 유지): %s", e)
+        del service
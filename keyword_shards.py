@@ -0,0 +1,339 @@
+import json
+import os
+import shutil
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import metrics
+from keyword_data import (
+    CSV_PATH,
+    KeywordTable,
+    _hash_and_detect_encoding,
+    _source_stat,
+    build_category_index,
+    load_keyword_frame,
+)
+from ranking import RANKINGS, KeywordRanking, build_ranking, ranking_bounds
+from recommender import DEFAULT_NEIGHBORS, SimilarCategories, build_keyword_matrix, build_similar_categories
+
+# === 0. 경로/파일 설정 ===
+# CSV 옆에 만드는 직무별 샤드 디렉터리: manifest.json + v<형식 버전>-<데이터 버전>/<샤드 번호>.feather
+SHARD_SUFFIX = ".shards"
+MANIFEST_NAME = "manifest.json"
+SHARD_FORMAT_VERSION = 2
+
+# 0이면 직무마다 파일 하나, N이면 직무 이름 해시로 N개 파일에 나눠 담는다 (직무가 아주 많을 때)
+DEFAULT_BUCKETS = 0
+# 한 프로세스가 메모리에 들고 있는 직무 수 상한 (오래 안 본 직무부터 내린다)
+SHARD_CACHE_SIZE = 64
+# 이전 버전 디렉터리를 몇 개까지 남길지 (아직 예전 manifest로 읽는 프로세스를 위해)
+KEEP_VERSIONS = 2
+# 샤드를 쓸 때 미리 계산해 두는 직무별 비슷한 직무 수 (app.py 는 이 중 앞쪽 몇 개만 쓴다)
+SIMILAR_NEIGHBORS = DEFAULT_NEIGHBORS
+
+
+def shard_dir_for(path: str) -> str:
+    return path + SHARD_SUFFIX
+
+
+# === 1. 샤드 쓰기 ===
+def write_shards(table: KeywordTable, directory: str, source: dict, buckets: int = DEFAULT_BUCKETS) -> dict:
+    """
+    build_category_index 결과를 직무별(또는 해시 버킷별) Feather 파일로 나눠 쓰고 manifest를 반환.
+    데이터 버전별 하위 디렉터리에 파일을 모두 쓴 뒤 manifest.json 을 마지막에 교체하므로,
+    읽는 쪽은 항상 완성된 한 버전만 본다.
+    직무를 가로지르는 계산(정렬 기준별 점수, 비슷한 직무)은 전체 표가 메모리에 있는 여기서 미리 해 두어,
+    앱은 샤드를 모두 읽지 않고 결과만 연다.
+    """
+    columns = list(table.df.columns)
+    # 형식 버전도 이름에 넣는다: 예전 형식으로 쓴 같은 데이터 버전 디렉터리(랭킹 파일 등이 없음)를 다시 쓰지 않도록
+    version_name = f"v{SHARD_FORMAT_VERSION}-{table.version}"
+    version_dir = os.path.join(directory, version_name)
+    tmp_dir = f"{version_dir}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    # 문자열은 사전(categorical) 대신 일반 문자열로 저장: 직무 하나 안에서는 단어가 겹치지 않아서
+    # 사전이 이득이 없고, 파일마다 전체 단어 사전이 따라 들어가지도 않는다
+    arrow = pa.Table.from_pandas(table.df, preserve_index=False)
+    arrow = pa.table(
+        {
+            c: arrow.column(c).cast(arrow.schema.field(c).type.value_type)
+            if pa.types.is_dictionary(arrow.schema.field(c).type) else arrow.column(c)
+            for c in columns
+        }
+    )
+    starts = np.cumsum([0] + [table.n_keywords(c) for c in table.categories])
+
+    groups = {}
+    for i, c in enumerate(table.categories):
+        bucket = zlib.crc32(str(c).encode("utf-8")) % buckets if buckets else i
+        groups.setdefault(bucket, []).append(i)
+
+    entries = {}
+    for bucket, members in sorted(groups.items()):
+        file_name = f"{bucket:06d}.feather"
+        offset = 0
+        parts = []
+        for i in members:
+            c = table.categories[i]
+            n_rows = int(starts[i + 1] - starts[i])
+            entries[c] = {
+                "file": f"{version_name}/{file_name}",
+                "offset": offset,
+                "rows": n_rows,
+                "total_posts": table.total_posts(c) or 0,
+                "version": table.versions[c],
+            }
+            offset += n_rows
+            parts.append(arrow.slice(int(starts[i]), n_rows))
+        feather.write_feather(
+            pa.concat_tables(parts) if len(parts) > 1 else parts[0],
+            os.path.join(tmp_dir, file_name),
+            compression="uncompressed",
+        )
+
+    # 정렬 기준별 점수/순서: 직무 순서로 이어 붙인 배열 두 개 (memory-map으로 열어 필요한 구간만 읽는다)
+    rankings = {}
+    for method in RANKINGS:
+        ranking = build_ranking(table, method)
+        file_name = f"ranking_{method}.feather"
+        feather.write_feather(
+            pa.table({"score": ranking.score.astype(np.float64), "order": ranking.order}),
+            os.path.join(tmp_dir, file_name),
+            compression="uncompressed",
+        )
+        rankings[method] = f"{version_name}/{file_name}"
+
+    # 비슷한 직무: 직무마다 [이웃 번호, 유사도] 목록
+    similar = build_similar_categories(build_keyword_matrix(table), SIMILAR_NEIGHBORS)
+    for i, c in enumerate(table.categories):
+        entries[c]["similar"] = [
+            [int(j), round(float(s), 6)] for j, s in zip(similar.neighbors[i], similar.scores[i]) if j >= 0
+        ]
+
+    # 같은 데이터 버전이 이미 있으면(다른 프로세스가 먼저 썼으면) 그것을 그대로 쓴다
+    if not os.path.isdir(version_dir):
+        try:
+            os.replace(tmp_dir, version_dir)
+        except OSError:
+            if not os.path.isdir(version_dir):
+                raise
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    manifest = {
+        "format": SHARD_FORMAT_VERSION,
+        "source": source,
+        "version": table.version,
+        "columns": columns,
+        "rankings": rankings,
+        "categories": [{"name": c, **entries[c]} for c in table.categories],
+    }
+    _write_manifest(directory, manifest)
+    _remove_old_versions(directory, version_name)
+    return manifest
+
+
+def _write_manifest(directory: str, manifest: dict):
+    path = os.path.join(directory, MANIFEST_NAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _remove_old_versions(directory: str, current: str):
+    versions = [
+        entry for entry in os.scandir(directory)
+        if entry.is_dir() and not entry.name.endswith(".tmp") and entry.name != current
+    ]
+    versions.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for entry in versions[KEEP_VERSIONS - 1:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def read_manifest(directory: str):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("format") == SHARD_FORMAT_VERSION else None
+
+
+# === 2. 지연 로딩 테이블 ===
+class ShardedKeywordTable:
+    """
+    KeywordTable 과 같은 방식으로 쓰는 테이블. 직무 목록, 직무별 버전, total_posts, 키워드 수는
+    manifest 만 읽어서 알고, 행은 그 직무를 처음 조회할 때 샤드 파일을 memory-map으로 열어 꺼낸다.
+    → 시작 시간과 메모리가 전체 데이터 크기가 아니라 사용자가 연 직무 수에 비례한다.
+    정렬 기준별 점수와 비슷한 직무는 샤드를 쓸 때 미리 계산해 둔 것을 연다 (ranking, similar_categories).
+    df 는 모든 샤드를 이어 붙인 표로, 검색 색인 / 보유 역량 매칭 / 원본 전체 보기처럼 직무를 가로질러야
+    하는 기능을 처음 쓸 때 한 번만 만들고 이 객체(데이터 버전 하나)에 두고 함께 쓴다.
+    모든 세션이 공유하므로 읽기 전용으로만 쓴다.
+    """
+
+    def __init__(self, directory: str, manifest: dict, cache_size: int = SHARD_CACHE_SIZE):
+        self.directory = directory
+        self.manifest = manifest
+        self.version = manifest["version"]
+        self.columns = manifest["columns"]
+        self._entries = {entry["name"]: entry for entry in manifest["categories"]}
+        self.categories = list(self._entries)
+        self.versions = {c: entry["version"] for c, entry in self._entries.items()}
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._rows = OrderedDict()
+        self._df = None
+        self._df_lock = threading.Lock()
+
+    # --- manifest 만으로 답하는 조회 ---
+    def n_keywords(self, category_value) -> int:
+        entry = self._entries.get(category_value)
+        return entry["rows"] if entry else 0
+
+    def total_posts(self, category_value):
+        entry = self._entries.get(category_value)
+        return entry["total_posts"] if entry else None
+
+    # --- 직무 행 (처음 볼 때 읽기) ---
+    def _read(self, entry: dict) -> pd.DataFrame:
+        table = feather.read_table(os.path.join(self.directory, entry["file"]), memory_map=True)
+        rows = table.slice(entry["offset"], entry["rows"]).to_pandas()
+        rows["rank"] = np.arange(1, len(rows) + 1, dtype=np.int64)
+        rows["ratio"] = rows["count"] / rows["total_posts"]
+        return rows
+
+    def rows(self, category_value) -> pd.DataFrame:
+        with self._lock:
+            rows = self._rows.get(category_value)
+            if rows is not None:
+                self._rows.move_to_end(category_value)
+                return rows
+        entry = self._entries.get(category_value)
+        if entry is None:
+            return self.empty
+
+        with metrics.timer("shard_read"):
+            rows = self._read(entry)
+        with self._lock:
+            self._rows[category_value] = rows
+            while len(self._rows) > self.cache_size:
+                self._rows.popitem(last=False)
+        return rows
+
+    def top_k(self, category_value, k: int = 10, offset: int = 0) -> pd.DataFrame:
+        return self.rows(category_value).iloc[offset:offset + k]
+
+    @property
+    def empty(self) -> pd.DataFrame:
+        return pd.DataFrame({c: pd.Series(dtype=object) for c in self.columns + ["rank", "ratio"]})
+
+    # --- 샤드를 쓸 때 미리 계산한 결과 ---
+    def ranking(self, method: str) -> KeywordRanking:
+        """
+        정렬 기준별 점수/순서 배열을 memory-map으로 연다. 조회한 직무 구간만 실제로 읽힌다.
+        """
+        file_name = self.manifest.get("rankings", {}).get(method)
+        if file_name is None:
+            return build_ranking(self, method)
+        arrays = feather.read_table(os.path.join(self.directory, file_name), memory_map=True)
+        return KeywordRanking(
+            method=method,
+            table=self,
+            score=arrays.column("score").to_numpy(),
+            order=arrays.column("order").to_numpy(),
+            bounds=ranking_bounds(self),
+        )
+
+    def similar_categories(self) -> SimilarCategories:
+        keep = max((len(entry.get("similar", [])) for entry in self._entries.values()), default=0)
+        neighbors = np.full((len(self.categories), keep), -1, dtype=np.int32)
+        scores = np.zeros((len(self.categories), keep), dtype=np.float32)
+        for i, c in enumerate(self.categories):
+            for j, (neighbor, score) in enumerate(self._entries[c].get("similar", [])):
+                neighbors[i, j] = neighbor
+                scores[i, j] = score
+        return SimilarCategories(
+            self.categories, {c: i for i, c in enumerate(self.categories)}, neighbors, scores
+        )
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        모든 직무 행 (직무 순서, count 내림차순). 처음 쓸 때 한 번만 만들고 이후에는 같은 객체를 돌려준다.
+        """
+        if self._df is None:
+            with self._df_lock:
+                if self._df is None:
+                    self._df = self._read_all()
+        return self._df
+
+    def _read_all(self) -> pd.DataFrame:
+        with metrics.timer("shard_read_all"):
+            files = dict.fromkeys(entry["file"] for entry in self._entries.values())
+            tables = [feather.read_table(os.path.join(self.directory, f), memory_map=True) for f in files]
+            if not tables:
+                return self.empty[self.columns]
+            combined = pa.concat_tables(tables).combine_chunks()
+            # 전체를 이어 붙일 때는 같은 단어가 여러 직무에 나오므로 사전 인코딩해서 넘긴다
+            combined = pa.table(
+                {
+                    c: combined.column(c).dictionary_encode() if pa.types.is_string(combined.schema.field(c).type)
+                    or pa.types.is_large_string(combined.schema.field(c).type) else combined.column(c)
+                    for c in combined.column_names
+                }
+            )
+            df = combined.to_pandas()
+        # 해시 버킷이면 파일 순서와 직무 순서가 다르므로 manifest 순서로 맞춘다
+        category = pd.Categorical(df["category"], categories=self.categories)
+        if not pd.Series(category.codes).is_monotonic_increasing:
+            order = np.argsort(category.codes, kind="stable")
+            df = df.iloc[order].reset_index(drop=True)
+            category = category[order]
+        df["category"] = category
+        return df[self.columns]
+
+
+# === 3. 열기 (없거나 오래되었으면 만들기) ===
+def load_keyword_table(path: str = CSV_PATH, directory: str = None, buckets: int = DEFAULT_BUCKETS):
+    """
+    manifest 가 CSV와 맞으면(크기/mtime, 아니면 내용 해시) manifest 만 읽어서 바로 연다.
+    아니면 CSV(또는 Feather 캐시)를 한 번 읽어 샤드를 다시 쓰고, 전체 테이블은 버린 채 샤드 쪽을 연다.
+    샤드를 쓸 수 없는 환경(읽기 전용 등)이면 메모리에 만든 KeywordTable 을 그대로 반환.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {path}")
+    directory = directory or shard_dir_for(path)
+    stat = _source_stat(path)
+    manifest = read_manifest(directory)
+    source = manifest.get("source", {}) if manifest else {}
+    if manifest and source.get("size") == stat["size"] and source.get("mtime_ns") == stat["mtime_ns"]:
+        metrics.count("shard_manifest_hit")
+        return ShardedKeywordTable(directory, manifest)
+
+    sha256, _ = _hash_and_detect_encoding(path)
+    if manifest and source.get("sha256") == sha256:
+        metrics.count("shard_manifest_hit")
+        manifest["source"] = {**stat, "sha256": sha256}
+        try:
+            _write_manifest(directory, manifest)
+        except OSError:
+            pass
+        return ShardedKeywordTable(directory, manifest)
+
+    metrics.count("shard_manifest_miss")
+    table = build_category_index(load_keyword_frame(path))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with metrics.timer("shard_write"):
+            manifest = write_shards(table, directory, {**stat, "sha256": sha256}, buckets)
+    except OSError:
+        return table
+    return ShardedKeywordTable(directory, manifest)
@@ -0,0 +1,273 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime, timezone
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from keyword_data import BASE_DIR
+
+# === 0. 기본 설정 ===
+DEFAULT_SESSIONS = [1, 5, 10, 25, 50]
+DEFAULT_DURATION = 20.0  # 초. 동시 세션 수 단계마다 측정 시간
+DEFAULT_THINK = 0.5  # 초. 한 세션이 클릭 사이에 쉬는 평균 시간
+SERVER_START_TIMEOUT = 60.0
+
+# 세션이 무작위로 바꾸는 위젯 종류와 WidgetState 값 필드
+CHOICE_WIDGETS = {"selectbox": "string_value", "radio": "string_value"}
+
+
+# === 1. Streamlit 웹소켓 세션 ===
+class StreamlitSession:
+    """
+    브라우저 탭 하나를 흉내 내는 웹소켓 클라이언트.
+    서버가 보내 주는 위젯 목록을 기억해 두었다가, 값을 바꿔서 rerun(BackMsg)을 보낸다.
+    fragment 안의 위젯을 바꾸면 브라우저처럼 fragment_id를 붙여 그 fragment만 다시 실행시킨다.
+    """
+
+    def __init__(self, url: str, rng: random.Random):
+        self.url = url
+        self.rng = rng
+        self.ws = None
+        self.widgets = {}  # (종류, 라벨, 순서) → (id, fragment_id, options)
+        self.states = {}  # id → WidgetState
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url, max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, fragment_id: str = "") -> dict:
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        client_state.query_string = ""
+        client_state.page_script_hash = ""
+        client_state.widget_states.widgets.extend(self.states.values())
+        if fragment_id:
+            client_state.fragment_id = fragment_id
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+
+        seen = {}
+        n_bytes = 0
+        n_msgs = 0
+        while True:
+            raw = await self.ws.recv()
+            n_bytes += len(raw)
+            n_msgs += 1
+            fmsg = ForwardMsg()
+            fmsg.ParseFromString(raw)
+            kind = fmsg.WhichOneof("type")
+            if kind == "delta" and fmsg.delta.WhichOneof("type") == "new_element":
+                element = fmsg.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type in CHOICE_WIDGETS:
+                    widget = getattr(element, element_type)
+                    key = (element_type, widget.label, sum(k[:2] == (element_type, widget.label) for k in seen))
+                    seen[key] = (widget.id, fmsg.delta.fragment_id, list(widget.options))
+            elif kind == "script_finished":
+                break
+
+        # 전체 실행이면 이번에 보인 위젯만 남기고, fragment 실행이면 그 fragment 위젯만 갱신
+        if fragment_id:
+            self.widgets.update(seen)
+        else:
+            self.widgets = seen
+            live_ids = {w[0] for w in seen.values()}
+            self.states = {i: s for i, s in self.states.items() if i in live_ids}
+
+        return {"seconds": time.perf_counter() - start, "bytes": n_bytes, "messages": n_msgs,
+                "fragment": bool(fragment_id)}
+
+    async def random_interaction(self) -> dict:
+        """
+        화면에 있는 선택형 위젯 하나를 골라 임의의 값으로 바꾸고 rerun.
+        """
+        choices = [(k, v) for k, v in self.widgets.items() if v[2]]
+        if not choices:
+            return await self.rerun()
+        (element_type, _, _), (widget_id, fragment_id, options) = self.rng.choice(choices)
+        state = WidgetState(id=widget_id)
+        setattr(state, CHOICE_WIDGETS[element_type], self.rng.choice(options))
+        self.states[widget_id] = state
+        return await self.rerun(fragment_id)
+
+
+# === 2. 서버 관리 / RSS ===
+def start_server(script: str, port: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script,
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        cwd=BASE_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError(f"streamlit 서버가 종료되었습니다 (exit {proc.returncode})")
+            time.sleep(0.3)
+    proc.terminate()
+    raise RuntimeError("streamlit 서버가 제시간에 뜨지 않았습니다.")
+
+
+def read_rss_bytes(pid: int):
+    """
+    /proc/<pid>/status 의 VmRSS (리눅스 전용). 읽을 수 없으면 None.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+# === 3. 부하 단계 ===
+def percentile(sorted_values: list, q: float):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def open_session(url: str, seed: int, errors: list):
+    """
+    접속 + 첫 화면 로드. 측정 구간에서는 빼고 미리 해 둔다.
+    """
+    session = StreamlitSession(url, random.Random(seed))
+    try:
+        await session.connect()
+        await session.rerun()
+        return session
+    except Exception as e:
+        errors.append(repr(e))
+        await session.close()
+        return None
+
+
+async def drive_session(session: StreamlitSession, stop_at: float, think: float,
+                        samples: list, errors: list):
+    try:
+        while time.monotonic() < stop_at:
+            samples.append(await session.random_interaction())
+            if think > 0:
+                await asyncio.sleep(session.rng.expovariate(1.0 / think))
+    except Exception as e:  # 세션 하나가 실패해도 단계 전체는 계속
+        errors.append(repr(e))
+    finally:
+        await session.close()
+
+
+async def run_step(url: str, n_sessions: int, duration: float, think: float, pid) -> dict:
+    samples, errors, rss = [], [], []
+    sessions = await asyncio.gather(*(open_session(url, seed, errors) for seed in range(n_sessions)))
+    sessions = [s for s in sessions if s is not None]
+    stop_at = time.monotonic() + duration
+
+    async def sample_rss():
+        while time.monotonic() < stop_at:
+            value = read_rss_bytes(pid) if pid else None
+            if value is not None:
+                rss.append(value)
+            await asyncio.sleep(0.5)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        sample_rss(),
+        *(drive_session(s, stop_at, think, samples, errors) for s in sessions),
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(s["seconds"] for s in samples)
+    return {
+        "sessions": n_sessions,
+        "interactions": len(samples),
+        "fragment_reruns": sum(s["fragment"] for s in samples),
+        "errors": len(errors),
+        "error_examples": errors[:3],
+        "throughput_per_s": len(samples) / elapsed if elapsed else 0.0,
+        "latency_p50": percentile(latencies, 0.50),
+        "latency_p95": percentile(latencies, 0.95),
+        "latency_p99": percentile(latencies, 0.99),
+        "bytes_per_rerun": (sum(s["bytes"] for s in samples) / len(samples)) if samples else None,
+        "server_rss_max": max(rss) if rss else None,
+        "server_rss_last": rss[-1] if rss else None,
+    }
+
+
+# === 4. 명령행 ===
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streamlit 앱 동시 세션 부하 테스트")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--start", metavar="SCRIPT", help="직접 띄울 스크립트 (app.py / backend.py)")
+    target.add_argument("--url", help="이미 떠 있는 서버 주소 (예: http://127.0.0.1:8501)")
+    parser.add_argument("--pid", type=int, help="--url 사용 시 RSS를 잴 서버 프로세스 PID")
+    parser.add_argument("--port", type=int, default=8599, help="--start 사용 시 포트")
+    parser.add_argument("--sessions", nargs="+", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION)
+    parser.add_argument("--think", type=float, default=DEFAULT_THINK)
+    parser.add_argument("--out", default="loadtest_results.json")
+    args = parser.parse_args(argv)
+
+    proc = None
+    if args.start:
+        proc = start_server(args.start, args.port)
+        base_url, pid = f"http://127.0.0.1:{args.port}", proc.pid
+    else:
+        base_url, pid = args.url.rstrip("/"), args.pid
+    ws_url = base_url.replace("http", "ws", 1) + "/_stcore/stream"
+
+    steps = []
+    try:
+        for n in args.sessions:
+            step = asyncio.run(run_step(ws_url, n, args.duration, args.think, pid))
+            steps.append(step)
+            rss = f"{step['server_rss_max'] / 2**20:.0f}MB" if step["server_rss_max"] else "-"
+            p50, p95, p99 = (
+                f"{step[k] * 1000:.0f}ms" if step[k] is not None else "-"
+                for k in ("latency_p50", "latency_p95", "latency_p99")
+            )
+            print(f"N={n:>4}  {step['throughput_per_s']:7.1f} rerun/s  "
+                  f"p50 {p50}  p95 {p95}  p99 {p99}  RSS {rss}  오류 {step['errors']}")
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "target": args.start or base_url,
+            "duration": args.duration,
+            "think": args.think,
+            "cpu_count": os.cpu_count(),
+        },
+        "steps": steps,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✅ {len(steps)}단계 결과 → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
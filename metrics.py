@@ -0,0 +1,194 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# === 0. 환경 변수 설정 ===
+# KEYWORD_METRICS=1                켜기 (꺼져 있으면 timer()는 아무 일도 하지 않음)
+# KEYWORD_METRICS_PORT=9464        Prometheus 텍스트 형식 /metrics 엔드포인트
+# KEYWORD_METRICS_LOG_INTERVAL=60  이 간격(초)마다 구조화된 로그 한 줄씩 출력
+ENABLED = os.environ.get("KEYWORD_METRICS", "").lower() in ("1", "true", "yes", "on")
+EXPORTER_PORT = os.environ.get("KEYWORD_METRICS_PORT")
+LOG_INTERVAL = os.environ.get("KEYWORD_METRICS_LOG_INTERVAL")
+
+# 히스토그램 버킷 상한(초)
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+logger = logging.getLogger("keyword_metrics")
+
+_lock = threading.Lock()
+_histograms = {}  # stage → [버킷별 개수..., +Inf 개수, 합계]
+_counters = {}  # event → 횟수
+_NULL_TIMER = nullcontext()
+
+
+# === 1. 기록 ===
+class _StageTimer:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+def timer(stage: str):
+    """
+    with timer("filter_by_category"): ...  형태로 구간 시간을 히스토그램에 기록.
+    꺼져 있으면 미리 만들어 둔 nullcontext를 돌려줘서 비용이 거의 없다.
+    """
+    if not ENABLED:
+        return _NULL_TIMER
+    return _StageTimer(stage)
+
+
+def observe(stage: str, seconds: float):
+    if not ENABLED:
+        return
+    i = bisect.bisect_left(BUCKETS, seconds)
+    with _lock:
+        hist = _histograms.get(stage)
+        if hist is None:
+            hist = _histograms[stage] = [0] * (len(BUCKETS) + 1) + [0.0]
+        hist[i] += 1
+        hist[-1] += seconds
+
+
+def count(event: str, n: int = 1):
+    """
+    캐시 miss 같은 이벤트 횟수를 센다.
+    """
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[event] = _counters.get(event, 0) + n
+
+
+def snapshot() -> dict:
+    with _lock:
+        histograms = {stage: list(hist) for stage, hist in _histograms.items()}
+        counters = dict(_counters)
+    return {"histograms": histograms, "counters": counters}
+
+
+# === 2. 내보내기 ===
+def render_prometheus() -> str:
+    """
+    Prometheus 텍스트 노출 형식으로 변환.
+    """
+    snap = snapshot()
+    lines = [
+        "# HELP keyword_stage_seconds Time spent in each request stage.",
+        "# TYPE keyword_stage_seconds histogram",
+    ]
+    for stage, hist in sorted(snap["histograms"].items()):
+        cumulative = 0
+        for bound, n in zip(BUCKETS, hist):
+            cumulative += n
+            lines.append(f'keyword_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+        cumulative += hist[len(BUCKETS)]
+        lines.append(f'keyword_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {cumulative}')
+        lines.append(f'keyword_stage_seconds_sum{{stage="{stage}"}} {hist[-1]}')
+        lines.append(f'keyword_stage_seconds_count{{stage="{stage}"}} {cumulative}')
+
+    lines.append("# HELP keyword_events_total Counted events such as cache misses.")
+    lines.append("# TYPE keyword_events_total counter")
+    for event, n in sorted(snap["counters"].items()):
+        lines.append(f'keyword_events_total{{event="{event}"}} {n}')
+    return "\n".join(lines) + "\n"
+
+
+def summary_line() -> str:
+    """
+    구조화된 로그 한 줄: 구간별 호출 수 / 평균 / 대략적인 p95(버킷 상한 기준).
+    """
+    snap = snapshot()
+    stages = {}
+    for stage, hist in snap["histograms"].items():
+        n = sum(hist[:-1])
+        p95 = None
+        cumulative = 0
+        for bound, c in zip(BUCKETS + (float("inf"),), hist[:-1]):
+            cumulative += c
+            if n and cumulative >= 0.95 * n:
+                p95 = bound
+                break
+        stages[stage] = {"count": n, "mean": hist[-1] / n if n else None, "p95_le": p95}
+    return json.dumps({"metrics": stages, "events": snap["counters"]}, ensure_ascii=False)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_started = set()
+
+
+def start_exporter(port: int, host: str = "0.0.0.0") -> bool:
+    """
+    /metrics 를 서비스하는 데몬 스레드. 프로세스당 한 번만 뜬다 (Streamlit rerun에도 안전).
+    포트를 열지 못하면 로그만 남기고 False → 다음 호출(다음 rerun)에서 다시 시도한다.
+    """
+    with _lock:
+        if ("exporter", port) in _started:
+            return True
+        try:
+            server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError:
+            logger.exception("metrics exporter를 띄우지 못했습니다 (%s:%s)", host, port)
+            return False
+        # 포트를 실제로 연 뒤에만 기록한다
+        _started.add(("exporter", port))
+    threading.Thread(target=server.serve_forever, name="keyword-metrics-exporter", daemon=True).start()
+    return True
+
+
+def start_log_reporter(interval: float):
+    with _lock:
+        if "logger" in _started:
+            return
+        _started.add("logger")
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            logger.info(summary_line())
+
+    threading.Thread(target=loop, name="keyword-metrics-logger", daemon=True).start()
+
+
+def setup_from_env():
+    if not ENABLED:
+        return
+    if EXPORTER_PORT:
+        start_exporter(int(EXPORTER_PORT))
+    if LOG_INTERVAL:
+        if not logger.handlers and not logging.getLogger().handlers:
+            logging.basicConfig(level=logging.INFO)
+        logger.setLevel(logging.INFO)
+        start_log_reporter(float(LOG_INTERVAL))
+
+
+setup_from_env()
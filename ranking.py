@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from keyword_data import KeywordTable
+
+# === 0. 기본 설정 ===
+# 정렬 기준 → 화면 이름
+RANKINGS = {
+    "count": "빈도순",
+    "tfidf": "특징 단어순 (TF-IDF)",
+    "log_odds": "특징 단어순 (log-odds)",
+}
+DEFAULT_RANKING = "count"
+LOG_ODDS_PRIOR = 0.01  # 사전 분포 세기: 전체 빈도의 이 비율만큼을 가상의 관측으로 더한다
+
+
+# === 1. 점수 계산 (표 전체를 한 번에) ===
+def tfidf_scores(category_codes: np.ndarray, word_codes: np.ndarray,
+                 ratio: np.ndarray) -> np.ndarray:
+    """
+    tf = 그 직무 공고 중 단어가 나온 비율(count / total_posts)
+    idf = log((1 + 직무 수) / (1 + 단어가 나온 직무 수)) + 1
+    여러 직무에 두루 나오는 단어일수록 점수가 낮아진다.
+    """
+    n_categories = category_codes.max() + 1
+    n_words = word_codes.max() + 1
+    # 같은 (직무, 단어)가 여러 행이어도 직무 수는 한 번만 센다
+    pairs = np.unique(category_codes * n_words + word_codes)
+    doc_freq = np.bincount(pairs % n_words, minlength=n_words)
+    idf = np.log((1.0 + n_categories) / (1.0 + doc_freq)) + 1.0
+    return ratio * idf[word_codes]
+
+
+def log_odds_scores(category_codes: np.ndarray, word_codes: np.ndarray,
+                    count: np.ndarray, prior: float = LOG_ODDS_PRIOR) -> np.ndarray:
+    """
+    정보 사전 분포(informative Dirichlet prior)를 둔 가중 log-odds 비의 z 점수.
+    그 직무에서의 단어 빈도를 나머지 모든 직무와 비교하고, 빈도가 적어 불확실한 차이는 분산으로 나눠 깎는다.
+    (Monroe, Colaresi & Quinn 2008, "Fightin' Words")
+    """
+    count = count.astype(np.float64)
+    word_total = np.bincount(word_codes, weights=count)
+    category_total = np.bincount(category_codes, weights=count)
+    total = count.sum()
+
+    alpha = prior * word_total[word_codes]
+    alpha0 = prior * total
+    rest = word_total[word_codes] - count
+    category_n = category_total[category_codes]
+    rest_n = total - category_n
+
+    tiny = np.finfo(np.float64).tiny
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inside = np.log(count + alpha) - np.log(np.maximum(category_n + alpha0 - count - alpha, tiny))
+        outside = np.log(rest + alpha) - np.log(np.maximum(rest_n + alpha0 - rest - alpha, tiny))
+        variance = 1.0 / (count + alpha) + 1.0 / (rest + alpha)
+        z = (inside - outside) / np.sqrt(variance)
+    return np.nan_to_num(z, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+# === 2. 직무별 정렬 결과 ===
+@dataclass(frozen=True)
+class KeywordRanking:
+    """
+    표는 들고 있지 않고 행 위치와 점수만 갖는다 (행은 조회할 때 table.rows 에서 꺼낸다).
+    bounds[직무] = (시작, 끝) → score[시작:끝] 은 그 직무 행(table.rows 순서)의 점수,
+    order[시작:끝] 은 그 직무 안 행 번호(0부터)를 점수 내림차순으로 늘어놓은 것.
+    조회할 때는 정렬 없이 필요한 순위 구간의 행만 꺼낸다.
+    """
+
+    method: str
+    table: KeywordTable
+    score: np.ndarray
+    order: np.ndarray
+    bounds: dict
+
+    def n_keywords(self, category_value) -> int:
+        start, end = self.bounds.get(category_value, (0, 0))
+        return end - start
+
+    def top_k(self, category_value, k: int = 10, offset: int = 0) -> pd.DataFrame:
+        """
+        [offset, offset + k) 순위 구간. 컬럼은 KeywordTable.top_k 와 같고 score 가 붙는다.
+        """
+        start, end = self.bounds.get(category_value, (0, 0))
+        lo = min(start + offset, end)
+        rows = self.order[lo:min(lo + k, end)]
+        page = self.table.rows(category_value).iloc[rows].reset_index(drop=True)
+        page["rank"] = np.arange(lo - start + 1, lo - start + 1 + len(rows))
+        page["score"] = self.score[start + rows]
+        return page
+
+
+def ranking_bounds(table: KeywordTable) -> dict:
+    """
+    직무 순서대로 행 수를 이어 붙인 (시작, 끝) 구간. 표 전체 대신 직무별 행 수만 쓴다.
+    """
+    starts = np.cumsum([0] + [table.n_keywords(c) for c in table.categories])
+    return {c: (int(starts[i]), int(starts[i + 1])) for i, c in enumerate(table.categories)}
+
+
+def build_ranking(table: KeywordTable, method: str = DEFAULT_RANKING) -> KeywordRanking:
+    """
+    표 전체에 대해 점수를 한 번에 계산하고 (직무, 점수 내림차순)으로 한 번만 정렬한다.
+    method: "count"(빈도순, KeywordTable과 같은 순서), "tfidf", "log_odds"
+    """
+    if method not in RANKINGS:
+        raise ValueError(f"method는 {tuple(RANKINGS)} 중 하나여야 합니다: {method}")
+
+    df = table.df
+    category_codes = pd.Categorical(df["category"], categories=table.categories).codes.astype(np.int64)
+    word_codes = pd.Categorical(df["word"]).codes.astype(np.int64)
+    if len(word_codes):
+        word_codes[word_codes < 0] = word_codes.max() + 1  # 빈 word 는 단어 하나로 취급
+    count = df["count"].to_numpy(dtype=np.float64)
+
+    if method == "count" or not len(df):
+        score = count
+    elif method == "tfidf":
+        score = tfidf_scores(category_codes, word_codes, count / df["total_posts"].to_numpy(dtype=np.float64))
+    else:
+        score = log_odds_scores(category_codes, word_codes, count)
+
+    # 같은 점수면 빈도순 순서(원래 행 순서)를 유지
+    # table.df 는 직무 순서 → 직무 안 count순이라 직무마다 연속된 구간이고, 그 안의 위치가 곧 table.rows 행 번호
+    order = np.lexsort((np.arange(len(df)), -score, category_codes))
+    starts = np.searchsorted(category_codes[order], np.arange(len(table.categories) + 1))
+    order = (order - np.repeat(starts[:-1], np.diff(starts))).astype(np.int32)
+    bounds = {c: (int(starts[i]), int(starts[i + 1])) for i, c in enumerate(table.categories)}
+    return KeywordRanking(method=method, table=table, score=score, order=order, bounds=bounds)
@@ -0,0 +1,138 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import metrics
+from keyword_data import KeywordTable
+
+# === 0. 기본 설정 ===
+PAGE_SIZES = (25, 50, 100, 200)
+DEFAULT_PAGE_SIZE = 50
+# (직무, 검색어, 정렬 컬럼, 방향)별 행 번호를 몇 개까지 들고 있을지
+INDEX_CACHE_SIZE = 32
+
+
+# === 1. 검색 / 정렬 ===
+def contains_rows(values: pd.Series, text: str) -> np.ndarray:
+    """
+    text 를 포함하는(대소문자 무시) 행 번호. categorical 이면 행이 아니라 단어 사전만 훑는다.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        hit = np.asarray(values.cat.categories.astype(str).str.contains(text, case=False, regex=False), dtype=bool)
+        hit = np.append(hit, False)  # 코드 -1(빈 값) → 맨 끝 False
+        return np.flatnonzero(hit[values.cat.codes.to_numpy()])
+    return np.flatnonzero(values.astype(str).str.contains(text, case=False, regex=False).to_numpy(dtype=bool))
+
+
+def sort_order(values: pd.Series, descending: bool = False) -> np.ndarray:
+    """
+    값 순서대로 정렬한 행 번호 (같은 값이면 원래 순서 유지).
+    categorical 은 사전 순서가 테이블마다 다르므로(샤드는 처음 나온 순서) 사전 값을 문자열 순서로 다시 매긴다.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        labels = values.cat.categories.astype(str)
+        rank = np.empty(len(labels) + 1, dtype=np.int64)
+        rank[np.argsort(labels, kind="stable")] = np.arange(len(labels))
+        rank[-1] = len(labels)  # 코드 -1(빈 값) → 맨 뒤
+        codes = rank[values.cat.codes.to_numpy()]
+    else:
+        codes, _ = pd.factorize(values, sort=True)
+        codes = codes.astype(np.int64)
+    return np.argsort(-codes if descending else codes, kind="stable")
+
+
+# === 2. 원본 데이터 페이지 조회 ===
+class RawDataView:
+    """
+    원본 데이터 보기용 서버 쪽 페이지 조회. 브라우저에는 한 페이지만 보낸다.
+    - 직무를 고르면 그 직무 행(table.rows)만 쓴다
+    - "전체"에 검색/정렬이 없으면 페이지에 걸친 직무 행만 이어 붙이고, 있을 때만 테이블이 한 벌 들고 있는 table.df 를 쓴다
+    - 검색/정렬 결과는 행 번호 배열로만 캐시하므로, 같은 조건에서 페이지를 넘기는 비용은 전체 행 수와 상관없다
+    데이터 버전마다 하나 만들어 모든 세션이 공유하므로 읽기 전용으로만 쓴다.
+    """
+
+    def __init__(self, table: KeywordTable, cache_size: int = INDEX_CACHE_SIZE):
+        self.table = table
+        self.columns = list(table.columns)
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        # 직무 순서로 이어 붙였을 때 각 직무의 시작 행 (마지막 값 = 전체 행 수)
+        self._starts = np.cumsum([0] + [table.n_keywords(c) for c in table.categories])
+        self._index = OrderedDict()
+
+    def frame(self, category_value=None) -> pd.DataFrame:
+        if category_value is not None:
+            return self.table.rows(category_value)
+        return self.table.df
+
+    def _all_rows(self, offset: int, limit: int) -> pd.DataFrame:
+        """
+        조건 없는 "전체"의 [offset, offset + limit) 행. 페이지에 걸친 직무 행만 꺼낸다.
+        """
+        parts = []
+        i = int(np.searchsorted(self._starts, offset, side="right")) - 1
+        while limit > 0 and 0 <= i < len(self.table.categories):
+            lo = offset - int(self._starts[i])
+            part = self.table.rows(self.table.categories[i]).iloc[lo:lo + limit][self.columns]
+            parts.append(part)
+            offset += len(part)
+            limit -= len(part)
+            i += 1
+        if not parts:
+            return self.table.empty[self.columns]
+        return pd.concat(parts, ignore_index=True)
+
+    def _rows(self, frame: pd.DataFrame, key: tuple):
+        """
+        key = (직무, 검색어, 정렬 컬럼, 내림차순) → 보여 줄 행 번호. 조건이 없으면 None (원래 순서 그대로).
+        """
+        _, text, sort_by, descending = key
+        if not text and sort_by is None:
+            return None
+        with self._lock:
+            rows = self._index.get(key)
+            if rows is not None:
+                self._index.move_to_end(key)
+                return rows
+
+        with metrics.timer("raw_view_index"):
+            if sort_by is None:
+                rows = contains_rows(frame["word"], text)
+            else:
+                rows = sort_order(frame[sort_by], descending)
+                if text:
+                    keep = np.zeros(len(frame), dtype=bool)
+                    keep[contains_rows(frame["word"], text)] = True
+                    rows = rows[keep[rows]]
+        with self._lock:
+            self._index[key] = rows
+            while len(self._index) > self.cache_size:
+                self._index.popitem(last=False)
+        return rows
+
+    def count(self, category_value=None, text: str = "") -> int:
+        """
+        검색 조건에 맞는 행 수 (정렬은 행 수를 바꾸지 않는다).
+        """
+        if category_value is None and not text.strip():
+            return int(self._starts[-1])
+        frame = self.frame(category_value)
+        rows = self._rows(frame, (category_value, text.strip(), None, False))
+        return len(frame) if rows is None else len(rows)
+
+    def page(self, category_value=None, text: str = "", sort_by: str = None, descending: bool = False,
+             offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> tuple:
+        """
+        (페이지 DataFrame, 조건에 맞는 전체 행 수). 컬럼은 원본 CSV 컬럼 그대로.
+        """
+        if sort_by is not None and sort_by not in self.columns:
+            raise ValueError(f"sort_by는 {self.columns} 중 하나여야 합니다: {sort_by}")
+        if category_value is None and not text.strip() and sort_by is None:
+            return self._all_rows(offset, limit), int(self._starts[-1])
+        frame = self.frame(category_value)
+        rows = self._rows(frame, (category_value, text.strip(), sort_by, descending))
+        if rows is None:
+            return frame.iloc[offset:offset + limit][self.columns], len(frame)
+        return frame.iloc[rows[offset:offset + limit]][self.columns], len(rows)
@@ -0,0 +1,263 @@
+import argparse
+import json
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from ingest import tokenize
+from keyword_data import CSV_PATH, KeywordTable, build_category_index, load_keyword_frame
+
+# === 0. 기본 설정 ===
+DEFAULT_NEIGHBORS = 5
+DEFAULT_MATCHES = 5
+DEFAULT_MISSING = 5
+PROFILE_BATCH_ROWS = 2048  # 일괄 채점 시 한 번에 점수 행렬로 펼치는 프로필 수
+SIMILARITY_BLOCK_ROWS = 1024  # 유사도 계산 시 한 번에 펼치는 행 수 (메모리 상한)
+WEIGHTS = ("ratio", "count", "binary")
+
+
+# === 1. category × word 희소 행렬 ===
+@dataclass(frozen=True)
+class KeywordMatrix:
+    """
+    행 = 직무(table.categories 순서), 열 = 단어인 CSR 희소 행렬.
+    row_totals[i] 는 i번째 직무의 가중치 합(= 그 직무가 요구하는 역량 전체).
+    """
+
+    categories: list
+    words: list
+    category_index: dict
+    word_index: dict
+    matrix: sparse.csr_matrix
+    row_totals: np.ndarray
+
+
+def build_keyword_matrix(table: KeywordTable, weight: str = "ratio") -> KeywordMatrix:
+    """
+    KeywordTable.df 한 번의 벡터 연산으로 희소 행렬을 만든다.
+    weight: "ratio"(count/total_posts), "count", "binary"(등장 여부만)
+    """
+    if weight not in WEIGHTS:
+        raise ValueError(f"weight는 {WEIGHTS} 중 하나여야 합니다: {weight}")
+
+    df = table.df[table.df["category"].notna() & table.df["word"].notna()]
+    rows = pd.Categorical(df["category"], categories=table.categories).codes
+    word_cat = pd.Categorical(df["word"])
+    cols = word_cat.codes
+
+    count = df["count"].to_numpy(dtype=np.float32)
+    if weight == "ratio":
+        data = count / df["total_posts"].to_numpy(dtype=np.float32)
+    elif weight == "count":
+        data = count
+    else:
+        data = np.ones_like(count)
+
+    words = word_cat.categories.tolist()
+    matrix = sparse.csr_matrix(
+        (data, (rows, cols)),
+        shape=(len(table.categories), len(words)),
+        dtype=np.float32,
+    )
+    matrix.sum_duplicates()
+    return KeywordMatrix(
+        categories=list(table.categories),
+        words=words,
+        category_index={c: i for i, c in enumerate(table.categories)},
+        word_index={w: i for i, w in enumerate(words)},
+        matrix=matrix,
+        row_totals=np.asarray(matrix.sum(axis=1)).ravel(),
+    )
+
+
+def l2_normalize_rows(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).dot(matrix).tocsr()
+
+
+# === 2. 비슷한 직무 ===
+@dataclass(frozen=True)
+class SimilarCategories:
+    """
+    직무별 코사인 유사도 상위 이웃. neighbors[i], scores[i] 는 i번째 직무의 이웃(자기 자신 제외).
+    """
+
+    categories: list
+    category_index: dict
+    neighbors: np.ndarray
+    scores: np.ndarray
+
+    def similar(self, category_value, n: int = DEFAULT_NEIGHBORS) -> list:
+        i = self.category_index.get(category_value)
+        if i is None:
+            return []
+        return [
+            (self.categories[j], float(s))
+            for j, s in zip(self.neighbors[i, :n], self.scores[i, :n])
+            if j >= 0 and s > 0
+        ]
+
+
+def build_similar_categories(km: KeywordMatrix, n_neighbors: int = DEFAULT_NEIGHBORS,
+                             block_rows: int = SIMILARITY_BLOCK_ROWS) -> SimilarCategories:
+    """
+    행 정규화한 행렬 X로 X·Xᵀ(코사인 유사도)를 블록 단위로 계산하고,
+    각 행에서 argpartition으로 상위 n_neighbors개만 남긴다.
+    전체 n×n 행렬을 한꺼번에 만들지 않으므로 직무가 수천 개여도 메모리는 block_rows × n 수준.
+    """
+    n = len(km.categories)
+    keep = min(n_neighbors, max(n - 1, 0))
+    neighbors = np.full((n, keep), -1, dtype=np.int32)
+    scores = np.zeros((n, keep), dtype=np.float32)
+    if keep == 0:
+        return SimilarCategories(km.categories, km.category_index, neighbors, scores)
+
+    normed = l2_normalize_rows(km.matrix)
+    normed_t = normed.T.tocsc()
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        block = (normed[start:stop] @ normed_t).toarray()
+        block[np.arange(stop - start), np.arange(start, stop)] = -1.0  # 자기 자신 제외
+
+        top = np.argpartition(block, -keep, axis=1)[:, -keep:]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        neighbors[start:stop] = np.take_along_axis(top, order, axis=1)
+        scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+
+    return SimilarCategories(km.categories, km.category_index, neighbors, scores)
+
+
+# === 3. 보유 역량 → 직무 매칭 ===
+def profile_matrix(km: KeywordMatrix, profiles: list) -> sparse.csr_matrix:
+    """
+    보유 역량 목록들을 (프로필 × 단어) 0/1 희소 행렬로 변환.
+    프로필 하나는 역량 리스트 또는 "python, sql" 같은 구분자 문자열.
+    각 역량은 CSV의 word와 같은 규칙으로 정규화한다 ("Python" → "python").
+    사전에 없는 역량은 무시.
+    """
+    rows, cols = [], []
+    for i, skills in enumerate(profiles):
+        for word in tokenize(skills):
+            j = km.word_index.get(word)
+            if j is not None:
+                rows.append(i)
+                cols.append(j)
+    data = np.ones(len(rows), dtype=np.float32)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(profiles), len(km.words)))
+
+
+def score_profiles(km: KeywordMatrix, profiles) -> np.ndarray:
+    """
+    (프로필 × 직무) 충족률 = 보유 역량이 덮는 가중치 / 직무 전체 가중치.
+    희소 행렬 곱 한 번(W · Pᵀ)으로 모든 직무와 모든 프로필을 함께 채점한다.
+    profiles 는 역량 목록들의 리스트 또는 profile_matrix 결과.
+    """
+    if not sparse.issparse(profiles):
+        profiles = profile_matrix(km, profiles)
+    covered = (km.matrix @ profiles.T).toarray().T
+    totals = np.where(km.row_totals > 0, km.row_totals, 1.0)
+    return covered / totals
+
+
+def missing_skills(table: KeywordTable, category_value, skills, n: int = DEFAULT_MISSING,
+                   ranked_words: list = None) -> list:
+    """
+    선택한 직무의 상위 요구 역량 중 보유 역량에 없는 것(가중치 높은 순) n개.
+    ranked_words 로 그 직무의 정렬된 단어 목록을 넘기면 다시 꺼내지 않는다.
+    """
+    have = tokenize(skills)
+    if ranked_words is None:
+        ranked_words = table.top_k(category_value, n + len(have))["word"].tolist()
+    missing = [w for w in ranked_words if w not in have]
+    return missing[:n]
+
+
+def match_categories(table: KeywordTable, km: KeywordMatrix, skills,
+                     n: int = DEFAULT_MATCHES, n_missing: int = DEFAULT_MISSING) -> pd.DataFrame:
+    """
+    보유 역량 하나에 대해 충족률 상위 n개 직무와 부족한 역량을 DataFrame으로 반환.
+    컬럼: category, coverage, missing
+    """
+    scores = score_profiles(km, [skills])[0]
+    n = min(n, len(scores))
+    if n == 0:
+        return pd.DataFrame(columns=["category", "coverage", "missing"])
+    top = np.argpartition(scores, -n)[-n:]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return pd.DataFrame(
+        {
+            "category": [km.categories[i] for i in top],
+            "coverage": scores[top],
+            "missing": [missing_skills(table, km.categories[i], skills, n_missing) for i in top],
+        }
+    )
+
+
+def batch_match(table: KeywordTable, km: KeywordMatrix, profiles: list,
+                n: int = DEFAULT_MATCHES, n_missing: int = DEFAULT_MISSING,
+                batch_rows: int = PROFILE_BATCH_ROWS):
+    """
+    여러 학생의 보유 역량을 batch_rows 단위로 한꺼번에 채점하고
+    (프로필 번호, 순위, 직무, 충족률, 부족한 역량) 행을 내보낸다.
+    """
+    n = min(n, len(km.categories))
+    ranked = {}  # 직무별 정렬된 상위 단어 목록 (보유 역량 수만큼 여유를 둔다)
+    depth = n_missing + max((len(p) for p in profiles), default=0)
+    for start in range(0, len(profiles), batch_rows):
+        chunk = profiles[start:start + batch_rows]
+        scores = score_profiles(km, chunk)
+        if n == 0:
+            continue
+        top = np.argpartition(scores, -n, axis=1)[:, -n:]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        for offset, skills in enumerate(chunk):
+            for rank, (i, score) in enumerate(zip(top[offset], top_scores[offset]), start=1):
+                category = km.categories[i]
+                words = ranked.get(category)
+                if words is None:
+                    words = ranked[category] = table.top_k(category, depth)["word"].tolist()
+                yield (start + offset, rank, category, float(score),
+                       missing_skills(table, category, skills, n_missing, ranked_words=words))
+
+
+# === 4. 명령행 (코호트 일괄 리포트) ===
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="보유 역량 목록(JSONL)으로 직무 매칭 리포트 생성")
+    parser.add_argument("profiles", help='한 줄에 {"id": ..., "skills": [...]} 형식의 JSONL')
+    parser.add_argument("--out", required=True, help="출력 CSV 경로")
+    parser.add_argument("--csv", default=CSV_PATH, help="키워드 빈도 CSV")
+    parser.add_argument("--top", type=int, default=DEFAULT_MATCHES, help="프로필별 추천 직무 수")
+    parser.add_argument("--missing", type=int, default=DEFAULT_MISSING, help="직무별 부족한 역량 수")
+    args = parser.parse_args(argv)
+
+    ids, profiles = [], []
+    with open(args.profiles, encoding="utf-8-sig") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            ids.append(record.get("id", len(ids)))
+            profiles.append(record.get("skills") or [])
+
+    table = build_category_index(load_keyword_frame(args.csv))
+    km = build_keyword_matrix(table)
+    rows = [
+        (ids[p], rank, category, round(score, 4), ", ".join(missing))
+        for p, rank, category, score, missing in batch_match(
+            table, km, profiles, n=args.top, n_missing=args.missing
+        )
+    ]
+    report = pd.DataFrame(rows, columns=["id", "rank", "category", "coverage", "missing"])
+    report.to_csv(args.out, index=False, encoding="utf-8-sig")
+    print(f"✅ 프로필 {len(profiles)}개 → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass
+
+import numpy as np
+
+from keyword_data import KeywordTable
+
+# === 0. 기본 설정 ===
+KIND_ORDER = ("category", "word", "detail")  # 같은 조건이면 직무 → 요구 역량 → 세부 역량 순
+DEFAULT_LIMIT = 10
+JAMO_NGRAM = 3  # 자모 3개 ≈ 한 음절 (bigram은 자모 종류가 적어 posting이 너무 길다)
+INITIAL_NGRAM = 2
+SCAN_BLOCK = 256  # 부분 문자열 후보를 이만큼씩 꺼내서 확인 (limit개가 차면 나머지는 안 본다)
+SCAN_CHUNK = 2048  # 가장 짧은 posting을 이만큼씩 잘라 교집합을 구한다
+
+# === 1. 한글 자모 분해 ===
+# 입력 중인 글자("데잍", "ㄷㅇㅌ")도 찾을 수 있도록 음절을 호환 자모로 풀고,
+# 겹받침/겹모음도 낱자로 나눈다 ("닭" → ㄷㅏㄹㄱ, "과" → ㄱㅗㅏ).
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+
+
+def _split(jamo: str) -> str:
+    return COMPOUND_JAMO.get(jamo, jamo)
+
+
+def _build_tables():
+    jamo_table = {ord(k): v for k, v in COMPOUND_JAMO.items()}
+    initial_table = {}
+    for code in range(HANGUL_FIRST, HANGUL_LAST + 1):
+        offset = code - HANGUL_FIRST
+        cho, rest = divmod(offset, len(JUNGSEONG) * len(JONGSEONG))
+        jung, jong = divmod(rest, len(JONGSEONG))
+        jamo_table[code] = CHOSEONG[cho] + _split(JUNGSEONG[jung]) + _split(JONGSEONG[jong])
+        initial_table[code] = CHOSEONG[cho]
+    return jamo_table, initial_table
+
+
+# str.translate 한 번으로 분해 (음절 11,172자 표를 import 때 만들어 둔다)
+JAMO_TABLE, INITIAL_TABLE = _build_tables()
+
+
+def _clean(text) -> str:
+    # NFC: 맥에서 온 NFD 한글도 음절로 합친다 (NFKC는 호환 자모를 바꿔 버리므로 쓰지 않음)
+    return "".join(unicodedata.normalize("NFC", str(text)).lower().split())
+
+
+def to_jamo(text) -> str:
+    """
+    공백 제거 + 소문자 + 한글 자모 분해. (예: "데이터 분석" → "ㄷㅔㅇㅣㅌㅓㅂㅜㄴㅅㅓㄱ")
+    """
+    return _clean(text).translate(JAMO_TABLE)
+
+
+def to_initials(text) -> str:
+    """
+    한글 음절은 초성만 남긴다. (예: "데이터분석" → "ㄷㅇㅌㅂㅅ", "ux디자인" → "uxㄷㅈㅇ")
+    """
+    return _clean(text).translate(INITIAL_TABLE)
+
+
+def is_initials_query(token: str) -> bool:
+    return bool(token) and all(ch in CHOSEONG for ch in token)
+
+
+# === 2. 역색인 ===
+@dataclass(frozen=True)
+class SearchHit:
+    kind: str  # "category" / "word" / "detail"
+    text: str
+    ref: str  # detail이면 그 문장이 속한 요구 역량, 나머지는 text와 같음
+    prefix: bool
+
+
+class _GramIndex:
+    """
+    문자열 목록 하나에 대한 접두어(정렬 + bisect)와 부분 문자열(n-gram 역색인) 검색.
+    - n-gram은 글자 코드를 21비트씩 이어 붙인 uint64 하나로 표현하고, numpy로 한 번에 만든다
+    - posting 은 (gram 정렬 → 문서 번호 정렬) 배열 하나를 gram 경계로 나눠 쓴다 (gram마다 배열을 따로 두지 않음)
+    - 문서 번호가 곧 순위라서 후보는 번호 순으로 앞에서부터 보면 된다
+    - 문서 끝에 빈 글자(\0)를 n-1개 붙여서 gram을 만든다 → n보다 짧은 토큰도 "그 토큰으로 시작하는 gram"으로
+      문서 끝까지 빠짐없이 찾을 수 있다 (예: n=3 일 때 "md"는 "mdㄱ", "md\0" ...)
+    """
+
+    def __init__(self, keys: list, n: int):
+        self.keys = keys
+        self.n = n
+        order = sorted((k, i) for i, k in enumerate(keys) if k)
+        self.sorted_keys = [k for k, _ in order]
+        self.sorted_ids = np.array([i for _, i in order], dtype=np.int32)
+
+        self.n_docs = len(keys)
+        pad = "\0" * (n - 1)
+        lengths = np.fromiter((len(k) + n - 1 for k in keys), dtype=np.int64, count=len(keys))
+        doc = np.repeat(np.arange(len(keys), dtype=np.int32), lengths)
+        grams = _gram_codes(_char_codes(pad.join(keys) + pad), n)
+        valid = doc[:len(grams)] == doc[n - 1:]  # 문서 경계를 넘는 gram 제외
+        grams, doc = grams[valid], doc[:len(grams)][valid]
+
+        # 위치 순서 = 문서 번호 순서이므로 gram으로만 안정 정렬하면 문서 번호도 정렬된다
+        order = np.argsort(grams, kind="stable")
+        grams, doc = grams[order], doc[order]
+        new_gram = np.ones(len(grams), dtype=bool)
+        new_gram[1:] = grams[1:] != grams[:-1]
+        keep = new_gram.copy()
+        keep[1:] |= doc[1:] != doc[:-1]
+        grams, self.posting_docs, new_gram = grams[keep], doc[keep], new_gram[keep]
+        self.gram_starts = np.flatnonzero(new_gram)
+        self.gram_keys = grams[self.gram_starts]
+        self.gram_ends = np.r_[self.gram_starts[1:], len(grams)]
+
+    def posting(self, gram):
+        i = np.searchsorted(self.gram_keys, gram)
+        if i >= len(self.gram_keys) or self.gram_keys[i] != gram:
+            return None
+        return self.posting_docs[self.gram_starts[i]:self.gram_ends[i]]
+
+    def short_posting(self, token: str):
+        """
+        n보다 짧은 토큰을 가진 문서 번호. gram 코드는 첫 글자가 상위 비트라서 그 토큰으로 시작하는 gram들이
+        gram_keys 에서 연속 구간을 이루므로, 그 구간 posting 들의 합집합을 만든다.
+        """
+        shift = np.uint64(21 * (self.n - len(token)))
+        code = _gram_codes(_char_codes(token), len(token))[0]
+        first = np.searchsorted(self.gram_keys, code << shift)
+        last = np.searchsorted(self.gram_keys, (code + np.uint64(1)) << shift)
+        if first == last:
+            return None
+        return np.unique(self.posting_docs[self.gram_starts[first]:self.gram_ends[last - 1]])
+
+    def prefix_ids(self, prefix: str) -> np.ndarray:
+        lo = bisect_left(self.sorted_keys, prefix)
+        hi = bisect_left(self.sorted_keys, prefix + "\uffff")
+        return self.sorted_ids[lo:hi]
+
+    def substring_ids(self, tokens: list, lo: int = 0, hi: int = None):
+        """
+        토큰들의 n-gram을 모두 가진 [lo, hi) 구간 문서 후보를 번호 순으로 조금씩 내보내는 generator.
+        가장 짧은 posting을 SCAN_CHUNK개씩 잘라 나머지 posting과 교집합을 구하므로,
+        앞쪽에서 limit개가 차면 뒤는 계산하지 않는다.
+        n보다 짧은 토큰은 그 토큰으로 시작하는 gram들의 posting 합집합을 후보로 쓴다.
+        """
+        lists = []
+        for token in tokens:
+            if not token:
+                continue
+            if len(token) < self.n:
+                posting = self.short_posting(token)
+                if posting is None:
+                    return
+                lists.append(posting)
+                continue
+            for gram in np.unique(_gram_codes(_char_codes(token), self.n)):
+                posting = self.posting(gram)
+                if posting is None:
+                    return
+                lists.append(posting)
+        if not lists:
+            return
+        lists.sort(key=len)
+
+        shortest = _window(lists[0], lo, self.n_docs if hi is None else hi)
+        for start in range(0, len(shortest), SCAN_CHUNK):
+            ids = shortest[start:start + SCAN_CHUNK]
+            first, last = int(ids[0]), int(ids[-1]) + 1
+            for posting in lists[1:]:
+                part = _window(posting, first, last)
+                if not len(part):
+                    ids = part
+                    break
+                pos = np.minimum(np.searchsorted(part, ids), len(part) - 1)
+                ids = ids[part[pos] == ids]
+                if not len(ids):
+                    break
+            if len(ids):
+                yield ids
+
+
+def _window(posting: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    return posting[np.searchsorted(posting, lo):np.searchsorted(posting, hi)]
+
+
+def _char_codes(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def _gram_codes(codes: np.ndarray, n: int) -> np.ndarray:
+    """
+    위치 i에서 시작하는 n글자를 uint64 하나로 (유니코드 코드 포인트는 21비트 이하).
+    """
+    m = len(codes) - n + 1
+    if m <= 0:
+        return np.empty(0, dtype=np.uint64)
+    grams = codes[:m].astype(np.uint64)
+    for k in range(1, n):
+        grams <<= np.uint64(21)
+        grams |= codes[k:k + m]
+    return grams
+
+
+class SearchIndex:
+    """
+    직무 이름, 요구 역량(word), 세부 역량 문장을 한 번에 찾는 자동완성용 색인.
+    - 문서 번호는 (종류, 길이, 텍스트) 순으로 매겨서, 후보를 번호 순으로 보다가 limit개가 차면 멈춘다
+    - 자모 trigram 역색인으로 부분 문자열, 정렬된 키 + bisect로 접두어를 찾는다
+    - 초성만 입력하면("ㄷㅇㅌ") 직무/요구 역량의 초성 색인을 쓴다
+    데이터 버전마다 한 번 만들고 여러 세션이 읽기 전용으로 공유한다.
+    """
+
+    def __init__(self, docs):
+        unique = {(kind, text): ref for kind, text, ref in docs if text}
+        ordered = sorted(unique, key=lambda d: (KIND_ORDER.index(d[0]), len(d[1]), d[1]))
+        self.kinds = [kind for kind, _ in ordered]
+        self.texts = [text for _, text in ordered]
+        self.refs = [unique[d] for d in ordered]
+
+        # 문서 번호가 종류 순이므로 종류마다 연속된 번호 구간 [시작, 끝)을 갖는다
+        kind_codes = np.array([KIND_ORDER.index(k) for k in self.kinds], dtype=np.int8)
+        bounds = np.searchsorted(kind_codes, np.arange(len(KIND_ORDER) + 1))
+        self.kind_ranges = {k: (int(bounds[j]), int(bounds[j + 1])) for j, k in enumerate(KIND_ORDER)}
+        self.jamo = _GramIndex([to_jamo(t) for t in self.texts], JAMO_NGRAM)
+        # 초성 검색은 짧은 이름(직무, 요구 역량)에만 — 문장은 초성으로 찾으면 잡음이 많다
+        self.initials = _GramIndex([
+            to_initials(t) if kind != "detail" else "" for kind, t in zip(self.kinds, self.texts)
+        ], INITIAL_NGRAM)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def search(self, query, limit: int = DEFAULT_LIMIT, kinds=None) -> list:
+        """
+        접두어 일치를 먼저, 그다음 부분 문자열 일치를 limit개까지.
+        공백으로 나눈 토큰은 모두 들어 있어야 한다 (AND). kinds로 종류를 제한할 수 있다.
+        """
+        words = str(query).split()
+        if not words:
+            return []
+        if all(is_initials_query(_clean(w)) for w in words):
+            index, tokens = self.initials, [to_initials(w) for w in words]
+        else:
+            index, tokens = self.jamo, [to_jamo(w) for w in words]
+
+        lo, hi = 0, len(self.texts)
+        ranges = None
+        if kinds:
+            ranges = [self.kind_ranges[k] for k in kinds]
+            lo, hi = min(r[0] for r in ranges), max(r[1] for r in ranges)
+
+        def allowed(ids):
+            if ranges is None:
+                return ids
+            mask = np.zeros(len(ids), dtype=bool)
+            for start, end in ranges:
+                mask |= (ids >= start) & (ids < end)
+            return ids[mask]
+
+        # 접두어 일치: 모두 조건을 만족하므로 번호가 가장 작은 limit개만 고른다
+        ids = allowed(index.prefix_ids("".join(tokens)))
+        if len(ids) > limit:
+            ids = np.partition(ids, limit - 1)[:limit]
+        prefix_ids = np.sort(ids).tolist()
+        hits = [SearchHit(self.kinds[i], self.texts[i], self.refs[i], True) for i in prefix_ids]
+        seen = set(prefix_ids)
+
+        # 부분 문자열 일치: n-gram 후보를 번호 순으로 확인하다가 limit개가 차면 멈춘다
+        if len(hits) < limit:
+            for ids in index.substring_ids(tokens, lo, hi):
+                for start in range(0, len(ids), SCAN_BLOCK):
+                    for i in allowed(ids[start:start + SCAN_BLOCK]).tolist():
+                        key = index.keys[i]
+                        if i in seen or not all(t in key for t in tokens):
+                            continue
+                        hits.append(SearchHit(self.kinds[i], self.texts[i], self.refs[i], False))
+                        if len(hits) >= limit:
+                            return hits
+        return hits
+
+
+def build_search_index(table: KeywordTable, detail_map=None) -> SearchIndex:
+    """
+    KeywordTable의 직무 / 요구 역량 사전과 세부 역량 문장으로 색인을 만든다.
+    word 는 categorical 사전(중복 없는 값)만 훑는다.
+    """
+    docs = [("category", str(c), str(c)) for c in table.categories]
+
+    word = table.df["word"]
+    if hasattr(word, "cat"):
+        words = word.cat.categories
+    else:
+        words = word.dropna().unique()
+    docs.extend(("word", str(w), str(w)) for w in words)
+
+    if detail_map is not None:
+        for skill, details in detail_map.items():
+            docs.extend(("detail", d, skill) for d in details)
+    return SearchIndex(docs)
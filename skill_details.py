@@ -0,0 +1,257 @@
+import json
+import os
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Mapping
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from keyword_data import BASE_DIR, source_stamp
+
+# === 0. 경로/파일 설정 ===
+# 세부 역량 원본(사람이 고치는 JSON)과, 처음 조회할 때 만들어 두는 검색 인덱스(Feather)
+SOURCE_PATH = os.path.join(BASE_DIR, "skill_details.json")
+INDEX_SUFFIX = ".index.feather"
+INDEX_META_KEY = b"skill_details_index"
+INDEX_VERSION = 1
+
+# 비교할 때 무시하는 공백/구분 기호 ("Machine Learning" = "machine-learning" = "machinelearning")
+IGNORED_RE = re.compile(r"[\s\-_.·/]+")
+
+
+# === 1. 검색 키 정규화 ===
+def normalize_skill(text) -> str:
+    """
+    NFKC 정규화 + 공백/구분 기호 제거 + 영문 소문자.
+    CSV word 값(ingest.normalize_token 결과)은 그대로 같은 키가 된다.
+    (예: "Python" → "python", "UX 디자인" → "ux디자인", "Front-End" → "frontend")
+    """
+    return IGNORED_RE.sub("", unicodedata.normalize("NFKC", str(text))).lower()
+
+
+# === 2. 인덱스 만들기 ===
+def read_skill_source(path: str = SOURCE_PATH) -> list:
+    """
+    {"skills": [{"skill": 대표 이름, "aliases": [...], "details": [...]}]} 형식의 JSON 읽기.
+    """
+    with open(path, encoding="utf-8-sig") as f:
+        return json.load(f)["skills"]
+
+
+def build_index_table(skills: list) -> pa.Table:
+    """
+    한 행 = 정규화된 검색 키 하나 (대표 이름 + 별칭 + 한/영 표기).
+    key 오름차순으로 정렬해 두고 이진 탐색으로 찾는다.
+    details 는 대표 이름 행에만 넣고, 별칭 행은 target(대표 이름 행 번호)으로 가리킨다.
+    같은 키가 서로 다른 역량에 쓰이면 ValueError.
+    """
+    owners = {}  # 검색 키 → skills 번호
+    for i, record in enumerate(skills):
+        for name in [record["skill"], *record.get("aliases", ())]:
+            key = normalize_skill(name)
+            if not key:
+                continue
+            owner = owners.setdefault(key, i)
+            if owner != i:
+                raise ValueError(
+                    f"'{name}' 키가 '{skills[owner]['skill']}'와 '{record['skill']}'에 함께 쓰였습니다."
+                )
+
+    keys = sorted(owners)
+    row_of = {key: row for row, key in enumerate(keys)}
+    canonical = [normalize_skill(record["skill"]) for record in skills]
+
+    owner_ids = [owners[key] for key in keys]
+
+    # details: 평평한 문자열 배열 + 행별 오프셋 (별칭 행은 null)
+    flat, offsets, is_alias = [], [0], []
+    for key, i in zip(keys, owner_ids):
+        alias = key != canonical[i]
+        if not alias:
+            flat.extend(skills[i]["details"])
+        offsets.append(len(flat))
+        is_alias.append(alias)
+    details = pa.ListArray.from_arrays(
+        pa.array(offsets, pa.int32()), _utf8_array(flat), mask=pa.array(is_alias)
+    )
+
+    return pa.table(
+        {
+            "key": _utf8_array(keys),
+            "skill": _utf8_array([skills[i]["skill"] for i in owner_ids]),
+            "target": pa.array([row_of[canonical[i]] for i in owner_ids], pa.int32()),
+            "details": details,
+        }
+    )
+
+
+def _utf8_array(values: list) -> pa.Array:
+    # 한글 str을 그대로 넘기는 것보다 bytes로 인코딩해서 넘기는 편이 몇 배 빠르다
+    return pa.array([v.encode("utf-8") for v in values], pa.binary()).cast(pa.string())
+
+
+def index_path_for(source_path: str) -> str:
+    return os.path.splitext(source_path)[0] + INDEX_SUFFIX
+
+
+def _write_index(index_path: str, table: pa.Table, stamp: tuple):
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체. 쓰기 권한이 없으면 메모리에 만든 인덱스로 진행.
+    """
+    metadata = {INDEX_META_KEY: json.dumps({"version": INDEX_VERSION, "source": list(stamp)})}
+    table = table.replace_schema_metadata(metadata)
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, index_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _index_is_fresh(index_path: str, stamp: tuple) -> bool:
+    try:
+        with pa.memory_map(index_path) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    raw = metadata.get(INDEX_META_KEY)
+    if raw is None:
+        return False
+    meta = json.loads(raw)
+    # 원본 JSON이 없으면(인덱스만 배포한 경우) 있는 인덱스를 그대로 쓴다
+    return meta.get("version") == INDEX_VERSION and (
+        stamp == (None, None) or tuple(meta.get("source", ())) == stamp
+    )
+
+
+# === 3. 지연 로딩 저장소 ===
+class _SortedKeys:
+    """
+    Arrow 문자열 컬럼을 파이썬 리스트로 풀지 않고 bisect 하기 위한 얇은 시퀀스.
+    """
+
+    def __init__(self, column):
+        self.column = column
+
+    def __len__(self):
+        return len(self.column)
+
+    def __getitem__(self, i):
+        return self.column[i].as_py()
+
+
+class SkillDetailStore(Mapping):
+    """
+    요구 역량 → 세부 역량 목록.
+    - import 할 때는 파일을 열지 않고, 처음 조회할 때 인덱스를 memory-map으로 연다
+      (역량이 수만 개여도 import 시간은 같고, 조회한 행만 파이썬 객체로 꺼낸다)
+    - 인덱스가 없거나 원본 JSON보다 오래되었으면 그때 한 번 다시 만든다
+    - 조회 키는 normalize_skill로 정규화하고 별칭/한·영 표기까지 찾는다
+    dict처럼 DETAIL_MAP.get(요구 역량) 으로 쓴다. 순회하면 대표 이름이 나온다.
+    """
+
+    def __init__(self, source_path: str = SOURCE_PATH, index_path: str = None):
+        self.source_path = source_path
+        self.index_path = index_path or index_path_for(source_path)
+        self._lock = threading.Lock()
+        self._table = None
+        self._keys = None
+
+    def _open(self) -> pa.Table:
+        if self._table is not None:
+            return self._table
+        with self._lock:
+            if self._table is None:
+                stamp = source_stamp(self.source_path)
+                if _index_is_fresh(self.index_path, stamp):
+                    table = feather.read_table(self.index_path, memory_map=True)
+                else:
+                    table = build_index_table(read_skill_source(self.source_path))
+                    _write_index(self.index_path, table, stamp)
+                    if os.path.exists(self.index_path):
+                        table = feather.read_table(self.index_path, memory_map=True)
+                self._keys = _SortedKeys(table.column("key"))
+                self._table = table
+        return self._table
+
+    def _find_row(self, skill):
+        if skill is None:
+            return None
+        table = self._open()
+        key = normalize_skill(skill)
+        row = bisect_left(self._keys, key)
+        if row < len(self._keys) and self._keys[row] == key:
+            return table.column("target")[row].as_py()
+        return None
+
+    def resolve(self, skill):
+        """
+        별칭/표기 차이를 풀어서 대표 이름을 반환. 없으면 None.
+        """
+        row = self._find_row(skill)
+        return None if row is None else self._table.column("skill")[row].as_py()
+
+    def get(self, skill, default=None):
+        row = self._find_row(skill)
+        if row is None:
+            return default
+        return self._table.column("details")[row].as_py()
+
+    def __getitem__(self, skill):
+        details = self.get(skill)
+        if details is None:
+            raise KeyError(skill)
+        return details
+
+    def __contains__(self, skill):
+        return self._find_row(skill) is not None
+
+    def __iter__(self):
+        table = self._open()
+        has_details = table.column("details").is_valid().to_pylist()
+        for skill, canonical in zip(table.column("skill").to_pylist(), has_details):
+            if canonical:
+                yield skill
+
+    def items(self):
+        """
+        (대표 이름, 세부 역량 목록)을 한 번에 꺼낸다. 키마다 다시 찾지 않으므로 전체를 훑을 때 쓴다.
+        """
+        table = self._open()
+        for skill, details in zip(table.column("skill").to_pylist(), table.column("details").to_pylist()):
+            if details is not None:
+                yield skill, details
+
+    def __len__(self):
+        table = self._open()
+        return table.num_rows - table.column("details").null_count
+
+
+# app.py / api.py 에서 쓰는 기본 저장소 (이름은 예전 dict 그대로)
+DETAIL_MAP = SkillDetailStore()
+
+
+if __name__ == "__main__":
+    # python skill_details.py [CSV 경로] → 인덱스를 다시 만들고, CSV word 값의 조회 성공률 출력
+    import sys
+
+    from keyword_data import CSV_PATH, read_keyword_csv
+
+    skills = read_skill_source(SOURCE_PATH)
+    _write_index(DETAIL_MAP.index_path, build_index_table(skills), source_stamp(SOURCE_PATH))
+
+    words = read_keyword_csv(sys.argv[1] if len(sys.argv) > 1 else CSV_PATH)["word"]
+    words = words.dropna().astype(str).unique().tolist()
+    exact = {record["skill"] for record in skills}
+    report = {
+        "skills": len(skills),
+        "index_keys": DETAIL_MAP._open().num_rows,
+        "words": len(words),
+        "exact_hits": sum(w in exact for w in words),
+        "index_hits": sum(w in DETAIL_MAP for w in words),
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
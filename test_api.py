@@ -0,0 +1,163 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from api import KeywordAPI
+
+CSV_TEXT = """category,word,count,total_posts
+데이터 분석,python,30,100
+데이터 분석,sql,20,100
+데이터 분석,통계,10,100
+상품기획 MD,기획md,5,10
+"""
+
+DETAIL_MAP = {"python": ["pandas 데이터 처리 경험", "스크립트 자동화 경험"]}
+
+
+def call(app, path, query="", **headers):
+    """
+    WSGI 앱을 프로세스 안에서 바로 호출 → (상태, 헤더 dict, 본문 bytes)
+    """
+    environ = {
+        "REQUEST_METHOD": "GET",
+        # PEP 3333: PATH_INFO는 UTF-8 바이트를 latin-1로 풀어 둔 문자열
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": query,
+        **headers,
+    }
+    out = {}
+
+    def start_response(status, response_headers):
+        out["status"] = status
+        out["headers"] = dict(response_headers)
+
+    body = b"".join(app(environ, start_response))
+    return out["status"], out["headers"], body
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "keywords.csv"
+    path.write_text(CSV_TEXT, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def app(csv_path):
+    app = KeywordAPI(csv_path=csv_path, detail_map=DETAIL_MAP)
+    yield app
+    if app._service is not None:
+        app._service.close()
+
+
+def test_categories(app):
+    status, headers, body = call(app, "/categories")
+    assert status == "200 OK"
+    payload = json.loads(body)
+    assert [c["name"] for c in payload["categories"]] == ["데이터 분석", "상품기획 MD"]
+    assert payload["categories"][0]["total_posts"] == 100
+    assert headers["ETag"] == f'"{payload["version"]}"'
+
+
+def test_keywords_page(app):
+    status, _, body = call(app, "/categories/데이터 분석/keywords", "k=2&offset=1")
+    assert status == "200 OK"
+    payload = json.loads(body)
+    assert payload["total_keywords"] == 3
+    assert [(k["rank"], k["word"], k["count"]) for k in payload["keywords"]] == [(2, "sql", 20), (3, "통계", 10)]
+    assert payload["keywords"][0]["ratio"] == pytest.approx(0.2)
+
+
+@pytest.mark.parametrize("query", ["k=abc", "k=0", "k=100000", "offset=-1"])
+def test_keywords_bad_params(app, query):
+    status, _, body = call(app, "/categories/데이터 분석/keywords", query)
+    assert status == "400 Bad Request"
+    assert "error" in json.loads(body)
+
+
+def test_skill(app):
+    status, _, body = call(app, "/skills/python")
+    assert status == "200 OK"
+    assert json.loads(body) == {"skill": "python", "details": DETAIL_MAP["python"]}
+
+
+@pytest.mark.parametrize("path", ["/categories/없는 직무/keywords", "/skills/없는 역량", "/nothing"])
+def test_not_found(app, path):
+    status, headers, _ = call(app, path)
+    assert status == "404 Not Found"
+    assert "ETag" not in headers
+
+
+def test_metrics(app):
+    call(app, "/categories")
+    status, headers, _ = call(app, "/metrics")
+    assert status == "200 OK"
+    assert headers["Content-Type"].startswith("text/plain")
+
+
+def test_if_none_match(app):
+    _, headers, _ = call(app, "/categories")
+    status, _, body = call(app, "/categories", HTTP_IF_NONE_MATCH=headers["ETag"])
+    assert status == "304 Not Modified"
+    assert body == b""
+    # 없는 경로는 ETag가 같아도 304가 아니라 404
+    status, _, _ = call(app, "/nothing", HTTP_IF_NONE_MATCH=headers["ETag"])
+    assert status == "404 Not Found"
+
+
+def test_method_not_allowed(app):
+    status, _, _ = call(app, "/categories", REQUEST_METHOD="POST")
+    assert status == "405 Method Not Allowed"
+
+
+def test_import_does_not_load_streamlit():
+    # API 서버는 Streamlit 없이 돌아야 한다
+    code = "import sys, api; assert 'streamlit' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+def rewrite_csv(csv_path):
+    with open(csv_path, "w", encoding="utf-8") as f:
+        # 크기도 달라지게 써서 (크기, mtime) 확인만으로 바뀐 것을 알 수 있게 한다
+        f.write(CSV_TEXT.replace("데이터 분석,sql,20,100", "데이터 분석,sql,50,100\n데이터 분석,r,1,100"))
+
+
+def test_swap_during_request_does_not_cache_stale_body(app, csv_path):
+    call(app, "/categories")
+    route = app.route
+    swapped = []
+
+    def slow_route(table, path, query):
+        body = route(table, path, query)
+        if not swapped:
+            # 이 요청이 옛 테이블로 응답을 만드는 사이에 교체되고, 다른 요청이 새 버전으로 캐시를 비운다
+            swapped.append(True)
+            rewrite_csv(csv_path)
+            assert app._service.reload()
+            call(app, "/categories")
+        return body
+
+    app.route = slow_route
+    _, _, body = call(app, "/categories/데이터 분석/keywords", "k=1")
+    assert json.loads(body)["keywords"][0]["word"] == "python"  # 시작할 때의 테이블로 만든 응답
+
+    _, headers, body = call(app, "/categories/데이터 분석/keywords", "k=1")
+    assert json.loads(body)["keywords"][0]["word"] == "sql"
+    assert headers["ETag"] == f'"{app._service.version}"'
+
+
+def test_cache_invalidated_when_csv_changes(app, csv_path):
+    _, headers, body = call(app, "/categories/데이터 분석/keywords", "k=1")
+    assert json.loads(body)["keywords"][0]["word"] == "python"
+    old_etag = headers["ETag"]
+
+    rewrite_csv(csv_path)
+    assert app._service.reload()
+
+    status, headers, body = call(app, "/categories/데이터 분석/keywords", "k=1", HTTP_IF_NONE_MATCH=old_etag)
+    assert status == "200 OK"
+    assert headers["ETag"] != old_etag
+    assert json.loads(body)["keywords"][0]["word"] == "sql"
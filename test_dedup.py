@@ -0,0 +1,44 @@
+import json
+import random
+
+import pytest
+
+from dedup import find_duplicates
+
+
+def body(rng, n_words=60):
+    return " ".join("".join(rng.choice("가나다라마바사아자차카타파하") for _ in range(4)) for _ in range(n_words))
+
+
+@pytest.fixture
+def postings_path(tmp_path):
+    """
+    서로 다른 본문 40건 (키워드 태그는 모두 같음) + 그중 5건을 단어 하나만 바꿔 다시 올린 공고.
+    """
+    rng = random.Random(0)
+    records = [{"category": "데이터 분석", "keywords": "python, sql", "description": body(rng)} for _ in range(40)]
+    for original in records[:5]:
+        words = original["description"].split()
+        words[rng.randrange(len(words))] = "재등록"
+        records.append({**original, "description": " ".join(words)})
+    path = tmp_path / "postings.jsonl"
+    path.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in records), encoding="utf-8")
+    return str(path)
+
+
+def test_only_near_duplicate_bodies_are_removed(postings_path):
+    result = find_duplicates([postings_path], dedup_field="description", workers=1)
+    assert result.removed == 5
+    assert result.keep[:40].all() and not result.keep[40:].any()
+
+
+def test_short_field_is_not_compared(postings_path):
+    # 태그 필드는 모든 공고가 같지만 너무 짧아서 비교하지 않는다 (전부 하나로 묶이면 안 된다)
+    result = find_duplicates([postings_path], dedup_field="keywords", workers=1)
+    assert result.removed == 0
+    assert result.too_short == 45
+
+
+def test_dedup_field_is_required(postings_path):
+    with pytest.raises(ValueError):
+        find_duplicates([postings_path], dedup_field=None, workers=1)
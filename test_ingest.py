@@ -0,0 +1,77 @@
+import json
+import random
+
+import pandas as pd
+import pyarrow.feather as feather
+import pytest
+
+import ingest
+
+CATEGORIES = ["데이터 분석", "AI 엔지니어", "상품기획 MD"]
+WORDS = ["python", "sql", "통계", "머신러닝", "Excel", "Tableau", "AWS / GCP", "딥러닝"]
+
+
+def write_postings(path, seed, n, months):
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(n):
+            record = {
+                "category": rng.choice(CATEGORIES),
+                "keywords": ", ".join(rng.sample(WORDS, rng.randint(1, 4))),
+                "posted_at": f"2025-{rng.choice(months):02d}-15",
+            }
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return str(path)
+
+
+def outputs(directory):
+    """
+    ingest 출력 세 가지 (CSV, 전체 빈도 상태, 추세)를 행 순서와 상관없이 비교할 수 있게 정렬해서 읽는다.
+    """
+    def ordered(df, keys):
+        return df.sort_values(keys, kind="stable").reset_index(drop=True)
+
+    csv = pd.read_csv(directory / "keywords.csv", encoding="utf-8-sig")
+    state = feather.read_table(directory / "state.feather").to_pandas()
+    trends = feather.read_table(directory / "trends.feather").to_pandas()
+    return (
+        ordered(csv, ["category", "word"]),
+        ordered(state, ["category", "word"]),
+        ordered(trends, ["category", "word", "period"]),
+    )
+
+
+def run(directory, command, *inputs, extra=()):
+    ingest.main([
+        command, *inputs,
+        "--out", str(directory / "keywords.csv"),
+        "--state", str(directory / "state.feather"),
+        "--period-field", "posted_at",
+        "--trend-state", str(directory / "trend_state.feather"),
+        "--trends-out", str(directory / "trends.feather"),
+        "--workers", "1",
+        *extra,
+    ])
+
+
+@pytest.mark.parametrize("top_n", ["10", "0"])
+def test_update_matches_full_build(tmp_path, top_n):
+    first = write_postings(tmp_path / "first.jsonl", 0, 300, [1, 2, 3])
+    second = write_postings(tmp_path / "second.jsonl", 1, 200, [3, 4])
+    full_dir, incremental_dir = tmp_path / "full", tmp_path / "incremental"
+    full_dir.mkdir()
+    incremental_dir.mkdir()
+
+    run(full_dir, "build", first, second, extra=("--top-n", top_n))
+    run(incremental_dir, "build", first, extra=("--top-n", top_n))
+    run(incremental_dir, "update", second, extra=("--top-n", top_n))
+
+    for expected, actual in zip(outputs(full_dir), outputs(incremental_dir)):
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_update_without_state_is_refused(tmp_path):
+    postings = write_postings(tmp_path / "postings.jsonl", 0, 10, [1])
+    with pytest.raises(SystemExit):
+        run(tmp_path, "update", postings)
+    assert not (tmp_path / "keywords.csv").exists()
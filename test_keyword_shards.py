@@ -0,0 +1,28 @@
+import json
+import os
+
+from keyword_shards import MANIFEST_NAME, load_keyword_table, shard_dir_for
+
+CSV_TEXT = """category,word,count,total_posts
+데이터 분석,python,30,100
+데이터 분석,sql,20,100
+마케팅,sql,7,50
+마케팅,브랜딩,9,50
+"""
+
+
+def test_stale_version_directory_is_not_reused(tmp_path):
+    path = tmp_path / "keywords.csv"
+    path.write_text(CSV_TEXT, encoding="utf-8")
+    table = load_keyword_table(str(path))
+    directory = shard_dir_for(str(path))
+
+    # 예전 형식이 남긴 것처럼: 같은 데이터 버전 이름의 디렉터리(샤드만 있고 랭킹 파일 없음) + 읽을 수 없는 manifest
+    os.makedirs(os.path.join(directory, table.version))
+    with open(os.path.join(directory, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump({"format": 1}, f)
+
+    reopened = load_keyword_table(str(path))
+    for method in ("count", "tfidf", "log_odds"):
+        assert len(reopened.ranking(method).top_k("데이터 분석", 2)) == 2
+    assert reopened.similar_categories().similar("데이터 분석", 1)[0][0] == "마케팅"
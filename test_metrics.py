@@ -0,0 +1,30 @@
+import logging
+import socket
+import urllib.request
+
+import metrics
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_exporter_retries_after_bind_failure(caplog):
+    port = free_port()
+    busy = socket.socket()
+    busy.bind(("127.0.0.1", port))
+    busy.listen()
+    try:
+        with caplog.at_level(logging.ERROR, logger="keyword_metrics"):
+            assert not metrics.start_exporter(port, "127.0.0.1")
+        assert caplog.records and caplog.records[0].exc_info
+    finally:
+        busy.close()
+
+    # 실패한 포트는 기록되지 않았으므로 포트가 비면 다시 띄운다
+    assert metrics.start_exporter(port, "127.0.0.1")
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+        assert response.status == 200
+    assert metrics.start_exporter(port, "127.0.0.1")
@@ -0,0 +1,55 @@
+import pytest
+
+from keyword_data import build_category_index, load_keyword_frame
+from keyword_shards import load_keyword_table
+from raw_view import RawDataView
+
+CSV_TEXT = """category,word,count,total_posts
+데이터 분석,sql,20,100
+데이터 분석,python,30,100
+데이터 분석,통계,10,100
+마케팅,퍼포먼스,7,50
+마케팅,sql,7,50
+마케팅,브랜딩,9,50
+상품기획 MD,기획md,5,10
+상품기획 MD,erp,5,10
+"""
+
+
+@pytest.fixture
+def views(tmp_path):
+    path = tmp_path / "keywords.csv"
+    path.write_text(CSV_TEXT, encoding="utf-8")
+    sharded = load_keyword_table(str(path))
+    in_memory = build_category_index(load_keyword_frame(str(path)))
+    return RawDataView(sharded), RawDataView(in_memory)
+
+
+def _pairs(page):
+    return list(zip(page["category"].astype(str), page["word"].astype(str), page["count"].tolist()))
+
+
+@pytest.mark.parametrize("sort_by", [None, "category", "word", "count", "total_posts"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_sharded_matches_in_memory(views, sort_by, descending):
+    sharded, in_memory = views
+    a, n_a = sharded.page(None, "", sort_by, descending, 0, 100)
+    b, n_b = in_memory.page(None, "", sort_by, descending, 0, 100)
+    assert n_a == n_b == 8
+    assert _pairs(a) == _pairs(b)
+
+
+def test_word_sort_is_lexical(views):
+    sharded, _ = views
+    page, _ = sharded.page(None, "", "word", False, 0, 100)
+    words = page["word"].astype(str).tolist()
+    assert words == sorted(words)
+
+
+def test_search_and_pages(views):
+    sharded, in_memory = views
+    for view in views:
+        assert view.count(None, "SQL") == 2
+        page, n = view.page("데이터 분석", "", "count", True, 1, 1)
+        assert n == 3 and page["word"].astype(str).tolist() == ["sql"]
+    assert _pairs(sharded.page(None, "", None, False, 3, 4)[0]) == _pairs(in_memory.page(None, "", None, False, 3, 4)[0])
@@ -0,0 +1,227 @@
+import json
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from ingest import PartialCounts
+from keyword_data import BASE_DIR
+
+# === 0. 기본 설정 ===
+# 기간별 원본 빈도(증분 갱신용)와, 차트가 바로 읽는 추세 테이블
+TREND_STATE_PATH = os.path.join(BASE_DIR, "keyword_trend_counts.feather")
+TRENDS_PATH = os.path.join(BASE_DIR, "keyword_trends.feather")
+TRENDS_META_KEY = b"keyword_trends"
+TRENDS_VERSION = 1
+
+STATE_COLS = ["category", "period", "word", "count", "total_posts"]
+TREND_COLS = ["category", "word", "period", "count", "total_posts", "ratio", "rolling_ratio", "growth"]
+TREND_METRICS = {
+    "ratio": "월별 비율",
+    "rolling_ratio": "이동 평균 비율",
+    "growth": "증가율",
+}
+
+DEFAULT_WINDOW = 3  # 이동 구간(개월)
+DEFAULT_TREND_TOP_N = 100  # 직무별로 추세를 남길 단어 수 (전체 기간 빈도순, 0이면 전체)
+
+
+# === 1. 기간별 카운터 나누기 ===
+def split_periods(partial: PartialCounts) -> tuple:
+    """
+    (category, 기간) 키로 센 PartialCounts → (category 키 PartialCounts, 기간별 원본 빈도 표).
+    전체 빈도는 기간별 빈도의 합이라서 원본 공고를 한 번만 읽고 두 가지를 함께 만든다.
+    기간을 읽지 못한 공고(기간 None)는 전체 빈도에만 들어간다.
+    """
+    overall = PartialCounts()
+    rows = []
+    for (category, period), counter in partial.words.items():
+        mine = overall.words.get(category)
+        if mine is None:
+            overall.words[category] = Counter(counter)
+        else:
+            mine.update(counter)
+        if period is not None:
+            total = partial.posts[(category, period)]
+            rows.extend((category, period, word, count, total) for word, count in counter.items())
+    for (category, period), n in partial.posts.items():
+        overall.posts[category] += n
+    frame = pd.DataFrame(rows, columns=STATE_COLS)
+    return overall, frame.astype({"count": "int64", "total_posts": "int64"})
+
+
+def merge_trend_counts(state: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """
+    저장해 둔 기간별 빈도에 새 공고의 기간별 빈도를 더한다. total_posts 는 (category, 기간)마다 따로 더한다.
+    """
+    if not len(delta):
+        return state
+    keys = ["category", "period"]
+    posts = (
+        pd.concat([state.groupby(keys)["total_posts"].first(), delta.groupby(keys)["total_posts"].first()])
+        .groupby(level=keys)
+        .sum()
+    )
+    merged = (
+        pd.concat([state[keys + ["word", "count"]], delta[keys + ["word", "count"]]])
+        .groupby(keys + ["word"], sort=False, as_index=False)["count"]
+        .sum()
+    )
+    merged["total_posts"] = posts.reindex(pd.MultiIndex.from_frame(merged[keys])).to_numpy()
+    return merged[STATE_COLS]
+
+
+def load_trend_state(path: str = TREND_STATE_PATH) -> pd.DataFrame:
+    if not os.path.exists(path):
+        return pd.DataFrame({c: pd.Series(dtype="int64" if c in ("count", "total_posts") else str)
+                             for c in STATE_COLS})
+    return feather.read_table(path).to_pandas()[STATE_COLS]
+
+
+def save_trend_state(state: pd.DataFrame, path: str = TREND_STATE_PATH):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(pa.Table.from_pandas(state[STATE_COLS].reset_index(drop=True), preserve_index=False),
+                          tmp_path)
+    os.replace(tmp_path, path)
+
+
+# === 2. 추세 테이블 (수집할 때 미리 계산) ===
+def build_trends(state: pd.DataFrame, window: int = DEFAULT_WINDOW,
+                 top_n: int = DEFAULT_TREND_TOP_N) -> pd.DataFrame:
+    """
+    (category, word, period) 한 행씩, 모든 월을 빠짐없이 채운 표.
+    - ratio: 그 달 공고 중 단어가 나온 비율
+    - rolling_ratio: 최근 window 개월 합계 기준 비율
+    - growth: rolling_ratio 를 window 개월 전 값과 비교한 증가율 (이전 값이 0이거나 없으면 NaN)
+    (category, word) 마다 월 수만큼 연속된 행이라 조회할 때 다시 묶거나 정렬하지 않는다.
+    """
+    if window < 1:
+        raise ValueError(f"window는 1 이상이어야 합니다: {window}")
+    if not len(state):
+        return pd.DataFrame({c: pd.Series(dtype=float) for c in TREND_COLS})
+    # "YYYY-MM" → 0부터 세는 월 번호 (문자열을 날짜로 하나씩 바꾸지 않는다)
+    month = (state["period"].str.slice(0, 4).astype(np.int64) * 12
+             + state["period"].str.slice(5, 7).astype(np.int64) - 1).to_numpy()
+    lo, hi = int(month.min()), int(month.max())
+    months = pd.period_range(pd.Period(year=lo // 12, month=lo % 12 + 1, freq="M"), periods=hi - lo + 1, freq="M")
+    period_codes = month - lo
+
+    categories = sorted(state["category"].unique())
+    category_codes = pd.Categorical(state["category"], categories=categories).codes.astype(np.int64)
+
+    # 직무 × 월 공고 수 (공고가 없는 달은 0)
+    posts = np.zeros((len(categories), len(months)), dtype=np.int64)
+    first = ~state.duplicated(["category", "period"]).to_numpy()
+    posts[category_codes[first], period_codes[first]] = state["total_posts"].to_numpy()[first]
+
+    # 직무별로 추세를 남길 단어: 전체 기간 빈도순 상위 top_n
+    totals = state.groupby(["category", "word"], sort=False, as_index=False)["count"].sum()
+    totals = totals.sort_values(["category", "count", "word"], ascending=[True, False, True], kind="stable")
+    if top_n:
+        totals = totals.groupby("category", sort=False).head(top_n)
+    pair_index = pd.MultiIndex.from_frame(totals[["category", "word"]])
+    pair_of_row = pair_index.get_indexer(pd.MultiIndex.from_frame(state[["category", "word"]]))
+    kept = pair_of_row >= 0
+
+    counts = np.zeros((len(pair_index), len(months)), dtype=np.int64)
+    counts[pair_of_row[kept], period_codes[kept]] = state["count"].to_numpy()[kept]
+    pair_category = pd.Categorical(totals["category"], categories=categories).codes
+    pair_posts = posts[pair_category]
+
+    def rolling(values):
+        # 누적합 차이로 최근 window 개월 합계
+        csum = np.cumsum(values, axis=1)
+        out = csum.copy()
+        out[:, window:] -= csum[:, :-window]
+        return out
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(pair_posts > 0, counts / pair_posts, np.nan)
+        rolling_posts = rolling(pair_posts)
+        rolling_ratio = np.where(rolling_posts > 0, rolling(counts) / rolling_posts, np.nan)
+        growth = np.full_like(rolling_ratio, np.nan)
+        previous = rolling_ratio[:, :-window]
+        growth[:, window:] = np.where(previous > 0, rolling_ratio[:, window:] / previous - 1.0, np.nan)
+
+    n_pairs, n_months = counts.shape
+    return pd.DataFrame(
+        {
+            "category": pd.Categorical(np.repeat(totals["category"].to_numpy(), n_months), categories=categories),
+            "word": pd.Categorical(np.repeat(totals["word"].to_numpy(), n_months)),
+            "period": np.tile(months.to_timestamp().to_numpy(), n_pairs),
+            "count": counts.ravel().astype(np.int32),
+            "total_posts": pair_posts.ravel().astype(np.int32),
+            "ratio": ratio.ravel().astype(np.float32),
+            "rolling_ratio": rolling_ratio.ravel().astype(np.float32),
+            "growth": growth.ravel().astype(np.float32),
+        }
+    )
+
+
+def save_trends(trends: pd.DataFrame, path: str = TRENDS_PATH, window: int = DEFAULT_WINDOW):
+    """
+    압축하지 않은 Feather → 앱에서 memory-map으로 열어 필요한 구간만 읽는다. 임시 파일에 쓴 뒤 교체.
+    """
+    table = pa.Table.from_pandas(trends[TREND_COLS].reset_index(drop=True), preserve_index=False)
+    table = table.replace_schema_metadata(
+        {TRENDS_META_KEY: json.dumps({"version": TRENDS_VERSION, "window": window,
+                                      "months": int(trends["period"].nunique())})}
+    )
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+
+# === 3. 차트용 조회 ===
+class TrendTable:
+    """
+    build_trends 결과를 읽기 전용으로 여는 객체. (category, word) → 시작 행 번호만 들고 있고,
+    조회는 그 위치에서 월 수만큼 잘라 오기만 한다 (다시 묶거나 정렬하지 않음).
+    """
+
+    def __init__(self, path: str = TRENDS_PATH):
+        table = feather.read_table(path, memory_map=True)
+        raw = (table.schema.metadata or {}).get(TRENDS_META_KEY)
+        meta = json.loads(raw) if raw else {}
+        if meta.get("version") != TRENDS_VERSION:
+            raise ValueError(f"추세 파일 형식이 다릅니다(version={meta.get('version')}): {path}")
+        self.window = meta.get("window", DEFAULT_WINDOW)
+
+        # 행은 (category, word)마다 같은 월 목록이 반복되므로, 첫 구간에서 월 목록을 읽고
+        # 구간 시작 행에서만 (category, word)를 꺼낸다
+        n_months = meta.get("months", 0)
+        self.periods = pd.DatetimeIndex(table.column("period").slice(0, n_months).to_numpy())
+        starts = np.arange(0, table.num_rows, max(n_months, 1))
+        categories = table.column("category").take(starts).to_pylist()
+        words = table.column("word").take(starts).to_pylist()
+        self._start = {(c, w): int(s) for c, w, s in zip(categories, words, starts)}
+        self._columns = {name: table.column(name) for name in TREND_METRICS}
+
+    def series(self, category_value, words: list, metric: str = "rolling_ratio") -> pd.DataFrame:
+        """
+        index = 월, 컬럼 = 단어. 추세가 없는 단어(상위 top_n 밖)는 빠진다.
+        """
+        column = self._columns[metric]
+        n_months = len(self.periods)
+        data = {}
+        for w in words:
+            start = self._start.get((category_value, w))
+            if start is not None:
+                data[w] = column.slice(start, n_months).to_numpy(zero_copy_only=False)
+        return pd.DataFrame(data, index=self.periods)
+
+    def latest_growth(self, category_value, words: list) -> pd.Series:
+        """
+        단어별 가장 최근 달의 증가율 (큰 순서).
+        """
+        column = self._columns["growth"]
+        last = len(self.periods) - 1
+        values = {
+            w: column[self._start[(category_value, w)] + last].as_py()
+            for w in words
+            if (category_value, w) in self._start
+        }
+        return pd.Series(values, dtype=float).dropna().sort_values(ascending=False)